@@ -29,11 +29,23 @@ enum Method {
   /** X-Wing法 */
   X_WING = "X_WING",
 
+  /** ソードフィッシュ法 */
+  SWORDFISH = "SWORDFISH",
+
+  /** ジェリーフィッシュ法 */
+  JELLYFISH = "JELLYFISH",
+
+  /** シンプルカラーリング法 */
+  SIMPLE_COLORING = "SIMPLE_COLORING",
+
   /** XYチェーン法 */
   XY_CHAIN = "XY_CHAIN",
 
   /** シンプルチェーン法 */
-  SIMPLE_CHAIN = "SIMPLE_CHAIN"
+  SIMPLE_CHAIN = "SIMPLE_CHAIN",
+
+  /** 総当たり法(完全被覆) */
+  EXACT_COVER = "EXACT_COVER"
 }
 
 export default Method;
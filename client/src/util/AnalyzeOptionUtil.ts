@@ -212,7 +212,8 @@ export default class AnalyzeOptionUtil {
         "method",
         SudokuUtil.cnvMethodToText(method)
       ),
-      true,
+      // 総当たり法は利用する場合のみチェック
+      method != Method.EXACT_COVER,
       false
     );
   }
@@ -219,12 +219,24 @@ export default class SudokuUtil {
       case Method.X_WING:
         return "X-Wing法";
 
+      case Method.SWORDFISH:
+        return "ソードフィッシュ法";
+
+      case Method.JELLYFISH:
+        return "ジェリーフィッシュ法";
+
+      case Method.SIMPLE_COLORING:
+        return "シンプルカラーリング法";
+
       case Method.XY_CHAIN:
         return "XYチェーン法";
 
       case Method.SIMPLE_CHAIN:
         return "シンプルチェーン法";
 
+      case Method.EXACT_COVER:
+        return "総当たり法";
+
       default:
         throw new TypeError(`not support method ${method}`);
     }
@@ -32,8 +32,20 @@ class Method(Enum):
     # X-Wing法
     X_WING = auto()
 
+    # ソードフィッシュ法
+    SWORDFISH = auto()
+
+    # ジェリーフィッシュ法
+    JELLYFISH = auto()
+
+    # シンプルカラーリング法
+    SIMPLE_COLORING = auto()
+
     # XYチェーン法
     XY_CHAIN = auto()
 
     # シンプルチェーン法
     SIMPLE_CHAIN = auto()
+
+    # 総当たり法(完全被覆)
+    EXACT_COVER = auto()
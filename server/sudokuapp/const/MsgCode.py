@@ -43,6 +43,10 @@ class MsgCode(Enum):
     # ヒントを{min}個以上設定してください。
     NOT_ENOUGH_HINTS = auto()
 
+    # 複数解
+    # 解が複数存在するため、解析出来ません。ヒントを見直してください。
+    MULTIPLE_SOLUTIONS = auto()
+
     # 確定枡数通知
     # {cnt}個の答えが見つかりました。
     FIXED_SQU_NUM = auto()
@@ -71,6 +75,10 @@ class MsgCode(Enum):
     # 【{changedSqu}】【ロックされた候補法】{triggerSqu}のエリア内でメモ{removeMemo}が{regionPos}{region}目にしか存在しないため、{changedSqu}のメモから{removeMemo}を除外しました。
     HOW_TO_LOCKED_CANDIDATES = auto()
 
+    # ロックされた候補法(行(列) -> エリア)
+    # 【{changedSqu}】【ロックされた候補法】{regionPos}{region}目でメモ{removeMemo}が{triggerSqu}のエリア内にしか存在しないため、{changedSqu}のメモから{removeMemo}を除外しました。
+    HOW_TO_LOCKED_CANDIDATES_CLAIMING = auto()
+
     # ネイキッドペア法
     # 【{changedSqu}】【ネイキッドペア法】同一{region}、{triggerSquList}で{pairList}の組み合わせが存在するため、{changedSqu}のメモから{removeMemo}を除外しました。
     HOW_TO_NAKED_PAIR = auto()
@@ -83,6 +91,22 @@ class MsgCode(Enum):
     # 【{changedSqu}】【X-Wing法】数字{removeMemo}、{regionPos1}{region}目と{regionPos2}{region}目で{triggerSqu1}、{triggerSqu2}、{triggerSqu3}、{triggerSqu4}の組み合わせでX-Wing法が成立するため、{changedSqu}のメモから{removeMemo}を除外しました。
     HOW_TO_X_WING = auto()
 
+    # ソードフィッシュ法
+    # 【{changedSqu}】【ソードフィッシュ法】数字{removeMemo}、{regionPosList}{region}目で{triggerSquList}の組み合わせでソードフィッシュ法が成立するため、{changedSqu}のメモから{removeMemo}を除外しました。
+    HOW_TO_SWORDFISH = auto()
+
+    # ジェリーフィッシュ法
+    # 【{changedSqu}】【ジェリーフィッシュ法】数字{removeMemo}、{regionPosList}{region}目で{triggerSquList}の組み合わせでジェリーフィッシュ法が成立するため、{changedSqu}のメモから{removeMemo}を除外しました。
+    HOW_TO_JELLYFISH = auto()
+
+    # シンプルカラーリング法(カラートラップ)
+    # 【{changedSqu}】【シンプルカラーリング法】数字{removeMemo}の強リンクで繋がる枡を{colorSquList1}と{colorSquList2}の2色に塗り分けると、どちらか一方の色に{removeMemo}が入り、{changedSqu}は両方の色の枡と同じ領域にあるため、{changedSqu}のメモから{removeMemo}を除外しました。
+    HOW_TO_SIMPLE_COLORING_TRAP = auto()
+
+    # シンプルカラーリング法(カラーラップ)
+    # 【{changedSqu}】【シンプルカラーリング法】数字{removeMemo}の強リンクで繋がる枡を{colorSquList1}と{colorSquList2}の2色に塗り分けると、{colorSquList1}の色の枡が同じ領域に2つあり{removeMemo}が入らないため、{changedSqu}のメモから{removeMemo}を除外しました。
+    HOW_TO_SIMPLE_COLORING_WRAP = auto()
+
     # XYチェーン法
     # 【{changedSqu}】【XYチェーン法】{chainSquList}でXYチェーンが成立するため、共通枡の{changedSqu}のメモから{removeMemo}を除外しました。
     HOW_TO_XY_CHAIN = auto()
@@ -90,3 +114,7 @@ class MsgCode(Enum):
     # シンプルチェーン法
     # 【{changedSqu}】【シンプルチェーン法】{chainSquList}で数字{removeMemo}のシンプルチェーンが成立するため、始端と終端の交差枡の{changedSqu}のメモから{removeMemo}を除外しました。
     HOW_TO_SIMPLE_CHAIN = auto()
+
+    # 総当たり法
+    # 【{changedSqu}】【総当たり法】他の解法で値を確定出来ないため、残りの枡を総当たりで解き、値を{commitVal}で確定しました。
+    HOW_TO_EXACT_COVER = auto()
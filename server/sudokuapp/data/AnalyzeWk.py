@@ -1,13 +1,19 @@
 import dataclasses
 import os
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 
 from sudokuapp.const.Method import Method
+from sudokuapp.data.Board import Board
 from sudokuapp.data.Flame import Flame
-from sudokuapp.data.History import History
+from sudokuapp.data.History import KEYFRAME_INTERVAL, History
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
+from sudokuapp.data.MethodStat import MethodStat
 from sudokuapp.data.Msg import Msg
 from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import (CELL_UNIT_LIST, CELL_UNIT_POS_LIST,
+                                      ROW_UNIT_LIST, SQU_CNT, UNIT_LIST,
+                                      cnv_row_clm_to_idx)
+from sudokuapp.util.MemoMask import ALL_MASK, LOWEST_MEMO, MEMO_BIT, MEMO_LIST
 
 
 @dataclasses.dataclass
@@ -18,13 +24,22 @@ class AnalyzeWk():
         flame (int): 枠
         use_method_list (List[Method]): 利用メソッド
         limit_method_list (List[Method]): 制限メソッド
+        adaptive_order (bool): 前提条件を満たさない解法を省略するかどうか
         histroy_list (List[History): 解析履歴
-        all_squ_list (List[Square]): 全枡リスト
-        _all_squ_dict (Dict[str, Square]): 全枡辞書
-        row_dict (Dict[int, List]): 行辞書
-        clm_dict (Dict[int, List]): 列辞書
+        _history_board (Board): 最後に解析履歴に追加した盤面
+        all_squ_list (List[Square]): 全枡リスト(エリア順)
+        _idx_squ_list (List[Square]): 枡番号 -> 枡
         msg_list (List[Msg]): 枡に紐付かないメッセージリスト
         hint_list (List[Square]): ヒント枡
+        fixed_cnt (int): 確定枡数
+        unfixed_cnt (int): 未確定枡数
+        unit_unfixed_list (List[Set[int]]): 領域番号 -> 未確定枡(枡番号)SET
+        unit_memo_pos_list (List[List[int]]): 領域番号 -> メモ -> 領域内の位置マスク
+        change_seq (int): 変更番号
+        unit_change_seq_list (List[int]): 領域番号 -> 最後に変更された変更番号
+        memo_change_seq_list (List[int]): メモ -> 最後に変更された変更番号
+        _clean_seq_dict (Dict[Method, int]): 解法 -> 解析結果なしとなった変更番号
+        method_stat_dict (Dict[Method, MethodStat]): 解法 -> 解析統計
     """
 
     # 枠
@@ -38,26 +53,26 @@ class AnalyzeWk():
     limit_method_list: List[Method] = dataclasses.field(
         default_factory=list, init=False)
 
+    # 前提条件を満たさない解法を省略するかどうか
+    # (Falseの場合は易しい解法から順番に解析する)
+    adaptive_order: bool = dataclasses.field(default=False, init=False)
+
     # 解析履歴
     histroy_list: List[History] = dataclasses.field(
         default_factory=list, init=False)
 
-    # 全枡リスト
+    # 最後に解析履歴に追加した盤面
+    # (差分算出用)
+    _history_board: Board = dataclasses.field(
+        default=None, init=False)
+
+    # 全枡リスト(エリア順)
     all_squ_list: List[Square] = dataclasses.field(
         default_factory=list, init=False)
 
-    # 全枡辞書
-    # 行:列 -> 枡
-    _all_squ_dict: Dict[str, Square] = dataclasses.field(
-        default_factory=dict, init=False)
-
-    # 行辞書
-    row_dict: Dict[int, List[Square]] = dataclasses.field(
-        default_factory=dict, init=False)
-
-    # 列辞書
-    clm_dict: Dict[int, List[Square]] = dataclasses.field(
-        default_factory=dict, init=False)
+    # 枡番号 -> 枡
+    _idx_squ_list: List[Square] = dataclasses.field(
+        default_factory=list, init=False)
 
     # 枡に紐付かないメッセージリスト
     msg_list: List[Msg] = dataclasses.field(
@@ -67,6 +82,46 @@ class AnalyzeWk():
     hint_list: List[Square] = dataclasses.field(
         default_factory=list, init=False)
 
+    # 確定枡数
+    fixed_cnt: int = dataclasses.field(default=0, init=False)
+
+    # 未確定枡数
+    unfixed_cnt: int = dataclasses.field(default=0, init=False)
+
+    # 領域番号 -> 未確定枡(枡番号)SET
+    # (fix_valで値を確定する度に更新)
+    unit_unfixed_list: List[Set[int]] = dataclasses.field(
+        default_factory=list, init=False)
+
+    # 領域番号 -> メモ -> 領域内の位置マスク
+    # unit_memo_pos_list[領域番号][メモ]
+    # 位置NはUNIT_LIST[領域番号][N]の枡で、(1 << N)のビットで表現
+    # (remove_memo、fix_valでメモを除外する度に更新)
+    unit_memo_pos_list: List[List[int]] = dataclasses.field(
+        default_factory=list, init=False)
+
+    # 変更番号
+    # (メモの除外、値の確定の度に加算)
+    change_seq: int = dataclasses.field(default=0, init=False)
+
+    # 領域番号 -> 最後に変更された変更番号
+    unit_change_seq_list: List[int] = dataclasses.field(
+        default_factory=lambda: [0] * len(UNIT_LIST), init=False)
+
+    # メモ -> 最後に変更された変更番号
+    memo_change_seq_list: List[int] = dataclasses.field(
+        default_factory=lambda: [0] * 10, init=False)
+
+    # 解法 -> 解析結果なしとなった変更番号
+    # (この変更番号以降に変更がない領域、メモは解析しても結果なしとなる)
+    _clean_seq_dict: Dict[Method, int] = dataclasses.field(
+        default_factory=dict, init=False)
+
+    # 解法 -> 解析統計
+    # (解析(analyzeMain)で解法を利用する度に更新)
+    method_stat_dict: Dict[Method, MethodStat] = dataclasses.field(
+        default_factory=dict, init=False)
+
     def __post_init__(self) -> None:
         """コンストラクタの後に呼ばれるメソッド
         """
@@ -76,43 +131,170 @@ class AnalyzeWk():
         # 画面から来た状態を保持するため、解析履歴に投入
         start_howto: HowToAnalyze = HowToAnalyze(Method.START)
         start_howto.msg = MsgFactory.start_analyze()
-        self.histroy_list.append(
-            History(self.flame.clone(), [start_howto]))
+        self._append_history([start_howto])
+
+        self._idx_squ_list = [None] * SQU_CNT
         for area in self.flame.area_list:
             for squ in area.squ_list:
                 # 全枡リスト
                 self.all_squ_list.append(squ)
 
-                # 全枡辞書
-                self._all_squ_dict[
-                    self._create_key_for_squ_dict(squ.row, squ.clm)
-                ] = squ
+                # 枡番号 -> 枡
+                self._idx_squ_list[squ.idx] = squ
 
                 # ヒント枡
                 if squ.hint_val is not None:
                     self.hint_list.append(squ)
 
-                # 行辞書
-                if squ.row not in self.row_dict:
-                    self.row_dict[squ.row] = list()
-                self.row_dict[squ.row].append(squ)
+        # 確定枡数、未確定枡数、領域毎の未確定枡
+        board: Board = self.flame.board
+        self.unit_unfixed_list = [
+            {idx for idx in unit if not board.get_fixed_val(idx)}
+            for unit in UNIT_LIST]
+        self.unfixed_cnt = sum(
+            1 for idx in range(SQU_CNT) if not board.get_fixed_val(idx))
+        self.fixed_cnt = SQU_CNT - self.unfixed_cnt
 
-                # 列辞書
-                if squ.clm not in self.clm_dict:
-                    self.clm_dict[squ.clm] = list()
-                self.clm_dict[squ.clm].append(squ)
+        # 領域毎のメモ位置
+        self.init_unit_memo_pos()
 
-    def _create_key_for_squ_dict(self, row: int, clm: int) -> str:
-        """枡辞書のキーを生成
+    def init_unit_memo_pos(self) -> None:
+        """領域毎のメモ位置を盤面から生成
+
+        盤面のメモを直接変更した場合(解析前初期設定など)に呼び出す
+        """
+        memo_arr = self.flame.board.memo_arr
+        self.unit_memo_pos_list = list()
+        for unit in UNIT_LIST:
+            pos_list: List[int] = [0] * 10
+            for pos, idx in enumerate(unit):
+                for memo in MEMO_LIST[memo_arr[idx]]:
+                    pos_list[memo] |= 1 << pos
+            self.unit_memo_pos_list.append(pos_list)
+
+    def get_unit_memo_list(self, unit_no: int) -> List[int]:
+        """領域内に存在するメモを出現順に取得
+
+        出現順は領域内の枡の順、同一枡内はメモの昇順
 
         Args:
-            row (int): 行
-            clm (int): 列
+            unit_no (int): 領域番号
+
+        Returns:
+            List[int]: メモリスト
+        """
+        pos_list: List[int] = self.unit_memo_pos_list[unit_no]
+        return sorted(
+            [memo for memo in range(1, 10) if pos_list[memo]],
+            key=lambda memo: (LOWEST_MEMO[pos_list[memo]], memo))
+
+    def remove_memo(self, idx: int, remove_mask: int) -> None:
+        """枡のメモを除外
+
+        領域毎のメモ位置も更新する
+        (解析中のメモの除外は必ず本メソッドで行うこと)
+
+        Args:
+            idx (int): 枡番号
+            remove_mask (int): 除外するメモ(マスク)
+        """
+        memo_arr = self.flame.board.memo_arr
+        remove_mask &= memo_arr[idx]
+        if remove_mask == 0:
+            return
+        memo_arr[idx] &= ~remove_mask
+        for unit_no, pos in zip(CELL_UNIT_LIST[idx], CELL_UNIT_POS_LIST[idx]):
+            pos_list: List[int] = self.unit_memo_pos_list[unit_no]
+            pos_bit: int = 1 << pos
+            for memo in MEMO_LIST[remove_mask]:
+                pos_list[memo] &= ~pos_bit
+        self._mark_change(idx, remove_mask)
+
+    def fix_val(self, idx: int, val: int) -> None:
+        """枡の値を確定
+
+        値を設定してメモをクリアし、確定枡数、未確定枡数、領域毎の未確定枡、
+        領域毎のメモ位置を更新する
+        (解析中の値の確定は必ず本メソッドで行うこと)
+
+        Args:
+            idx (int): 枡番号
+            val (int): 値
+        """
+        board: Board = self.flame.board
+        if not board.get_fixed_val(idx):
+            self.fixed_cnt += 1
+            self.unfixed_cnt -= 1
+            for unit_no in CELL_UNIT_LIST[idx]:
+                self.unit_unfixed_list[unit_no].discard(idx)
+        board.val_arr[idx] = val
+        self.remove_memo(idx, ALL_MASK)
+        self._mark_change(idx, MEMO_BIT[val])
+
+    def _mark_change(self, idx: int, memo_mask: int) -> None:
+        """変更された領域、メモを記録
+
+        Args:
+            idx (int): 変更された枡番号
+            memo_mask (int): 変更されたメモ(マスク)
+        """
+        self.change_seq += 1
+        for unit_no in CELL_UNIT_LIST[idx]:
+            self.unit_change_seq_list[unit_no] = self.change_seq
+        for memo in MEMO_LIST[memo_mask]:
+            self.memo_change_seq_list[memo] = self.change_seq
+
+    def mark_clean(self, method: Method, change_seq: int) -> None:
+        """解法の解析結果がなかったことを記録
+
+        Args:
+            method (Method): 解法
+            change_seq (int): 解析開始時の変更番号
+        """
+        self._clean_seq_dict[method] = change_seq
+
+    def is_dirty(self, method: Method) -> bool:
+        """解法の前回解析結果なし以降に変更があるか
+
+        Args:
+            method (Method): 解法
+
+        Returns:
+            bool: 変更がある(解析が必要な)場合にTrue
+        """
+        if method not in self._clean_seq_dict:
+            return True
+        return self.change_seq > self._clean_seq_dict[method]
+
+    def is_dirty_unit(self, method: Method, unit_no: int) -> bool:
+        """解法の前回解析結果なし以降に領域に変更があるか
+
+        Args:
+            method (Method): 解法
+            unit_no (int): 領域番号
 
         Returns:
-            str: 枡辞書のキー
+            bool: 変更がある(解析が必要な)場合にTrue
         """
-        return "{}:{}".format(str(row), str(clm))
+        if method not in self._clean_seq_dict:
+            return True
+        return self.unit_change_seq_list[unit_no] >\
+            self._clean_seq_dict[method]
+
+    def is_dirty_memo(self, method: Method, memo: int) -> bool:
+        """解法の前回解析結果なし以降にメモに変更があるか
+
+        Args:
+            method (Method): 解法
+            memo (int): メモ
+
+        Returns:
+            bool: 変更がある(解析が必要な)場合にTrue
+        """
+        if method not in self._clean_seq_dict:
+            return True
+        return self.memo_change_seq_list[memo] >\
+            self._clean_seq_dict[method]
 
     def get_squ(self, row: int, clm: int) -> Square:
         """行と列から枡を取得
@@ -124,8 +306,29 @@ class AnalyzeWk():
         Returns:
             Square: 枡
         """
-        return self._all_squ_dict[
-            self._create_key_for_squ_dict(row, clm)]
+        return self._idx_squ_list[cnv_row_clm_to_idx(row, clm)]
+
+    def get_squ_by_idx(self, idx: int) -> Square:
+        """枡番号から枡を取得
+
+        Args:
+            idx (int): 枡番号
+
+        Returns:
+            Square: 枡
+        """
+        return self._idx_squ_list[idx]
+
+    def get_squ_list_by_idx(self, idx_list: Iterable[int]) -> List[Square]:
+        """枡番号リストから枡リストを取得
+
+        Args:
+            idx_list (Iterable[int]): 枡番号リスト
+
+        Returns:
+            List[Square]: 枡リスト
+        """
+        return [self._idx_squ_list[idx] for idx in idx_list]
 
     def addHistry(self, how_anlz_list: List[HowToAnalyze]) -> None:
         """枠をヒストリーに追加
@@ -133,8 +336,7 @@ class AnalyzeWk():
         Args:
             how_anlz_list (List[HowToAnalyze]): 解析方法
         """
-        self.histroy_list.append(
-            History(self.flame.clone(), how_anlz_list))
+        self._append_history(how_anlz_list)
 
     def addHistryForErr(self, how_anlz_list_err: List[HowToAnalyze]) -> None:
         """枠をヒストリーに追加
@@ -154,8 +356,64 @@ class AnalyzeWk():
         how_to_list.append(how_to_title)
         how_to_list.extend(how_anlz_list_err)
 
-        self.histroy_list.append(
-            History(self.flame.clone(), how_to_list))
+        self._append_history(how_to_list)
+
+    def _append_history(self, how_anlz_list: List[HowToAnalyze]) -> None:
+        """現在の盤面を解析履歴に追加
+
+        KEYFRAME_INTERVAL毎に盤面全体(キーフレーム)を保持し、
+        それ以外は直前の履歴から変更された枡のみ保持する
+
+        Args:
+            how_anlz_list (List[HowToAnalyze]): 解析方法
+        """
+        board: Board = self.flame.board
+        history: History
+        if len(self.histroy_list) % KEYFRAME_INTERVAL == 0:
+            history = History(how_anlz_list, keyframe=board.clone())
+            self._history_board = board.clone()
+        else:
+            change_list = History.diff_board(self._history_board, board)
+            History.apply_change(self._history_board, change_list)
+            history = History(how_anlz_list, change_list=change_list)
+        self.histroy_list.append(history)
+
+    def get_history_flame(self, step: int) -> Flame:
+        """解析履歴の枠を復元
+
+        直前のキーフレームに変更を適用して復元する
+
+        Args:
+            step (int): 解析履歴の添字
+
+        Returns:
+            Flame: 枠
+        """
+        key_step: int = step
+        while self.histroy_list[key_step].keyframe is None:
+            key_step -= 1
+
+        board: Board = self.histroy_list[key_step].keyframe.clone()
+        for history in self.histroy_list[key_step + 1:step + 1]:
+            History.apply_change(board, history.change_list)
+        return Flame(board)
+
+    def iter_history_flame(self) -> Iterator[Tuple[History, Flame]]:
+        """解析履歴と枠を先頭から順に取得
+
+        1つの盤面に変更を順次適用するため、
+        返却した枠は次の要素を取得するまでの間のみ有効
+
+        Yields:
+            Tuple[History, Flame]: 解析履歴, 枠
+        """
+        board: Board = None
+        for history in self.histroy_list:
+            if history.keyframe is not None:
+                board = history.keyframe.clone()
+            else:
+                History.apply_change(board, history.change_list)
+            yield history, Flame(board)
 
     def print_flame_attention(self, attention_num: int) -> None:
         """ある数字に注目した枠の文字列をprintする
@@ -176,7 +434,8 @@ class AnalyzeWk():
         """
         # TODO: 環境変数などを参照して開発時にしか出力しないようにする制御を入れる
         flame_str_list: List[str] = list()
-        for loop_idx, squ_list in enumerate(self.row_dict.values()):
+        for loop_idx, row_unit in enumerate(ROW_UNIT_LIST):
+            squ_list: List[Square] = self.get_squ_list_by_idx(row_unit)
             if loop_idx % 3 == 0:
                 flame_str_list.append(
                     "+[{}]-------------------------+[{}]-------------------------+[{}]-------------------------+"
@@ -204,7 +463,7 @@ class AnalyzeWk():
                     row_str += "val={}".format(squ.val).ljust(8)
                 elif squ.hint_val == attention_num:
                     row_str += "hint={}".format(squ.hint_val).ljust(8)
-                elif attention_num in squ.memo_val_list:
+                elif squ.memo_mask & MEMO_BIT[attention_num]:
                     row_str += "m=[{},?]".format(attention_num).ljust(8)
                 else:
                     row_str += "?".ljust(8)
@@ -1,48 +1,37 @@
-import dataclasses
 import os
 from typing import Dict, List
 
+from sudokuapp.data.Board import Board
 from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import AREA_SQU_IDX
 
 
-@dataclasses.dataclass
 class Area():
     """エリア
 
+    盤面(Board)の1エリアを参照するビュー
+
     Attributes:
         area_id (int): エリアID
         squ_list (List[Square]): 枡リスト
     """
 
-    # エリアID
-    area_id: int
-
-    # 枡リスト
-    squ_list: List[Square] = dataclasses.field(
-        default_factory=list, init=False)
+    __slots__ = ("area_id", "squ_list")
 
-    def __init__(self, area_id: int) -> None:
+    def __init__(self, board: Board, area_id: int) -> None:
         """コンストラクタ
 
         Args:
+            board (Board): 盤面
             area_id (int): エリアID
         """
 
         # エリアID
         self.area_id: int = area_id
         # 枡リスト
-        self.squ_list: List[Square] = list()
-
-    def clone(self):
-        """クローン
-
-        Returns:
-            Area: クローンしたエリア
-        """
-        clone: Area = Area(self.area_id)
-        for squ in self.squ_list:
-            clone.squ_list.append(squ.clone())
-        return clone
+        self.squ_list: List[Square] = [
+            Square(board, AREA_SQU_IDX[area_id][squ_id])
+            for squ_id in range(1, 10)]
 
     def cnv_json_dict(self) -> Dict[str, any]:
         """JSON用DICTに変換
@@ -0,0 +1,32 @@
+import dataclasses
+from typing import List
+
+from sudokuapp.const.Method import Method
+
+
+@dataclasses.dataclass
+class BatchResult():
+    """一括解析結果
+
+    Attributes:
+        val_list (List[int]): 枡番号 -> 確定値(未確定は0)
+        solved (bool): 全ての枡が確定したかどうか
+        error (bool): 矛盾が見つかったかどうか
+        fallback (bool): 1問ずつの解析(analyzeMain)で解析したかどうか
+        method_list (List[Method]): 1問ずつの解析で利用した解法(初めて利用した順)
+    """
+
+    # 枡番号 -> 確定値(未確定は0)
+    val_list: List[int]
+
+    # 全ての枡が確定したかどうか
+    solved: bool = False
+
+    # 矛盾が見つかったかどうか
+    error: bool = False
+
+    # 1問ずつの解析(analyzeMain)で解析したかどうか
+    fallback: bool = False
+
+    # 1問ずつの解析で利用した解法(初めて利用した順)
+    method_list: List[Method] = dataclasses.field(default_factory=list)
@@ -0,0 +1,81 @@
+import dataclasses
+from array import array
+from typing import Dict, List
+
+from sudokuapp.data.Msg import Msg
+from sudokuapp.util.CellIndex import SQU_CNT
+
+
+def _create_byte_arr() -> array:
+    """81枡分の0埋め配列(符号なし1バイト)を生成
+
+    Returns:
+        array: 配列
+    """
+    return array("B", bytes(SQU_CNT))
+
+
+def _create_mask_arr() -> array:
+    """81枡分の0埋め配列(符号なし2バイト)を生成
+
+    Returns:
+        array: 配列
+    """
+    return array("H", bytes(SQU_CNT * 2))
+
+
+@dataclasses.dataclass
+class Board():
+    """盤面
+
+    81枡を枡番号(0～80)で引くフラットな配列で保持する
+    Flame、Area、Squareは本クラスのビュー
+
+    Attributes:
+        hint_arr (array): ヒント(未設定は0)
+        val_arr (array): 値(未設定は0)
+        memo_arr (array): メモ値(マスク)
+        error_dict (Dict[int, List[Msg]]): 枡番号 -> エラーメッセージリスト
+    """
+
+    # ヒント(未設定は0)
+    hint_arr: array = dataclasses.field(
+        default_factory=_create_byte_arr, init=False)
+
+    # 値(未設定は0)
+    val_arr: array = dataclasses.field(
+        default_factory=_create_byte_arr, init=False)
+
+    # メモ値(マスク)
+    memo_arr: array = dataclasses.field(
+        default_factory=_create_mask_arr, init=False)
+
+    # 枡番号 -> エラーメッセージリスト
+    # (エラーがある枡のみ保持)
+    error_dict: Dict[int, List[Msg]] = dataclasses.field(
+        default_factory=dict, init=False)
+
+    def get_fixed_val(self, idx: int) -> int:
+        """確定値(ヒントまたは値)の取得
+
+        Args:
+            idx (int): 枡番号
+
+        Returns:
+            int: ヒントまたは値(未確定の場合は0)
+        """
+        return self.hint_arr[idx] or self.val_arr[idx]
+
+    def clone(self):
+        """クローン
+
+        Returns:
+            Board: クローンした盤面
+        """
+        clone: Board = Board()
+        clone.hint_arr = array("B", self.hint_arr)
+        clone.val_arr = array("B", self.val_arr)
+        clone.memo_arr = array("H", self.memo_arr)
+        for idx, error_list in self.error_dict.items():
+            clone.error_dict[idx] = list(error_list)
+        return clone
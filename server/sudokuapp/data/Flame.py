@@ -1,32 +1,58 @@
-import dataclasses
 import os
 from typing import Dict, List
 
 from sudokuapp.data.Area import Area
+from sudokuapp.data.Board import Board
 
 
-@dataclasses.dataclass
 class Flame():
     """枠
 
+    盤面(Board)を保持し、エリア、枡のビューを提供する
+    エリア、枡のビューは参照時に生成する
+
     Attributes:
-        area_list (List[Area]): 枡リスト
+        board (Board): 盤面
+        area_list (List[Area]): エリアリスト
     """
 
-    area_list: List[Area] = dataclasses.field(
-        default_factory=list, init=False)
+    __slots__ = ("board", "_area_list")
+
+    def __init__(self, board: Board = None) -> None:
+        """コンストラクタ
+
+        Args:
+            board (Board): 盤面(省略時は空の盤面)
+        """
+        # 盤面
+        self.board: Board = board if board is not None else Board()
+
+        # エリアリスト(ビュー)
+        self._area_list: List[Area] = None
+
+    @property
+    def area_list(self) -> List[Area]:
+        """エリアリスト
+
+        初回参照時にビューを生成する
+
+        Returns:
+            List[Area]: エリアリスト
+        """
+        if self._area_list is None:
+            self._area_list = [
+                Area(self.board, area_id) for area_id in range(1, 10)]
+        return self._area_list
 
     def clone(self):
         """クローン
 
+        盤面のみ複製し、ビューは生成しない
+
         Returns:
             Flame: クローンした枠
         """
-        clone: Flame = Flame()
-        for area in self.area_list:
-            clone.area_list.append(area.clone())
-
-        return clone
+        return Flame(self.board.clone())
 
     def cnv_to_json(self) -> Dict[str, any]:
         """JSON用DICTに変換
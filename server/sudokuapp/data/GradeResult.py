@@ -0,0 +1,70 @@
+import dataclasses
+from typing import Dict
+
+from sudokuapp.const.Method import Method
+
+
+@dataclasses.dataclass
+class GradeResult():
+    """難易度判定結果
+
+    Attributes:
+        puzzle (str): 問題文字列
+        result (bool): 解析結果(エラーの場合にFalse)
+        solved (bool): 全ての枡が確定したかどうか
+        unfixed_cnt (int): 未確定枡数
+        method_cnt_dict (Dict[Method, int]): 解法 -> 利用回数
+        hardest_method (Method): 利用した最も難しい解法
+        level (int): 難易度レベル
+        score (int): 難易度スコア
+        error (str): 問題文字列が不正な場合のエラー内容
+    """
+
+    # 問題文字列
+    puzzle: str
+
+    # 解析結果(エラーの場合にFalse)
+    result: bool = False
+
+    # 全ての枡が確定したかどうか
+    solved: bool = False
+
+    # 未確定枡数
+    unfixed_cnt: int = 0
+
+    # 解法 -> 利用回数
+    method_cnt_dict: Dict[Method, int] = dataclasses.field(
+        default_factory=dict)
+
+    # 利用した最も難しい解法
+    hardest_method: Method = None
+
+    # 難易度レベル
+    level: int = 0
+
+    # 難易度スコア
+    score: int = 0
+
+    # 問題文字列が不正な場合のエラー内容
+    error: str = None
+
+    def cnv_to_json(self) -> Dict[str, any]:
+        """JSON用DICTに変換
+
+        Returns:
+            Dict: JSON用DICTに変換
+        """
+        grade_dict: Dict[str, any] = dict()
+        grade_dict["puzzle"] = self.puzzle
+        grade_dict["result"] = self.result
+        grade_dict["solved"] = self.solved
+        grade_dict["unfixedCnt"] = self.unfixed_cnt
+        grade_dict["methodCnt"] = {
+            method.name: cnt for method, cnt in self.method_cnt_dict.items()}
+        if self.hardest_method is not None:
+            grade_dict["hardestMethod"] = self.hardest_method.name
+        grade_dict["level"] = self.level
+        grade_dict["score"] = self.score
+        if self.error is not None:
+            grade_dict["error"] = self.error
+        return grade_dict
@@ -1,25 +1,87 @@
 import dataclasses
 import os
-from typing import List
+from typing import List, Tuple
 
-from sudokuapp.data.Flame import Flame
+from sudokuapp.data.Board import Board
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
+from sudokuapp.data.Msg import Msg
+
+# キーフレーム間隔
+# (N履歴ごとに盤面全体を保持する)
+KEYFRAME_INTERVAL: int = 16
+
+# 枡の変更
+# (枡番号, 値, メモ値(マスク), エラーメッセージ)
+SquareChange = Tuple[int, int, int, Tuple[Msg, ...]]
 
 
 @dataclasses.dataclass
 class History():
     """解析履歴
 
+    盤面全体はキーフレームの履歴のみ保持し、
+    それ以外の履歴は直前の履歴から変更された枡のみ保持する
+
     Attributes:
-        area_list (List[Area]): 枡リスト
+        how_anlz_list (List[HowToAnalyze]): 解析方法リスト
+        keyframe (Board): キーフレーム(盤面全体、キーフレーム以外はNone)
+        change_list (List[SquareChange]): 直前の履歴から変更された枡
     """
 
-    # 枠
-    flame: Flame
-
     # 解析方法リスト
     how_anlz_list: List[HowToAnalyze]
 
+    # キーフレーム(盤面全体、キーフレーム以外はNone)
+    keyframe: Board = None
+
+    # 直前の履歴から変更された枡
+    change_list: List[SquareChange] = dataclasses.field(
+        default_factory=list)
+
+    @classmethod
+    def diff_board(cls, before: Board, after: Board) -> List[SquareChange]:
+        """2つの盤面の差分(変更された枡)を算出
+
+        Args:
+            before (Board): 変更前の盤面
+            after (Board): 変更後の盤面
+
+        Returns:
+            List[SquareChange]: 変更された枡
+        """
+        change_list: List[SquareChange] = list()
+        for idx, (before_val, after_val, before_memo, after_memo) in enumerate(
+                zip(before.val_arr, after.val_arr,
+                    before.memo_arr, after.memo_arr)):
+            before_error: List[Msg] = before.error_dict.get(idx) or []
+            after_error: List[Msg] = after.error_dict.get(idx) or []
+            if before_val == after_val and before_memo == after_memo\
+                    and before_error == after_error:
+                continue
+            change_list.append(
+                (idx, after_val, after_memo, tuple(after_error)))
+        return change_list
+
+    @classmethod
+    def apply_change(
+        cls,
+        board: Board,
+        change_list: List[SquareChange]
+    ) -> None:
+        """盤面に変更を適用
+
+        Args:
+            board (Board): 盤面
+            change_list (List[SquareChange]): 変更された枡
+        """
+        for idx, val, memo_mask, error_tuple in change_list:
+            board.val_arr[idx] = val
+            board.memo_arr[idx] = memo_mask
+            if error_tuple:
+                board.error_dict[idx] = list(error_tuple)
+            else:
+                board.error_dict.pop(idx, None)
+
     def __str__(self) -> str:
         """文字列表現
 
@@ -40,14 +102,15 @@ class History():
         """文字列表現
 
         Returns:
-            flame
+            keyframe=True change.len=N
             how_anlz_list=[
                 how_anlz
                 how_anlz
                 ...
             ]
         """
-        text: str = "{}{}".format(self.flame, os.linesep)
+        text: str = "keyframe={} change.len={}{}".format(
+            self.keyframe is not None, len(self.change_list), os.linesep)
         text += "how_anlz_list=[{}".format(os.linesep)
         for how_anlz in self.how_anlz_list:
             text += "  {}{}".format(how_anlz, os.linesep)
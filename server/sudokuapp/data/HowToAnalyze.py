@@ -1,55 +1,68 @@
-import dataclasses
 from typing import Dict, List
 
 from sudokuapp.const.Method import Method
 from sudokuapp.const.Region import Region
 from sudokuapp.data.Msg import Msg
-from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import CLM_OF, ROW_OF
 
 
-@dataclasses.dataclass
 class HowToAnalyze():
     """解析方法
 
+    解析履歴として大量に生成されるため、__slots__で属性を固定し、
+    枡は盤面(枡)を参照せずに枡番号で保持する
+
     Attributes:
         method (Method): 解法
         msg (Msg): メッセージ
         region (Region): 領域
         commit_val (int): 確定された値
         remove_memo_list (List[int]): 除外されたメモ
-        changed_squ (Square): 変更された枡
-        trigger_squ_list (List[Square]): 変更された枡のトリガーとなる枡
-        chain_squ_list (List[Square]): Chain枡リスト
+        changed_idx (int): 変更された枡の枡番号
+        trigger_idx_list (List[int]): 変更された枡のトリガーとなる枡の枡番号
+        chain_idx_list (List[int]): Chain枡の枡番号リスト
 
     """
 
-    # 解法
-    method: Method
+    __slots__ = (
+        "method",
+        "msg",
+        "region",
+        "commit_val",
+        "remove_memo_list",
+        "changed_idx",
+        "trigger_idx_list",
+        "chain_idx_list")
+
+    def __init__(self, method: Method) -> None:
+        """コンストラクタ
+
+        Args:
+            method (Method): 解法
+        """
+        # 解法
+        self.method: Method = method
 
-    # メッセージ
-    msg: Msg = dataclasses.field(default=None, init=False)
+        # メッセージ
+        self.msg: Msg = None
 
-    # 領域
-    region: Region = dataclasses.field(default=None, init=False)
+        # 領域
+        self.region: Region = None
 
-    # 確定された値
-    commit_val: int = dataclasses.field(default=None, init=False)
+        # 確定された値
+        self.commit_val: int = None
 
-    # 除外されたメモ
-    remove_memo_list: List[int] = dataclasses.field(
-        default_factory=list, init=False)
+        # 除外されたメモ
+        self.remove_memo_list: List[int] = list()
 
-    # 変更された枡
-    changed_squ: Square = dataclasses.field(
-        default=None, init=False)
+        # 変更された枡の枡番号
+        self.changed_idx: int = None
 
-    # 変更された枡のトリガーとなる枡
-    trigger_squ_list: List[Square] = dataclasses.field(
-        default_factory=list, init=False)
+        # 変更された枡のトリガーとなる枡の枡番号
+        self.trigger_idx_list: List[int] = list()
 
-    # Chain枡リスト
-    chain_squ_list: List[Square] = dataclasses.field(
-        default_factory=list, init=False)
+        # Chain枡の枡番号リスト
+        self.chain_idx_list: List[int] = list()
 
     def cnv_to_json(self) -> Dict[str, any]:
         """JSON用DICTに変換
@@ -69,26 +82,35 @@ class HowToAnalyze():
         if (len(self.remove_memo_list) > 0):
             change_dict["removeMemoList"] = self.remove_memo_list
 
-        if (self.changed_squ):
+        if (self.changed_idx is not None):
             change_dict["changedSqu"] = [
-                self.changed_squ.row, self.changed_squ.clm]
-
-        if (len(self.trigger_squ_list) > 0):
-            trigger_squ_json_list = []
-            change_dict["triggerSquList"] = trigger_squ_json_list
-            for tirigger_squ in self.trigger_squ_list:
-                trigger_squ_json_list.append(
-                    [tirigger_squ.row, tirigger_squ.clm])
-
-        if (len(self.chain_squ_list) > 0):
-            chain_squ_json_list = []
-            change_dict["chainSquList"] = chain_squ_json_list
-            for chain_squ in self.chain_squ_list:
-                chain_squ_json_list.append(
-                    [chain_squ.row, chain_squ.clm])
+                ROW_OF[self.changed_idx], CLM_OF[self.changed_idx]]
+
+        if (len(self.trigger_idx_list) > 0):
+            change_dict["triggerSquList"] = [
+                [ROW_OF[idx], CLM_OF[idx]] for idx in self.trigger_idx_list]
+
+        if (len(self.chain_idx_list) > 0):
+            change_dict["chainSquList"] = [
+                [ROW_OF[idx], CLM_OF[idx]] for idx in self.chain_idx_list]
 
         return change_dict
 
+    def __eq__(self, compare) -> bool:
+        """同じ解析方法かどうか比較
+
+        Args:
+            compare ([type]): 比較対象
+
+        Returns:
+            bool: 同じ場合にTrue
+        """
+        if type(compare) is not HowToAnalyze:
+            return False
+        return all(
+            getattr(self, name) == getattr(compare, name)
+            for name in self.__slots__)
+
     def __str__(self) -> str:
         """文字列表現
 
@@ -121,13 +143,16 @@ class HowToAnalyze():
         if (self.commit_val):
             text += " commit_val={}".format(self.commit_val)
 
-        if (self.remove_memo):
-            text += " remove_memo={}".format(self.remove_memo)
+        if (self.remove_memo_list):
+            text += " remove_memo_list={}".format(self.remove_memo_list)
 
-        if (self.changed_squ):
-            text += " changed_squ={}".format(self.changed_squ)
+        if (self.changed_idx is not None):
+            text += " changed_squ={}:{}".format(
+                ROW_OF[self.changed_idx], CLM_OF[self.changed_idx])
 
-        if (self.trigger_squ_list):
-            text += " trigger_squ_list={}".format(self.trigger_squ_list)
+        if (self.trigger_idx_list):
+            text += " trigger_squ_list=[{}]".format(", ".join(
+                "{}:{}".format(ROW_OF[idx], CLM_OF[idx])
+                for idx in self.trigger_idx_list))
 
         return text
@@ -0,0 +1,46 @@
+import dataclasses
+from typing import Dict
+
+from sudokuapp.const.Method import Method
+
+
+@dataclasses.dataclass
+class MethodStat():
+    """解法毎の解析統計
+
+    Attributes:
+        method (Method): 解法
+        call_cnt (int): 解析回数
+        hit_cnt (int): 解析結果があった回数
+        how_anlz_cnt (int): 解析方法数
+        time_sec (float): 解析時間(秒)
+    """
+
+    # 解法
+    method: Method
+
+    # 解析回数
+    call_cnt: int = 0
+
+    # 解析結果があった回数
+    hit_cnt: int = 0
+
+    # 解析方法数
+    how_anlz_cnt: int = 0
+
+    # 解析時間(秒)
+    time_sec: float = 0.0
+
+    def cnv_to_json(self) -> Dict[str, any]:
+        """JSON用DICTに変換
+
+        Returns:
+            Dict: JSON用DICTに変換
+        """
+        stat_dict: Dict[str, any] = dict()
+        stat_dict["method"] = self.method.name
+        stat_dict["callCnt"] = self.call_cnt
+        stat_dict["hitCnt"] = self.hit_cnt
+        stat_dict["howToAnalyzeCnt"] = self.how_anlz_cnt
+        stat_dict["timeMs"] = round(self.time_sec * 1000, 3)
+        return stat_dict
@@ -1,10 +1,8 @@
-import dataclasses
 from typing import Dict
 
 from sudokuapp.const.MsgType import MsgType
 
 
-@dataclasses.dataclass
 class Msg():
     """メッセージ
 
@@ -20,11 +18,20 @@ class Msg():
 
     """
 
-    # メッセージ種類
-    msg_type: MsgType
+    __slots__ = ("msg_type", "msg")
 
-    # メッセージ
-    msg: str
+    def __init__(self, msg_type: MsgType, msg: str) -> None:
+        """コンストラクタ
+
+        Args:
+            msg_type (MsgType): メッセージ種類
+            msg (str): メッセージ
+        """
+        # メッセージ種類
+        self.msg_type: MsgType = msg_type
+
+        # メッセージ
+        self.msg: str = msg
 
     def clone(self):
         """クローン
@@ -46,6 +53,19 @@ class Msg():
         msg_dict["msg"] = self.msg
         return msg_dict
 
+    def __eq__(self, compare) -> bool:
+        """同じメッセージかどうか比較
+
+        Args:
+            compare ([type]): 比較対象
+
+        Returns:
+            bool: 同じ場合にTrue
+        """
+        if type(compare) is not Msg:
+            return False
+        return self.msg_type == compare.msg_type and self.msg == compare.msg
+
     def __str__(self) -> str:
         """文字列表現
 
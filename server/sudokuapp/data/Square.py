@@ -1,80 +1,174 @@
-import dataclasses
-import math
 from typing import Dict, List
 
+from sudokuapp.data.Board import Board
 from sudokuapp.data.Msg import Msg
+from sudokuapp.util.CellIndex import AREA_OF, CLM_OF, ROW_OF, SQU_OF
+from sudokuapp.util.MemoMask import MEMO_LIST, cnv_memo_list_to_mask
 
 
-@dataclasses.dataclass
 class Square():
     """枡
 
+    盤面(Board)の1枡を参照するビュー
+    値は全て盤面の配列に保持し、本クラスは盤面と枡番号のみ保持する
+
     Attributes:
+        idx (int): 枡番号(0～80)
         area_id (int): エリアID
         squ_id (int): 枡ID
+        row (int): 行(1start)
+        clm (int): 列(1start)
         hint_val (int): ヒント
         val (int): 値
-        memo_val_list (List[int]): メモ値
+        memo_mask (int): メモ値(マスク)
+        memo_val_list (List[int]): メモ値(マスクのビュー)
         error_list (List[Msg]): エラーメッセージリスト
     """
 
-    # エリアID
-    area_id: int
+    __slots__ = ("_board", "idx")
 
-    # 枡ID
-    squ_id: int
+    def __init__(self, board: Board, idx: int) -> None:
+        """コンストラクタ
 
-    # 行(1start)
-    row: int = dataclasses.field(default=None, init=False)
+        Args:
+            board (Board): 盤面
+            idx (int): 枡番号
+        """
+        # 盤面
+        self._board: Board = board
 
-    # 列(1start)
-    clm: int = dataclasses.field(default=None, init=False)
+        # 枡番号
+        self.idx: int = idx
 
-    # ヒント
-    hint_val: int = dataclasses.field(default=None, init=False)
+    @property
+    def area_id(self) -> int:
+        """エリアID
 
-    # 値
-    val: int = dataclasses.field(default=None, init=False)
+        Returns:
+            int: エリアID
+        """
+        return AREA_OF[self.idx]
 
-    # メモ値
-    memo_val_list: List[int] = dataclasses.field(
-        default_factory=list, init=False)
+    @property
+    def squ_id(self) -> int:
+        """枡ID
 
-    # エラーメッセージリスト
-    error_list: List[Msg] = dataclasses.field(
-        default_factory=list, init=False)
+        Returns:
+            int: 枡ID
+        """
+        return SQU_OF[self.idx]
 
-    def __post_init__(self) -> None:
-        """コンストラクタの後に呼ばれるメソッド
+    @property
+    def row(self) -> int:
+        """行(1start)
+
+        Returns:
+            int: 行
         """
-        # 行(1start)
-        self.row = math.floor((self.squ_id - 1) / 3) + \
-            math.floor((self.area_id - 1) / 3) * 3 + 1
+        return ROW_OF[self.idx]
 
-        # 列(1start)
-        self.clm = ((self.squ_id - 1) % 3) + ((self.area_id - 1) % 3) * 3 + 1
+    @property
+    def clm(self) -> int:
+        """列(1start)
 
-    def get_fixed_val(self) -> int:
-        """確定値(ヒントまたは値)の取得
+        Returns:
+            int: 列
+        """
+        return CLM_OF[self.idx]
+
+    @property
+    def hint_val(self) -> int:
+        """ヒント
 
         Returns:
-            int: ヒントまたは値
+            int: ヒント(未設定の場合はNone)
+        """
+        return self._board.hint_arr[self.idx] or None
+
+    @hint_val.setter
+    def hint_val(self, hint_val: int) -> None:
+        """ヒントの設定
+
+        Args:
+            hint_val (int): ヒント
+        """
+        self._board.hint_arr[self.idx] = hint_val or 0
+
+    @property
+    def val(self) -> int:
+        """値
+
+        Returns:
+            int: 値(未設定の場合はNone)
+        """
+        return self._board.val_arr[self.idx] or None
+
+    @val.setter
+    def val(self, val: int) -> None:
+        """値の設定
+
+        Args:
+            val (int): 値
+        """
+        self._board.val_arr[self.idx] = val or 0
+
+    @property
+    def memo_mask(self) -> int:
+        """メモ値(マスク)
+
+        数字Nは(1 << (N - 1))のビットで表現
+
+        Returns:
+            int: メモ値(マスク)
+        """
+        return self._board.memo_arr[self.idx]
+
+    @memo_mask.setter
+    def memo_mask(self, memo_mask: int) -> None:
+        """メモ値(マスク)の設定
+
+        Args:
+            memo_mask (int): メモ値(マスク)
+        """
+        self._board.memo_arr[self.idx] = memo_mask
+
+    @property
+    def memo_val_list(self) -> List[int]:
+        """メモ値
+
+        JSON、メッセージ用のビュー
+        (メモの変更はmemo_maskに対して行うこと)
+
+        Returns:
+            List[int]: メモ値(昇順)
         """
-        return self.hint_val if self.hint_val else self.val
+        return list(MEMO_LIST[self._board.memo_arr[self.idx]])
 
-    def clone(self):
-        """クローン
+    @memo_val_list.setter
+    def memo_val_list(self, memo_val_list: List[int]) -> None:
+        """メモ値の設定
+
+        Args:
+            memo_val_list (List[int]): メモ値
+        """
+        self._board.memo_arr[self.idx] = cnv_memo_list_to_mask(memo_val_list)
+
+    @property
+    def error_list(self) -> List[Msg]:
+        """エラーメッセージリスト
 
         Returns:
-            Square: クローンした枡
+            List[Msg]: エラーメッセージリスト
+        """
+        return self._board.error_dict.setdefault(self.idx, list())
+
+    def get_fixed_val(self) -> int:
+        """確定値(ヒントまたは値)の取得
+
+        Returns:
+            int: ヒントまたは値
         """
-        clone: Square = Square(self.area_id, self.squ_id)
-        clone.hint_val = self.hint_val
-        clone.val = self.val
-        clone.memo_val_list = list(self.memo_val_list)
-        for error in self.error_list:
-            clone.error_list.append(error.clone())
-        return clone
+        return self._board.get_fixed_val(self.idx) or None
 
     def cnv_json_dict(self) -> Dict:
         """JSON用DICTに変換
@@ -89,12 +183,13 @@ class Square():
             squ_dict["hintVal"] = self.hint_val
         if self.val is not None:
             squ_dict["val"] = self.val
-        if len(self.memo_val_list) > 0:
+        if self.memo_mask:
             squ_dict["memoValList"] = self.memo_val_list
-        error_dict_list: List[Dict] = list()
-        if len(self.error_list) > 0:
+        error_list: List[Msg] = self._board.error_dict.get(self.idx)
+        if error_list:
+            error_dict_list: List[Dict] = list()
             squ_dict["errorList"] = error_dict_list
-            for error in self.error_list:
+            for error in error_list:
                 error_dict_list.append(error.cnv_to_json())
         return squ_dict
 
@@ -127,14 +222,15 @@ class Square():
         elif(self.val):
             text += " val={}".format(self.val)
 
-        elif (len(self.memo_val_list) > 0):
+        elif (self.memo_mask):
             text += " memo=["
-            for memo in self.memo_val_list:
+            for memo in MEMO_LIST[self.memo_mask]:
                 text += "{}".format(memo)
             text += "]"
 
-        if len(self.error_list) > 0:
-            text += " error={}".format(self.error_list)
+        error_list: List[Msg] = self._board.error_dict.get(self.idx)
+        if error_list:
+            text += " error={}".format(error_list)
         return text
 
     def __eq__(self, compare) -> bool:
@@ -148,7 +244,7 @@ class Square():
         """
         if type(compare) != Square:
             return False
-        return self.__hash__() == compare.__hash__()
+        return self.idx == compare.idx
 
     def __ne__(self, compare) -> bool:
         """違う枡かどうか比較
@@ -167,7 +263,7 @@ class Square():
         Returns:
             int: ハッシュ値
         """
-        return self.row * 100 + self.clm
+        return self.idx
 
     def __lt__(self, compare) -> bool:
         """＜
@@ -178,10 +274,8 @@ class Square():
         Returns:
             bool: ＜の場合にTrue
         """
-        if self.row == compare.row:
-            return self.clm < compare.clm
-        else:
-            return self.row < compare.row
+        # 枡番号は行優先のため、枡番号の比較で行、列の順に比較出来る
+        return self.idx < compare.idx
 
     def __le__(self, compare) -> bool:
         """＜＝
@@ -192,10 +286,7 @@ class Square():
         Returns:
             bool: ＜＝の場合にTrue
         """
-        if self.row == compare.row:
-            return self.clm <= compare.clm
-        else:
-            return self.row <= compare.row
+        return self.idx <= compare.idx
 
     def __gt__(self, compare) -> bool:
         """＞
@@ -206,10 +297,7 @@ class Square():
         Returns:
             bool: ＞の場合にTrue
         """
-        if self.row == compare.row:
-            return self.clm > compare.clm
-        else:
-            return self.row > compare.row
+        return self.idx > compare.idx
 
     def __ge__(self, compare) -> bool:
         """＞＝
@@ -220,7 +308,4 @@ class Square():
         Returns:
             bool: ＞＝の場合にTrue
         """
-        if self.row == compare.row:
-            return self.clm >= compare.clm
-        else:
-            return self.row >= compare.row
+        return self.idx >= compare.idx
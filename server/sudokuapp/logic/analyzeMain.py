@@ -1,16 +1,36 @@
-from typing import Callable, List, Tuple
+import time
+from typing import Callable, Dict, List, Tuple
 
 from sudokuapp.const.Method import Method
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.Board import Board
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
+from sudokuapp.data.MethodStat import MethodStat
 from sudokuapp.logic.method import (methodElimionationOneMemo,
                                     methodElimionationOnlyMemo,
                                     methodElimionationRemoveMemo,
-                                    methodHiddenPair, methodLockedCandidates,
-                                    methodNakedPair, methodSimpleChain,
-                                    methodXWing, methodXYChain,
-                                    simpleErrorCheck)
-from sudokuapp.util.SudokuUtil import SudokuUtil
+                                    methodExactCover, methodFish,
+                                    methodHiddenPair, methodJellyfish,
+                                    methodLockedCandidates, methodNakedPair,
+                                    methodSimpleChain, methodSimpleColoring,
+                                    methodSwordfish, methodXWing,
+                                    methodXYChain, simpleErrorCheck)
+from sudokuapp.util.CellIndex import (CLM_UNIT_NO, ROW_UNIT_NO, SQU_CNT,
+                                      UNIT_LIST)
+from sudokuapp.util.MemoMask import ALL_MASK, BIT_CNT
+
+# 消去法
+ELIMIONATION_METHOD_LIST: List[Method] = [
+    Method.ELIMIONATION,
+    Method.ELIMIONATION_ONE_MEMO,
+    Method.ELIMIONATION_ONLY_MEMO,
+]
+
+# 解析結果があった直後に再度解析しても結果なしとなる解法
+# (消去法は確定値のみからメモを除外するため、値が確定するまで結果なし)
+_IDEMPOTENT_METHOD_LIST: List[Method] = [
+    Method.ELIMIONATION,
+]
 
 
 def analyze(wk: AnalyzeWk) -> bool:
@@ -50,7 +70,7 @@ def analyze(wk: AnalyzeWk) -> bool:
 
     # 消去法only memo
     analyze_method_list.append(
-        (Method.ELIMIONATION_ONE_MEMO, methodElimionationOnlyMemo.analyze))
+        (Method.ELIMIONATION_ONLY_MEMO, methodElimionationOnlyMemo.analyze))
 
     # ロックされた候補法
     if Method.LOCKED_CANDIDATES in wk.use_method_list:
@@ -65,13 +85,29 @@ def analyze(wk: AnalyzeWk) -> bool:
     # 隠れペア法
     if Method.HIDDEN_PAIR in wk.use_method_list:
         analyze_method_list.append(
-            (Method.NAKED_PAIR, methodHiddenPair.analyze))
+            (Method.HIDDEN_PAIR, methodHiddenPair.analyze))
 
     # X-Wing
     if Method.X_WING in wk.use_method_list:
         analyze_method_list.append(
             (Method.X_WING, methodXWing.analyze))
 
+    # ソードフィッシュ法
+    if Method.SWORDFISH in wk.use_method_list:
+        analyze_method_list.append(
+            (Method.SWORDFISH, methodSwordfish.analyze))
+
+    # ジェリーフィッシュ法
+    if Method.JELLYFISH in wk.use_method_list:
+        analyze_method_list.append(
+            (Method.JELLYFISH, methodJellyfish.analyze))
+
+    # シンプルカラーリング法
+    # (シンプルチェーン法、XYチェーン法より軽量なため、先に解析する)
+    if Method.SIMPLE_COLORING in wk.use_method_list:
+        analyze_method_list.append(
+            (Method.SIMPLE_COLORING, methodSimpleColoring.analyze))
+
     # XYチェーン法
     if Method.XY_CHAIN in wk.use_method_list:
         analyze_method_list.append(
@@ -82,26 +118,66 @@ def analyze(wk: AnalyzeWk) -> bool:
         analyze_method_list.append(
             (Method.SIMPLE_CHAIN, methodSimpleChain.analyze))
 
+    # 総当たり法
+    # (他の全ての解法で解析結果なしとなった場合のみ解析するため、最後に追加)
+    if Method.EXACT_COVER in wk.use_method_list:
+        analyze_method_list.append(
+            (Method.EXACT_COVER, methodExactCover.analyze))
+
+    # 解析統計
+    for method, _ in analyze_method_list:
+        wk.method_stat_dict.setdefault(method, MethodStat(method))
+
     # 解析メインループ
     while True:
 
         # 未確定枡がなくなったら処理終了
-        if len(SudokuUtil.find_unfixed_squ_from_flame(wk.flame)) == 0:
+        if wk.unfixed_cnt == 0:
             return True
 
         how_anlz_list: List[HowToAnalyze] = list()
 
         # 解法リストループ
         for method, analyze_func in analyze_method_list:
+            # 前回解析結果なしとなってから変更がない場合は
+            # 解析しても結果なしとなるため、次の解法で解析する
+            # [補足]
+            # 各解法も前回解析結果なし以降に変更があった領域、メモのみ解析する
+            if not wk.is_dirty(method):
+                continue
+            # 前提条件を満たさない解法を省略する場合は、
+            # 盤面が前提条件を満たしていない解法も解析しても結果なしとなるため、
+            # 次の解法で解析する
+            # (解法の順番は変えないため、解析方法の説明は省略しない場合と同じ)
+            if wk.adaptive_order and not _PRECONDITION_DICT.get(
+                    method, _no_precondition)(wk):
+                continue
+            change_seq: int = wk.change_seq
+
             # 解析
-            if not analyze_func(wk, how_anlz_list):
+            start: float = time.perf_counter()
+            success: bool = analyze_func(wk, how_anlz_list)
+            elapsed: float = time.perf_counter() - start
+            stat: MethodStat = wk.method_stat_dict[method]
+            stat.time_sec += elapsed
+            stat.call_cnt += 1
+            if len(how_anlz_list) > 0:
+                stat.hit_cnt += 1
+                stat.how_anlz_cnt += len(how_anlz_list)
+
+            if not success:
                 wk.addHistryForErr(how_anlz_list)
                 return False
             # 解析結果がない場合は次の解法で解析する
             if len(how_anlz_list) == 0:
+                wk.mark_clean(method, change_seq)
                 continue
 
             wk.addHistry(how_anlz_list)
+            # 前提条件を満たさない解法を省略する場合は、
+            # 再度解析しても結果なしとなる解法も解析済みとする
+            if wk.adaptive_order and method in _IDEMPOTENT_METHOD_LIST:
+                wk.mark_clean(method, wk.change_seq)
             # エラーチェック
             how_anlz_list_err: List[HowToAnalyze] =\
                 simpleErrorCheck.errorCheck(wk)
@@ -129,7 +205,100 @@ def initBeforeAnalyze(wk: AnalyzeWk) -> None:
         wk (AnalyzeWk): ワーク
     """
     # ヒントまたは値がない枡にメモ値を設定
-    for squ in SudokuUtil.find_unfixed_squ_from_flame(wk.flame):
-        if (squ.get_fixed_val() is None):
-            if len(squ.memo_val_list) == 0:
-                squ.memo_val_list.extend([1, 2, 3, 4, 5, 6, 7, 8, 9])
+    board: Board = wk.flame.board
+    for idx in range(SQU_CNT):
+        if not board.get_fixed_val(idx) and board.memo_arr[idx] == 0:
+            board.memo_arr[idx] = ALL_MASK
+    wk.init_unit_memo_pos()
+
+
+def _no_precondition(wk: AnalyzeWk) -> bool:
+    """前提条件なし
+
+    Args:
+        wk (AnalyzeWk): ワーク
+
+    Returns:
+        bool: 常にTrue
+    """
+    return True
+
+
+def _has_fish_base(wk: AnalyzeWk, size: int) -> bool:
+    """フィッシュ(X-Wing、ソードフィッシュ、ジェリーフィッシュ)の前提条件
+
+    ある数字が入りうる枡が2～N個の行(列)がN個以上あること
+
+    Args:
+        wk (AnalyzeWk): ワーク
+        size (int): フィッシュの大きさ(N)
+
+    Returns:
+        bool: 前提条件を満たす場合にTrue
+    """
+    for memo in range(1, 10):
+        for region_unit_no in (ROW_UNIT_NO, CLM_UNIT_NO):
+            base_cnt: int = 0
+            for unit_no in region_unit_no:
+                if 2 <= BIT_CNT[wk.unit_memo_pos_list[unit_no][memo]] <= size:
+                    base_cnt += 1
+            if base_cnt >= size:
+                return True
+    return False
+
+
+def _has_xy_chain_base(wk: AnalyzeWk) -> bool:
+    """XYチェーンの前提条件
+
+    メモが2個の枡が3つ以上あること
+
+    Args:
+        wk (AnalyzeWk): ワーク
+
+    Returns:
+        bool: 前提条件を満たす場合にTrue
+    """
+    memo_arr = wk.flame.board.memo_arr
+    pair_cnt: int = 0
+    for idx in range(SQU_CNT):
+        if BIT_CNT[memo_arr[idx]] == 2:
+            pair_cnt += 1
+            if pair_cnt >= 3:
+                return True
+    return False
+
+
+def _has_simple_chain_base(wk: AnalyzeWk) -> bool:
+    """シンプルチェーンの前提条件
+
+    ある数字が入りうる枡が2つだけの領域(強リンク)が2つ以上あること
+
+    Args:
+        wk (AnalyzeWk): ワーク
+
+    Returns:
+        bool: 前提条件を満たす場合にTrue
+    """
+    for memo in range(1, 10):
+        strong_cnt: int = 0
+        for unit_no in range(len(UNIT_LIST)):
+            if BIT_CNT[wk.unit_memo_pos_list[unit_no][memo]] == 2:
+                strong_cnt += 1
+        if strong_cnt >= 2:
+            return True
+    return False
+
+
+# 解法 -> 前提条件
+# (前提条件を満たさない場合は解析しても結果なしとなる)
+_PRECONDITION_DICT: Dict[Method, Callable[[AnalyzeWk], bool]] = {
+    Method.X_WING: lambda wk: _has_fish_base(
+        wk, methodFish.FISH_SIZE_DICT[Method.X_WING]),
+    Method.SWORDFISH: lambda wk: _has_fish_base(
+        wk, methodFish.FISH_SIZE_DICT[Method.SWORDFISH]),
+    Method.JELLYFISH: lambda wk: _has_fish_base(
+        wk, methodFish.FISH_SIZE_DICT[Method.JELLYFISH]),
+    Method.XY_CHAIN: _has_xy_chain_base,
+    Method.SIMPLE_COLORING: _has_simple_chain_base,
+    Method.SIMPLE_CHAIN: _has_simple_chain_base,
+}
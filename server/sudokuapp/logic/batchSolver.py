@@ -0,0 +1,320 @@
+"""一括解析
+
+多数の問題を一括で解析する(オフラインの難易度判定などのコーパス処理用)
+
+消去法(ELIMIONATION)、消去法one memo(ELIMIONATION_ONE_MEMO)、
+消去法only memo(ELIMIONATION_ONLY_MEMO)のみを
+N問分の候補テンソル(N, 81, 9)に対して領域単位でまとめて適用し、
+変化がなくなるまで繰り返す。
+それだけで解けなかった問題のみ、1問ずつの解析(analyzeMain)で解析する。
+
+numpyは任意の依存ライブラリのため、
+インストールされていない場合はビットマスクによる1問ずつの処理で代替する
+"""
+from typing import List, Sequence, Tuple
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.BatchResult import BatchResult
+from sudokuapp.logic import analyzeMain, jsonConverter
+from sudokuapp.util.CellIndex import CELL_UNIT_LIST, SQU_CNT, UNIT_LIST
+from sudokuapp.util.MemoMask import ALL_MASK, BIT_CNT, LOWEST_MEMO, MEMO_BIT
+
+try:
+    import numpy as np
+except ImportError:
+    # numpyがない場合はビットマスクで処理する
+    np = None
+
+# 一度に候補テンソルに展開する問題数
+# (隠れシングルの算出で問題数 * 27 * 9 * 9 の配列を使用するため分割する)
+BATCH_SIZE: int = 4096
+
+
+def analyze_batch(
+    val_list_list: Sequence[Sequence[int]],
+    use_method_list: List[Method] = None,
+    limit_method_list: List[Method] = None,
+    adaptive_order: bool = False
+) -> List[BatchResult]:
+    """一括解析
+
+    消去法のみで一括解析し、解けなかった問題のみ1問ずつ解析する
+
+    Args:
+        val_list_list (Sequence[Sequence[int]]): 問題毎の値リスト(空き枡は0)
+        use_method_list (List[Method]): 1問ずつ解析する際の利用メソッド
+        limit_method_list (List[Method]): 1問ずつ解析する際の制限メソッド
+        adaptive_order (bool): 1問ずつ解析する際に
+            前提条件を満たさない解法を省略するかどうか
+
+    Returns:
+        List[BatchResult]: 問題毎の解析結果
+    """
+    result_list: List[BatchResult] = list()
+    for start in range(0, len(val_list_list), BATCH_SIZE):
+        result_list.extend(
+            solve_singles_batch(val_list_list[start:start + BATCH_SIZE]))
+
+    # 消去法のみで解けなかった問題は1問ずつ解析
+    for result in result_list:
+        if result.solved or result.error:
+            continue
+        _analyze_one(
+            result, use_method_list, limit_method_list, adaptive_order)
+
+    return result_list
+
+
+def solve_singles_batch(
+    val_list_list: Sequence[Sequence[int]]
+) -> List[BatchResult]:
+    """消去法のみで一括解析
+
+    Args:
+        val_list_list (Sequence[Sequence[int]]): 問題毎の値リスト(空き枡は0)
+
+    Returns:
+        List[BatchResult]: 問題毎の解析結果
+            (解けなかった問題はval_listに途中まで確定した値を保持)
+    """
+    if len(val_list_list) == 0:
+        return list()
+    if np is None:
+        return [_solve_singles_mask(val_list) for val_list in val_list_list]
+    return _solve_singles_np(val_list_list)
+
+
+def _solve_singles_np(
+    val_list_list: Sequence[Sequence[int]]
+) -> List[BatchResult]:
+    """消去法のみで一括解析(numpy)
+
+    候補テンソル(N, 81, 9)と枡 -> 領域の所属行列(81, 27)の積で
+    領域毎の確定値・メモの枡数を算出し、全問題をまとめて処理する
+
+    Args:
+        val_list_list (Sequence[Sequence[int]]): 問題毎の値リスト(空き枡は0)
+
+    Returns:
+        List[BatchResult]: 問題毎の解析結果
+    """
+    # 枡番号 -> 領域番号 -> 所属しているかどうか (81, 27)
+    unit_mat = np.zeros((SQU_CNT, len(UNIT_LIST)), dtype=np.float32)
+    for unit_no, unit in enumerate(UNIT_LIST):
+        unit_mat[list(unit), unit_no] = 1
+
+    # 問題番号 -> 枡番号 -> 値 (N, 81)
+    val_arr = np.array(val_list_list, dtype=np.int8).reshape(-1, SQU_CNT)
+    # 問題番号 -> 枡番号 -> 数字 -> 候補かどうか (N, 81, 9)
+    cand_arr = np.repeat((val_arr == 0)[:, :, None], 9, axis=2)
+    digit_arr = np.arange(1, 10, dtype=np.int8)
+    error_arr = np.zeros(len(val_arr), dtype=bool)
+
+    # 解析中(値が確定し続けている)の問題番号
+    active_arr = np.arange(len(val_arr))
+    while len(active_arr) > 0:
+        wk_val_arr = val_arr[active_arr]
+        wk_cand_arr = cand_arr[active_arr]
+
+        # 問題番号 -> 領域番号 -> 数字 -> 確定値の枡数 (n, 27, 9)
+        placed_arr = (wk_val_arr[:, :, None] == digit_arr)
+        unit_placed_cnt_arr = _sum_unit(placed_arr, unit_mat)
+
+        # 領域内で確定値が重複している
+        wk_error_arr = (unit_placed_cnt_arr > 1).any(axis=(1, 2))
+
+        # 消去法
+        # 影響枡の確定値をメモから除外
+        wk_cand_arr &= ~_any_cell(unit_placed_cnt_arr > 0, unit_mat)
+
+        # 未確定枡にメモがない
+        cand_cnt_arr = wk_cand_arr.sum(axis=2)
+        wk_error_arr |= ((wk_val_arr == 0) & (cand_cnt_arr == 0)).any(axis=1)
+
+        # 領域内に確定値にもメモにも存在しない数字がある
+        unit_cand_cnt_arr = _sum_unit(wk_cand_arr, unit_mat)
+        wk_error_arr |= (
+            (unit_placed_cnt_arr == 0) & (unit_cand_cnt_arr == 0)
+        ).any(axis=(1, 2))
+
+        # 消去法one memo
+        # メモが1つしかない枡
+        assign_arr = wk_cand_arr & (cand_cnt_arr == 1)[:, :, None]
+
+        # 消去法only memo
+        # 領域内でメモが1枡にしかない数字
+        assign_arr |= wk_cand_arr & _any_cell(
+            unit_cand_cnt_arr == 1, unit_mat)
+
+        # 1枡に複数の数字が確定する
+        wk_error_arr |= (assign_arr.sum(axis=2) > 1).any(axis=1)
+
+        # 値を確定し、確定した枡のメモを除外
+        # (矛盾ありの問題は対象外)
+        assign_arr[wk_error_arr] = False
+        assign_cell_arr = assign_arr.any(axis=2)
+        wk_val_arr[assign_cell_arr] = (
+            assign_arr[assign_cell_arr].argmax(axis=1) + 1)
+        wk_cand_arr[assign_cell_arr] = False
+
+        val_arr[active_arr] = wk_val_arr
+        cand_arr[active_arr] = wk_cand_arr
+        error_arr[active_arr] = wk_error_arr
+
+        # 矛盾あり、または確定する枡がない問題は解析終了
+        active_arr = active_arr[
+            ~wk_error_arr & assign_cell_arr.any(axis=1)]
+
+    result_list: List[BatchResult] = list()
+    for val_list, error in zip(val_arr.tolist(), error_arr.tolist()):
+        result_list.append(BatchResult(
+            val_list,
+            solved=(not error and 0 not in val_list),
+            error=error))
+    return result_list
+
+
+def _sum_unit(cell_arr, unit_mat):
+    """枡毎の値を領域毎に合計(numpy)
+
+    Args:
+        cell_arr (np.ndarray): 問題番号 -> 枡番号 -> 数字 (n, 81, 9)
+        unit_mat (np.ndarray): 枡番号 -> 領域番号 (81, 27)
+
+    Returns:
+        np.ndarray: 問題番号 -> 領域番号 -> 数字 (n, 27, 9)
+    """
+    return np.einsum(
+        "ncd,cu->nud", cell_arr.astype(np.float32), unit_mat,
+        optimize=True)
+
+
+def _any_cell(unit_arr, unit_mat):
+    """所属する領域のいずれかが該当するかを枡毎に算出(numpy)
+
+    Args:
+        unit_arr (np.ndarray): 問題番号 -> 領域番号 -> 数字 (n, 27, 9)
+        unit_mat (np.ndarray): 枡番号 -> 領域番号 (81, 27)
+
+    Returns:
+        np.ndarray: 問題番号 -> 枡番号 -> 数字 (n, 81, 9)
+    """
+    return np.einsum(
+        "nud,cu->ncd", unit_arr.astype(np.float32), unit_mat,
+        optimize=True) > 0
+
+
+def _solve_singles_mask(val_list: Sequence[int]) -> BatchResult:
+    """消去法のみで解析(ビットマスク)
+
+    numpyがない場合に1問ずつ処理する
+
+    Args:
+        val_list (Sequence[int]): 値リスト(空き枡は0)
+
+    Returns:
+        BatchResult: 解析結果
+    """
+    val_list = list(val_list)
+    memo_list: List[int] = [
+        0 if val else ALL_MASK for val in val_list]
+
+    while True:
+        # 消去法
+        # 領域毎の確定値を影響枡のメモから除外
+        unit_fixed_list: List[int] = list()
+        for unit in UNIT_LIST:
+            fixed_mask: int = 0
+            for idx in unit:
+                bit: int = MEMO_BIT[val_list[idx]]
+                # 領域内で確定値が重複している
+                if fixed_mask & bit:
+                    return BatchResult(val_list, error=True)
+                fixed_mask |= bit
+            unit_fixed_list.append(fixed_mask)
+        for idx in range(SQU_CNT):
+            if val_list[idx]:
+                continue
+            area, row, clm = CELL_UNIT_LIST[idx]
+            memo_list[idx] &= ~(unit_fixed_list[area] | unit_fixed_list[row] | unit_fixed_list[clm])
+            # 未確定枡にメモがない
+            if memo_list[idx] == 0:
+                return BatchResult(val_list, error=True)
+
+        # 消去法one memo
+        assign_list: List[Tuple[int, int]] = [
+            (idx, memo_list[idx]) for idx in range(SQU_CNT)
+            if BIT_CNT[memo_list[idx]] == 1]
+
+        # 消去法only memo
+        # 領域内で1枡にしかない(2枡以上にない)メモ
+        for unit_no, unit in enumerate(UNIT_LIST):
+            once_mask: int = 0
+            twice_mask: int = 0
+            for idx in unit:
+                twice_mask |= once_mask & memo_list[idx]
+                once_mask |= memo_list[idx]
+            # 領域内に確定値にもメモにも存在しない数字がある
+            if (once_mask | unit_fixed_list[unit_no]) != ALL_MASK:
+                return BatchResult(val_list, error=True)
+            only_mask: int = once_mask & ~twice_mask
+            if only_mask == 0:
+                continue
+            for idx in unit:
+                if memo_list[idx] & only_mask:
+                    assign_list.append((idx, memo_list[idx] & only_mask))
+
+        if len(assign_list) == 0:
+            break
+
+        # 値を確定
+        for idx, mask in assign_list:
+            val: int = LOWEST_MEMO[mask]
+            # 1枡に複数の数字が確定する
+            if BIT_CNT[mask] > 1 or val_list[idx] not in (0, val):
+                return BatchResult(val_list, error=True)
+            val_list[idx] = val
+            memo_list[idx] = 0
+
+    return BatchResult(val_list, solved=(0 not in val_list))
+
+
+def _analyze_one(
+    result: BatchResult,
+    use_method_list: List[Method],
+    limit_method_list: List[Method],
+    adaptive_order: bool
+) -> None:
+    """1問ずつの解析(analyzeMain)で解析
+
+    消去法のみで確定した値を引き継いで解析し、解析結果を更新する
+
+    Args:
+        result (BatchResult): 解析結果
+        use_method_list (List[Method]): 利用メソッド
+        limit_method_list (List[Method]): 制限メソッド
+        adaptive_order (bool): 前提条件を満たさない解法を省略するかどうか
+    """
+    wk: AnalyzeWk = jsonConverter.cnv_val_list_to_analyze_wk(
+        result.val_list, use_method_list, limit_method_list)
+    wk.adaptive_order = adaptive_order
+
+    success: bool = analyzeMain.analyze(wk)
+
+    # 解析履歴から利用した解法を集計
+    # (解析履歴1件が1回の解法の適用)
+    for history in wk.histroy_list:
+        if not history.how_anlz_list:
+            continue
+        method: Method = history.how_anlz_list[0].method
+        if method == Method.START or method == Method.ERROR_CHECK:
+            continue
+        if method not in result.method_list:
+            result.method_list.append(method)
+
+    result.val_list = [
+        wk.flame.board.get_fixed_val(idx) for idx in range(SQU_CNT)]
+    result.solved = success and wk.unfixed_cnt == 0
+    result.error = not success
+    result.fallback = True
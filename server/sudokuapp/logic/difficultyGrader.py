@@ -0,0 +1,104 @@
+"""難易度判定
+
+解析(analyzeMain)で利用した解法とその回数から問題の難易度を判定する
+"""
+from typing import Dict, List
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.GradeResult import GradeResult
+from sudokuapp.logic import analyzeMain, jsonConverter
+
+# 解法 -> 難易度レベル
+METHOD_LEVEL_DICT: Dict[Method, int] = {
+    Method.ELIMIONATION: 1,
+    Method.ELIMIONATION_ONE_MEMO: 1,
+    Method.ELIMIONATION_ONLY_MEMO: 1,
+    Method.LOCKED_CANDIDATES: 2,
+    Method.NAKED_PAIR: 3,
+    Method.HIDDEN_PAIR: 3,
+    Method.X_WING: 4,
+    Method.SWORDFISH: 4,
+    Method.JELLYFISH: 5,
+    Method.SIMPLE_COLORING: 5,
+    Method.XY_CHAIN: 5,
+    Method.SIMPLE_CHAIN: 5,
+}
+
+# 利用した解法で解けなかった場合の難易度レベル
+UNSOLVED_LEVEL: int = max(METHOD_LEVEL_DICT.values()) + 1
+
+# 難易度判定で利用するメソッド
+# (人間が解ける解法のみ。総当たり法は利用しない)
+GRADE_METHOD_LIST: List[Method] = [
+    method for method in METHOD_LEVEL_DICT
+    if method not in analyzeMain.ELIMIONATION_METHOD_LIST]
+
+
+def grade_text(text: str) -> GradeResult:
+    """問題文字列の難易度判定
+
+    プロセスプールから呼び出せるよう、モジュールのトップレベルに定義する
+
+    Args:
+        text (str): 問題文字列(81文字、空き枡は0または.)
+
+    Returns:
+        GradeResult: 難易度判定結果
+    """
+    text = text.strip()
+    wk: AnalyzeWk = jsonConverter.cnv_val_list_to_analyze_wk(
+        jsonConverter.cnv_text_to_val_list(text), GRADE_METHOD_LIST)
+    result: bool = analyzeMain.analyze(wk)
+    return grade_wk(text, result, wk)
+
+
+def grade_wk(puzzle: str, result: bool, wk: AnalyzeWk) -> GradeResult:
+    """解析済みWKの難易度判定
+
+    難易度レベルは利用した最も難しい解法のレベル
+    (解けなかった場合はUNSOLVED_LEVEL)
+    難易度スコアは「難易度レベル * 1000 + Σ(解法のレベル * 利用回数)」で、
+    同じレベル内では難しい解法を多く利用するほど大きくなる
+
+    Args:
+        puzzle (str): 問題文字列
+        result (bool): 解析結果
+        wk (AnalyzeWk): 解析済みのワーク
+
+    Returns:
+        GradeResult: 難易度判定結果
+    """
+    grade: GradeResult = GradeResult(puzzle)
+    grade.result = result
+    grade.unfixed_cnt = wk.unfixed_cnt
+    grade.solved = result and wk.unfixed_cnt == 0
+
+    # エラーの場合は判定しない
+    if not result:
+        return grade
+
+    # 解析履歴から解法毎の利用回数を集計
+    # (解析履歴1件が1回の解法の適用)
+    work_score: int = 0
+    for history in wk.histroy_list:
+        if not history.how_anlz_list:
+            continue
+        method: Method = history.how_anlz_list[0].method
+        level: int = METHOD_LEVEL_DICT.get(method)
+        if level is None:
+            continue
+        grade.method_cnt_dict[method] =\
+            grade.method_cnt_dict.get(method, 0) + 1
+        work_score += level
+        if grade.hardest_method is None\
+                or level > METHOD_LEVEL_DICT[grade.hardest_method]:
+            grade.hardest_method = method
+
+    if not grade.solved:
+        grade.level = UNSOLVED_LEVEL
+    elif grade.hardest_method is not None:
+        grade.level = METHOD_LEVEL_DICT[grade.hardest_method]
+    grade.score = grade.level * 1000 + work_score
+
+    return grade
@@ -4,11 +4,27 @@ from django.http import JsonResponse
 
 from sudokuapp.const.Method import Method
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
-from sudokuapp.data.Area import Area
+from sudokuapp.data.Board import Board
 from sudokuapp.data.Flame import Flame
-from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import AREA_SQU_IDX, SQU_CNT
+from sudokuapp.util.MemoMask import cnv_memo_list_to_mask
 from sudokuapp.util.MsgFactory import MsgFactory
-from sudokuapp.util.SudokuUtil import SudokuUtil
+
+# 解析オプションID -> 利用メソッド
+# (消去法など常に利用する解法、解析開始などは利用メソッド対象外)
+_USE_METHOD_DICT: Dict[str, Method] = {
+    method.name: method for method in Method
+    if method not in (
+        Method.START,
+        Method.ERROR_CHECK,
+        Method.ELIMIONATION,
+        Method.ELIMIONATION_ONE_MEMO,
+        Method.ELIMIONATION_ONLY_MEMO)}
+
+# 解析オプションID -> 制限メソッド
+_LIMIT_METHOD_DICT: Dict[str, Method] = {
+    "ID_NAKED_PAIR_LIMIT": Method.NAKED_PAIR,
+    "ID_HIDDEN_PAIR_LIMIT": Method.HIDDEN_PAIR}
 
 
 def cnv_json_to_analyze_wk(json: Dict[str, any]) -> AnalyzeWk:
@@ -50,27 +66,18 @@ def cnv_json_to_analyze_wk(json: Dict[str, any]) -> AnalyzeWk:
             ignore_memo = check
             continue
 
-        # ネイキッドペア制限
-        if id == "ID_NAKED_PAIR_LIMIT":
+        # 制限メソッド(ネイキッドペア制限、隠れペア制限)
+        method: Method = _LIMIT_METHOD_DICT.get(id)
+        if method is not None:
             if check:
-                limit_method_list.append(Method.NAKED_PAIR)
+                limit_method_list.append(method)
             continue
 
         # 利用メソッド
-        method: Method = None
-        for loop_method in Method:
-            # 利用メソッド対象外
-            if loop_method == Method.START\
-                    or loop_method == Method.ERROR_CHECK\
-                    or loop_method == Method.ELIMIONATION\
-                    or loop_method == Method.ELIMIONATION_ONE_MEMO\
-                    or loop_method == Method.ELIMIONATION_ONLY_MEMO:
-                continue
-            if id == loop_method.name and check:
-                method = loop_method
-                break
+        method = _USE_METHOD_DICT.get(id)
         if method is not None:
-            use_method_list.append(method)
+            if check:
+                use_method_list.append(method)
             continue
 
         raise ValueError(
@@ -82,55 +89,101 @@ def cnv_json_to_analyze_wk(json: Dict[str, any]) -> AnalyzeWk:
     flame_dict: Dict = json["flame"]
     flame: Flame = Flame()
 
+    # 盤面の配列に枡番号で直接設定する
+    # (枡のビューは生成しない)
+    board: Board = flame.board
     area_dict_list: List = flame_dict["areaList"]
     for area_dict in area_dict_list:
-        area_id: int = area_dict["areaId"]
-        area: Area = Area(area_id)
-        flame.area_list.append(area)
-        squ_dict_list = area_dict["squList"]
-        for squ_dict in squ_dict_list:
-            squ_id: int = squ_dict["squId"]
-            squ: Square = Square(area_id, squ_id)
+        area_squ_idx = AREA_SQU_IDX[area_dict["areaId"]]
+        for squ_dict in area_dict["squList"]:
+            idx: int = area_squ_idx[squ_dict["squId"]]
             # ヒント
-            if "hintVal" in squ_dict and squ_dict["hintVal"]:
-                squ.hint_val = squ_dict["hintVal"]
-                area.squ_list.append(squ)
+            hint_val: int = squ_dict.get("hintVal")
+            if hint_val:
+                board.hint_arr[idx] = hint_val
                 continue
 
             # 値（オプションによっては無視する）
-            if "val" in squ_dict and squ_dict["val"]:
+            val: int = squ_dict.get("val")
+            if val:
                 if not ignore_val:
-                    squ.val = squ_dict["val"]
-                area.squ_list.append(squ)
+                    board.val_arr[idx] = val
                 continue
 
             # メモ（オプションによっては無視する）
-            if "memoValList" in squ_dict and squ_dict["memoValList"]:
+            memo_val_list: List[int] = squ_dict.get("memoValList")
+            if memo_val_list:
                 if not ignore_memo:
-                    memo_val_list: List[int] = squ_dict["memoValList"]
-                    if len(memo_val_list) > 0:
-                        squ.memo_val_list.extend(memo_val_list)
-                area.squ_list.append(squ)
-                continue
-
-            area.squ_list.append(squ)
+                    board.memo_arr[idx] = cnv_memo_list_to_mask(
+                        memo_val_list)
 
     wk: AnalyzeWk = AnalyzeWk(flame)
     wk.use_method_list = use_method_list
+    # 前提条件を満たさない解法を省略する(任意)
+    wk.adaptive_order = json.get("adaptiveOrder", False)
     wk.limit_method_list = limit_method_list
 
     return wk
 
 
+def cnv_text_to_val_list(text: str) -> List[int]:
+    """問題文字列を値リストに変換
+
+    Args:
+        text (str): 問題文字列(81文字、空き枡は0または.)
+
+    Returns:
+        List[int]: 枡番号 -> 値(空き枡は0)
+    """
+    text = text.strip()
+    if len(text) != SQU_CNT:
+        raise ValueError("not support puzzle {}".format(text))
+    return [0 if ch == "." else int(ch) for ch in text]
+
+
+def cnv_val_list_to_analyze_wk(
+    val_list: List[int],
+    use_method_list: List[Method] = None,
+    limit_method_list: List[Method] = None
+) -> AnalyzeWk:
+    """値リストから解析WKに変換
+
+    コマンドなど、画面(JSON)を経由せずに解析する場合に使用する
+    (値は全てヒントとして設定する)
+
+    Args:
+        val_list (List[int]): 枡番号 -> 値(空き枡は0)
+        use_method_list (List[Method]): 利用メソッド
+        limit_method_list (List[Method]): 制限メソッド
+
+    Returns:
+        AnalyzeWk: 解析WK
+    """
+    flame: Flame = Flame()
+    hint_arr = flame.board.hint_arr
+    for idx, val in enumerate(val_list):
+        hint_arr[idx] = val
+
+    wk: AnalyzeWk = AnalyzeWk(flame)
+    if use_method_list is not None:
+        wk.use_method_list = list(use_method_list)
+    if limit_method_list is not None:
+        wk.limit_method_list = list(limit_method_list)
+
+    return wk
+
+
 def creata_json_response(
     result: bool,
-    wk: AnalyzeWk
+    wk: AnalyzeWk,
+    stats: bool = False
 ) -> JsonResponse:
     """JSONレスポンス生成
 
     Args:
         result (bool): 解析結果
         wk (AnalyzeWk): ワーク
+        stats (bool): 解法毎の解析統計を出力するかどうか
 
     Returns:
         JsonResponse: JSONレスポンス
@@ -138,7 +191,7 @@ def creata_json_response(
 
     # 解析履歴変換
     history_json_list: List[Dict[str, any]] = list()
-    for histroy in wk.histroy_list:
+    for histroy, histroy_flame in wk.iter_history_flame():
         # wk_flame, wk_change_history_list
         how_anlz_json_list: List[Dict] = list()
         if histroy.how_anlz_list is not None:
@@ -147,7 +200,7 @@ def creata_json_response(
                 how_anlz_json_list.append(how_anlz.cnv_to_json())
 
         history_json: Dict[str, any] = dict()
-        history_json["flame"] = histroy.flame.cnv_to_json()
+        history_json["flame"] = histroy_flame.cnv_to_json()
         history_json["howToAnalyzeList"] = how_anlz_json_list
         history_json_list.append(history_json)
 
@@ -173,23 +226,28 @@ def creata_json_response(
         msg_json_list.append(wk_msg.cnv_to_json())
 
     # N個の枡の答えが判明しました。
-    fixed_num: int = \
-        len(SudokuUtil.find_fixed_squ_from_flame(wk.flame))\
-        - len(wk.hint_list)
+    fixed_num: int = wk.fixed_cnt - len(wk.hint_list)
     if fixed_num > 0:
         msg_json_list.append(
             MsgFactory.fixed_num(fixed_num)
             .cnv_to_json())
 
     # N個の枡の答えが判明出来ませんでした。
-    unfixed_num: int = len(SudokuUtil.find_unfixed_squ_from_flame(wk.flame))
+    unfixed_num: int = wk.unfixed_cnt
     if unfixed_num > 0:
         msg_json_list.append(
             MsgFactory.unfixed_num(unfixed_num)
             .cnv_to_json())
 
-    return JsonResponse({
+    response_json: Dict[str, any] = {
         "result": result,
         "msgList": msg_json_list,
         "historyList": history_json_list
-    })
+    }
+
+    # 解法毎の解析統計
+    if stats:
+        response_json["stats"] = [
+            stat.cnv_to_json() for stat in wk.method_stat_dict.values()]
+
+    return JsonResponse(response_json)
@@ -5,6 +5,8 @@ from typing import List
 from sudokuapp.const.Method import Method
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
+from sudokuapp.util.CellIndex import AREA_ORDER_IDX, CELL_UNIT_LIST
+from sudokuapp.util.MemoMask import BIT_CNT, LOWEST_MEMO
 from sudokuapp.util.MsgFactory import MsgFactory
 
 
@@ -22,16 +24,21 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
     """
 
     # メモ値がひとつしかない=そこの枡にはそれしか入らない
-    for squ in wk.all_squ_list:
-        if len(squ.memo_val_list) == 1:
-            squ.val = squ.memo_val_list[0]
-            squ.memo_val_list.clear()
+    # (前回解析結果なし以降に変更がないエリアは対象外)
+    memo_arr = wk.flame.board.memo_arr
+    for idx in AREA_ORDER_IDX:
+        if not wk.is_dirty_unit(
+                Method.ELIMIONATION_ONE_MEMO, CELL_UNIT_LIST[idx][0]):
+            continue
+        if BIT_CNT[memo_arr[idx]] == 1:
+            val: int = LOWEST_MEMO[memo_arr[idx]]
+            wk.fix_val(idx, val)
 
             # 解析方法生成
             how_anlz: HowToAnalyze = HowToAnalyze(
                 Method.ELIMIONATION_ONE_MEMO)
-            how_anlz.commit_val = squ.val
-            how_anlz.changed_squ = squ
+            how_anlz.commit_val = val
+            how_anlz.changed_idx = idx
             how_anlz.msg = MsgFactory.how_to_elimionation_one_memo(how_anlz)
 
             how_anlz_list.append(how_anlz)
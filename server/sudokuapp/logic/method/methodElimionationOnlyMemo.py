@@ -1,12 +1,14 @@
 """消去法
 """
-from typing import Dict, List
+from typing import List, Tuple
 
 from sudokuapp.const.Method import Method
 from sudokuapp.const.Region import Region
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
-from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import (AREA_UNIT_NO, CLM_UNIT_NO, ROW_UNIT_NO,
+                                      UNIT_LIST)
+from sudokuapp.util.MemoMask import BIT_CNT, MEMO_BIT, MEMO_LIST
 from sudokuapp.util.MsgFactory import MsgFactory
 
 
@@ -26,8 +28,8 @@ def analyze(
 
     # エリア単位に数字を見た場合にメモがその枡にしかない
     # ⇒値を確定できる
-    for area in wk.flame.area_list:
-        if not _onlyMemo(how_anlz_list, Region.AREA, area.squ_list):
+    for unit_no in AREA_UNIT_NO:
+        if not _onlyMemo(wk, how_anlz_list, Region.AREA, unit_no):
             return False
 
     if len(how_anlz_list) > 0:
@@ -68,8 +70,8 @@ def analyze(
 
     # 行単位で数字を見た場合にメモがその枡にしかない
     # ⇒値を確定できる
-    for key, squ_list in wk.row_dict.items():
-        if not _onlyMemo(how_anlz_list, Region.ROW, squ_list):
+    for unit_no in ROW_UNIT_NO:
+        if not _onlyMemo(wk, how_anlz_list, Region.ROW, unit_no):
             return False
 
     if len(how_anlz_list) > 0:
@@ -77,58 +79,60 @@ def analyze(
 
     # 列単位で数字を見た場合にメモがその枡にしかない
     # ⇒値を確定できる
-    for key, squ_list in wk.clm_dict.items():
-        if not _onlyMemo(how_anlz_list, Region.CLM, squ_list):
+    for unit_no in CLM_UNIT_NO:
+        if not _onlyMemo(wk, how_anlz_list, Region.CLM, unit_no):
             return False
 
     return True
 
 
 def _onlyMemo(
+        wk: AnalyzeWk,
         how_anlz_list: List[HowToAnalyze],
         region: Region,
-        squ_list: List[Square]
+        unit_no: int
 ) -> bool:
     """エリア内(行、列)にメモが一つしかない
 
     ⇒メモで値を確定させる
 
     Args:
+        wk (AnalyzeWk): ワーク
         how_anlz_list (List[HowToAnalyze]): 解析方法
         from_type (Region): 領域
-        squ_list (List[Square]): 枡リスト
+        unit_no (int): 領域番号
 
     Returns:
         bool: エラーの場合にFalse
 
     """
 
-    wk_memo_dict: Dict[str, List[Square]] = dict()
-    # 下記のようなDICTを作成
+    # 領域内で1箇所にしか出現しないメモをマスクで算出
     # 枡A memo=[1 2 3]
     # 枡B memo=[1 2]
     # 枡C memo=[1 2 3 4]
     # ⇒
+    # メモ -> 領域内の位置
     # 1: [枡A 枡B 枡C]
     # 2: [枡A 枡B 枡C]
-    # 3: [枡A 枡B]
+    # 3: [枡A 枡C]
     # 4: [枡C]
-    for squ in squ_list:
-        if (squ.get_fixed_val() is not None):
-            continue
-        for memo in squ.memo_val_list:
-            if memo not in wk_memo_dict:
-                wk_memo_dict[memo] = list()
-            wk_memo_dict[memo].append(squ)
-
-    # 複数のメモ値が入るメモを除外
-    # 1: [枡A 枡B 枡C] ←除外
-    # 2: [枡A 枡B 枡C] ←除外
-    # 3: [枡A 枡B] ←除外
-    # 4: [枡C]
-    for loop_memo in list(wk_memo_dict.keys()):
-        if len(wk_memo_dict[loop_memo]) != 1:
-            del wk_memo_dict[loop_memo]
+    # ⇒
+    # only_mask: [4] ←枡Cにしか入らない
+    # (確定枡のメモは空のため、確定判定は不要)
+    # 前回解析結果なし以降に変更がない領域は対象外
+    if not wk.is_dirty_unit(Method.ELIMIONATION_ONLY_MEMO, unit_no):
+        return True
+
+    unit: Tuple[int, ...] = UNIT_LIST[unit_no]
+    memo_arr = wk.flame.board.memo_arr
+    pos_list: List[int] = wk.unit_memo_pos_list[unit_no]
+    only_mask: int = 0
+    for memo in range(1, 10):
+        if BIT_CNT[pos_list[memo]] == 1:
+            only_mask |= MEMO_BIT[memo]
+    if only_mask == 0:
+        return True
 
     # エラーチェック
     # 下記のような場合はNG
@@ -142,23 +146,21 @@ def _onlyMemo(
     # 4: [枡C] ←4も枡Cにしか入らない。。。
     #           ⇒例えば3で枡Cを確定してしまうと
     #             4が入る枡がなくなってしまう
-    # for memo, wk_squ_list in wk_memo_dict.items():
-    #     if len(wk_squ_list) != 1:
-    #         continue
-    #     pass
-
-    for memo, wk_squ_list in wk_memo_dict.items():
-        squ: Square = wk_squ_list[0]
-        squ.val = memo
-        squ.memo_val_list.clear()
-
-        # 解析方法生成
-        how_anlz: HowToAnalyze = HowToAnalyze(
-            Method.ELIMIONATION_ONLY_MEMO)
-        how_anlz.region = region
-        how_anlz.commit_val = squ.val
-        how_anlz.changed_squ = squ
-        how_anlz.msg = MsgFactory.how_to_elimionation_only_memo(how_anlz)
-        how_anlz_list.append(how_anlz)
+
+    for idx in unit:
+        hit_mask: int = memo_arr[idx] & only_mask
+        if hit_mask == 0:
+            continue
+        for memo in MEMO_LIST[hit_mask]:
+            wk.fix_val(idx, memo)
+
+            # 解析方法生成
+            how_anlz: HowToAnalyze = HowToAnalyze(
+                Method.ELIMIONATION_ONLY_MEMO)
+            how_anlz.region = region
+            how_anlz.commit_val = memo
+            how_anlz.changed_idx = idx
+            how_anlz.msg = MsgFactory.how_to_elimionation_only_memo(how_anlz)
+            how_anlz_list.append(how_anlz)
 
     return True
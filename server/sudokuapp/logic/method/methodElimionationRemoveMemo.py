@@ -1,14 +1,16 @@
 """消去法
 """
-from typing import List
+from typing import List, Tuple
 
 from sudokuapp.const.Method import Method
 from sudokuapp.const.Region import Region
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.Board import Board
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
-from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import (AREA_UNIT_NO, CLM_UNIT_NO, ROW_UNIT_NO,
+                                      UNIT_LIST)
+from sudokuapp.util.MemoMask import MEMO_BIT, MEMO_LIST
 from sudokuapp.util.MsgFactory import MsgFactory
-from sudokuapp.util.SudokuUtil import SudokuUtil
 
 
 def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
@@ -25,56 +27,74 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
     # メモ値を潰す
     #################
     # エリア
-    for area in wk.flame.area_list:
-        _removeMemo(how_anlz_list, Region.AREA, area.squ_list)
+    for unit_no in AREA_UNIT_NO:
+        _removeMemo(wk, how_anlz_list, Region.AREA, unit_no)
 
     # 行
-    for squ_list in wk.row_dict.values():
-        _removeMemo(how_anlz_list, Region.ROW, squ_list)
+    for unit_no in ROW_UNIT_NO:
+        _removeMemo(wk, how_anlz_list, Region.ROW, unit_no)
 
     # 列
-    for squ_list in wk.clm_dict.values():
-        _removeMemo(how_anlz_list, Region.CLM, squ_list)
+    for unit_no in CLM_UNIT_NO:
+        _removeMemo(wk, how_anlz_list, Region.CLM, unit_no)
 
     return True
 
 
 def _removeMemo(
+    wk: AnalyzeWk,
     how_anlz_list: List[HowToAnalyze],
     region: Region,
-    squ_list: List[Square]
+    unit_no: int
 ) -> None:
     """メモの除外
 
     ヒント(値)によってメモを除外
 
     Args:
+        wk (AnalyzeWk): ワーク
         how_anlz_list (List[ChangeHistroy]): 解析方法
         region (Region): 領域
-        squ_list (List[Square]): 枡リスト
+        unit_no (int): 領域番号
     """
-    # 確定枡を抽出
-    not_none_squ_list: List[Square] = SudokuUtil.find_fixed_squ_from_region(
-        squ_list)
-
-    # 未確定枡を抽出
-    none_squ_list: List[Square] = SudokuUtil.find_unfixed_squ_from_region(
-        squ_list)
+    # 前回解析結果なし以降に変更がない領域は対象外
+    if not wk.is_dirty_unit(Method.ELIMIONATION, unit_no):
+        return
+
+    board: Board = wk.flame.board
+
+    # 確定枡の枡番号、確定値を抽出
+    fixed_list: List[Tuple[int, int]] = list()
+    unfixed_idx_list: List[int] = list()
+    fixed_mask: int = 0
+    for idx in UNIT_LIST[unit_no]:
+        fixed_val: int = board.get_fixed_val(idx)
+        if fixed_val:
+            fixed_list.append((idx, fixed_val))
+            fixed_mask |= MEMO_BIT[fixed_val]
+        else:
+            unfixed_idx_list.append(idx)
+    if fixed_mask == 0:
+        return
 
     # メモからヒント(値)を除外
-    for none_squ in none_squ_list:
-        for memo in none_squ.memo_val_list[:]:
-            for not_none_squ in not_none_squ_list:
-                if memo == not_none_squ.get_fixed_val():
-                    none_squ.memo_val_list.remove(memo)
+    memo_arr = board.memo_arr
+    for idx in unfixed_idx_list:
+        remove_mask: int = memo_arr[idx] & fixed_mask
+        if remove_mask == 0:
+            continue
+        for memo in MEMO_LIST[remove_mask]:
+            for fixed_idx, fixed_val in fixed_list:
+                if memo == fixed_val:
+                    wk.remove_memo(idx, MEMO_BIT[memo])
 
                     # 解析方法生成
                     how_anlz: HowToAnalyze = HowToAnalyze(
                         Method.ELIMIONATION)
                     how_anlz.region = region
                     how_anlz.remove_memo_list.append(memo)
-                    how_anlz.changed_squ = none_squ
-                    how_anlz.trigger_squ_list.append(not_none_squ)
+                    how_anlz.changed_idx = idx
+                    how_anlz.trigger_idx_list.append(fixed_idx)
                     how_anlz.msg = MsgFactory.how_to_elimionation(how_anlz)
 
                     how_anlz_list.append(how_anlz)
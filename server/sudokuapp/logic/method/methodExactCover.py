@@ -0,0 +1,55 @@
+"""総当たり法
+"""
+from typing import List
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.Board import Board
+from sudokuapp.data.HowToAnalyze import HowToAnalyze
+from sudokuapp.util import ExactCover
+from sudokuapp.util.CellIndex import AREA_ORDER_IDX, SQU_CNT
+from sudokuapp.util.MsgFactory import MsgFactory
+
+
+def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
+    """総当たり法
+
+    他の解法で解析結果なしとなった場合に、
+    残りの未確定枡を完全被覆(Exact Cover)の総当たりで解き、
+    全ての未確定枡の値を確定する。
+    (解析履歴は1回の解析結果として追加される)
+
+    解が1つに定まらない場合(解なし、または複数解)は値を確定しない。
+
+    Args:
+        wk (AnalyzeWk): ワーク
+        how_anlz_list (List[HowToAnalyze]): 解析方法
+
+    Returns:
+        bool: エラーの場合にFalse
+    """
+    board: Board = wk.flame.board
+    val_list: List[int] = [board.get_fixed_val(idx) for idx in range(SQU_CNT)]
+
+    # 解が1つに定まるかどうかを判定するため、2つまで算出
+    solution_list: List[List[int]] = ExactCover.solve(val_list, limit=2)
+    if len(solution_list) != 1:
+        return True
+    solution: List[int] = solution_list[0]
+
+    # 未確定枡の値を確定
+    # (エリア順)
+    for idx in AREA_ORDER_IDX:
+        if val_list[idx]:
+            continue
+        wk.fix_val(idx, solution[idx])
+
+        # 解析方法生成
+        how_anlz: HowToAnalyze = HowToAnalyze(Method.EXACT_COVER)
+        how_anlz.commit_val = solution[idx]
+        how_anlz.changed_idx = idx
+        how_anlz.msg = MsgFactory.how_to_exact_cover(how_anlz)
+
+        how_anlz_list.append(how_anlz)
+
+    return True
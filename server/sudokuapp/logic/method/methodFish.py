@@ -0,0 +1,133 @@
+"""フィッシュ(X-Wing、ソードフィッシュ、ジェリーフィッシュ)
+"""
+from typing import Dict, List, Tuple
+
+from sudokuapp.const.Method import Method
+from sudokuapp.const.Region import Region
+from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.HowToAnalyze import HowToAnalyze
+from sudokuapp.util.CellIndex import (CLM_UNIT_LIST, CLM_UNIT_NO,
+                                      ROW_UNIT_LIST, ROW_UNIT_NO, UNIT_LIST)
+from sudokuapp.util.MemoMask import (BIT_CNT, BIT_POS_LIST, MEMO_BIT,
+                                     iter_mask_subset)
+from sudokuapp.util.MsgFactory import MsgFactory
+
+# 解法 -> フィッシュの大きさ(基準とする行(列)の数)
+FISH_SIZE_DICT: Dict[Method, int] = {
+    Method.X_WING: 2,
+    Method.SWORDFISH: 3,
+    Method.JELLYFISH: 4,
+}
+
+
+def analyze(
+    wk: AnalyzeWk,
+    how_anlz_list: List[HowToAnalyze],
+    method: Method
+) -> bool:
+    """フィッシュ
+
+    ある数字が入りうる枡がN個の行(基準)で合わせてN個の列(対象)にしかない場合、
+    対象の列の基準の行以外の枡のメモからその数字を除外出来る
+    (行で探して解析結果がない場合のみ列で探す)
+
+    Args:
+        wk (AnalyzeWk): ワーク
+        how_anlz_list (List[HowToAnalyze]): 解析方法
+        method (Method): 解法(フィッシュの大きさ)
+
+    Returns:
+        bool: エラーの場合にFalse
+    """
+    find_fish(wk, how_anlz_list, method, Region.ROW)
+    if len(how_anlz_list) > 0:
+        return True
+
+    find_fish(wk, how_anlz_list, method, Region.CLM)
+    return True
+
+
+def find_fish(
+    wk: AnalyzeWk,
+    how_anlz_list: List[HowToAnalyze],
+    method: Method,
+    region: Region
+) -> None:
+    """フィッシュを探してメモを除外
+
+    数字毎に基準の行(列)の「数字が入りうる位置マスク」のORを取り、
+    位置数がフィッシュの大きさと一致する組み合わせを探す
+    (解析結果がある数字が見つかったら処理終了)
+
+    Args:
+        wk (AnalyzeWk): ワーク
+        how_anlz_list (List[HowToAnalyze]): 解析方法
+        method (Method): 解法(フィッシュの大きさ)
+        region (Region): 基準とする領域(行 or 列)
+    """
+    size: int = FISH_SIZE_DICT[method]
+    memo_arr = wk.flame.board.memo_arr
+
+    base_unit_no: range
+    cover_unit_list: Tuple[Tuple[int, ...], ...]
+    if region == Region.ROW:
+        base_unit_no = ROW_UNIT_NO
+        cover_unit_list = CLM_UNIT_LIST
+    else:
+        base_unit_no = CLM_UNIT_NO
+        cover_unit_list = ROW_UNIT_LIST
+
+    for loop_memo in range(1, 10):
+        # 前回解析結果なし以降に変更がないメモは対象外
+        if not wk.is_dirty_memo(method, loop_memo):
+            continue
+        memo_bit: int = MEMO_BIT[loop_memo]
+
+        # 数字が入りうる枡が2～N個の行(列)の領域番号と位置マスク
+        # (行の位置は列番号、列の位置は行番号)
+        base_list: List[Tuple[int, int]] = list()
+        for unit_no in base_unit_no:
+            pos_mask: int = wk.unit_memo_pos_list[unit_no][loop_memo]
+            if 2 <= BIT_CNT[pos_mask] <= size:
+                base_list.append((unit_no, pos_mask))
+        if len(base_list) < size:
+            continue
+
+        # 位置マスクのORの位置数がフィッシュの大きさと一致する組み合わせ
+        for fish_base_list, cover_mask in iter_mask_subset(base_list, size):
+
+            # フィッシュを構成する枡
+            fish_idx_list: List[int] = [
+                UNIT_LIST[unit_no][pos]
+                for unit_no, pos_mask in fish_base_list
+                for pos in BIT_POS_LIST[pos_mask]]
+            cover_pos_list: List[int] = [
+                pos + 1 for pos in BIT_POS_LIST[cover_mask]]
+
+            # 対象の列(行)のフィッシュ以外の枡のメモから数字を除外
+            for cover_pos in cover_pos_list:
+                for change_idx in cover_unit_list[cover_pos - 1]:
+                    if not memo_arr[change_idx] & memo_bit:
+                        continue
+                    if change_idx in fish_idx_list:
+                        continue
+
+                    # メモを除外
+                    wk.remove_memo(change_idx, memo_bit)
+
+                    # 解析方法生成
+                    how_anlz: HowToAnalyze = HowToAnalyze(method)
+                    how_anlz.region = region
+                    how_anlz.changed_idx = change_idx
+                    how_anlz.remove_memo_list.append(loop_memo)
+                    how_anlz.trigger_idx_list.extend(fish_idx_list)
+                    if method == Method.X_WING:
+                        how_anlz.msg = MsgFactory.how_to_x_wing(
+                            how_anlz, tuple(cover_pos_list))
+                    else:
+                        how_anlz.msg = MsgFactory.how_to_fish(how_anlz)
+
+                    how_anlz_list.append(how_anlz)
+
+        if len(how_anlz_list) > 0:
+            return
@@ -1,15 +1,17 @@
 """隠れペア
 """
-import itertools
-from typing import Dict, List, Set
+from typing import List, Tuple
 
 from sudokuapp.const.Method import Method
 from sudokuapp.const.Region import Region
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
-from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import (AREA_UNIT_NO, CLM_UNIT_NO, ROW_UNIT_NO,
+                                      UNIT_LIST)
+from sudokuapp.util.MemoMask import (BIT_CNT, BIT_POS_LIST, MEMO_BIT,
+                                     MEMO_LIST, cnv_memo_list_to_mask,
+                                     iter_mask_subset)
 from sudokuapp.util.MsgFactory import MsgFactory
-from sudokuapp.util.SudokuUtil import SudokuUtil
 
 
 def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
@@ -54,8 +56,8 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
     """
 
     # エリアで隠れペア解析
-    for area in wk.flame.area_list:
-        _analyze_hidden_pair(wk, how_anlz_list, Region.AREA, area.squ_list)
+    for unit_no in AREA_UNIT_NO:
+        _analyze_hidden_pair(wk, how_anlz_list, Region.AREA, unit_no)
     # 同一領域の解析を実施した後に、他領域の解析を行うと(値の確定を実施してないため)
     # 矛盾が発生する可能性がある。
     # (逆に言うと自領域内であれば続けて解析して問題ない)
@@ -63,8 +65,8 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
         return True
 
     # 行で隠れペア解析
-    for squ_list in wk.row_dict.values():
-        _analyze_hidden_pair(wk, how_anlz_list, Region.ROW, squ_list)
+    for unit_no in ROW_UNIT_NO:
+        _analyze_hidden_pair(wk, how_anlz_list, Region.ROW, unit_no)
     # 同一領域の解析を実施した後に、他領域の解析を行うと(値の確定を実施してないため)
     # 矛盾が発生する可能性がある。
     # (逆に言うと自領域内であれば続けて解析して問題ない)
@@ -72,8 +74,8 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
         return True
 
     # 列で隠れペア解析
-    for squ_list in wk.clm_dict.values():
-        _analyze_hidden_pair(wk, how_anlz_list, Region.CLM, squ_list)
+    for unit_no in CLM_UNIT_NO:
+        _analyze_hidden_pair(wk, how_anlz_list, Region.CLM, unit_no)
 
     return True
 
@@ -82,7 +84,7 @@ def _analyze_hidden_pair(
     wk: AnalyzeWk,
     how_anlz_list: List[HowToAnalyze],
     region: Region,
-    squ_list: List[Square]
+    unit_no: int
 ) -> None:
     """隠れペア解析
 
@@ -90,11 +92,15 @@ def _analyze_hidden_pair(
         wk (AnalyzeWk): ワーク
         how_anlz_list (List[HowToAnalyze]): 解析方法
         region (Region): 領域
+        unit_no (int): 領域番号
     """
+    # 前回解析結果なし以降に変更がない領域は対象外
+    if not wk.is_dirty_unit(Method.HIDDEN_PAIR, unit_no):
+        return
 
-    # 未確定枡を取得
-    unfixed_list: List[Square] = SudokuUtil.find_unfixed_squ_from_region(
-        squ_list)
+    # 未確定枡(枡番号)を取得
+    # (領域の枡番号順)
+    unfixed_list: List[int] = sorted(wk.unit_unfixed_list[unit_no])
 
     # 対象領域の全ての枡が確定している
     if len(unfixed_list) == 0:
@@ -111,8 +117,7 @@ def _analyze_hidden_pair(
         if len(unfixed_list) <= hidden_num:
             return
 
-        # メモとメモが存在する枡を以下のように辞書にまとめる
-        # メモ:メモが入る枡リスト
+        # 隠れペアの候補(メモ、メモが入る枡(領域内の位置マスク))を算出する
         # 例に当てはめると、、、
         # +[1]----------------------+
         # | 1:1(@)     1:2  1:3     |
@@ -123,110 +128,61 @@ def _analyze_hidden_pair(
         # | m=[N,O,Q]  h=?  m=[P,Q] |
         # +-------------------------+
         # 以下のようになる
-        # memo_dict
-        # N:[@,#]
-        # M:[@,$]
-        # O:[$,#]
-        # P:[@,$,*,&]
-        # Q:[#,*,$]
-        memo_dict: Dict[int, List[Square]] = dict()
-        for unfixed_squ in unfixed_list:
-            for memo in unfixed_squ.memo_val_list:
-                if memo not in memo_dict:
-                    memo_dict[memo] = list()
-                memo_dict[memo].append(unfixed_squ)
-
-        # 隠れペアの候補を算出する
-        # 例に当てはめると、、、
-        # memo_dict
         # N:[@,#]
         # M:[@,$]
         # O:[$,#]
-        # P:[@,$,*,&]
+        # P:[@,$,*,&] <- メモが出てくる枡数が隠れ数より大きいため候補外
         # Q:[#,*,$]
-        # 以下のようになる
-        # can_hidden_memo_set
-        # (N,M,O,P,Q)
-        can_hidden_memo_set: Set[int] = set()
-        for memo, memo_squ_list in memo_dict.items():
-            # メモが出てくる枡数が隠れ数以下の場合に候補の対象となる
-            # [補足]
-            # メモ数が隠れ数より大きい場合は候補にならない
-            if len(memo_squ_list) <= hidden_num:
-                can_hidden_memo_set.add(memo)
+        # (領域毎のメモ位置から生成するため、枡を辿る必要はない)
+        pos_list: List[int] = wk.unit_memo_pos_list[unit_no]
+        can_hidden_list: List[Tuple[int, int]] = [
+            (memo, pos_list[memo]) for memo in range(1, 10)
+            if 0 < BIT_CNT[pos_list[memo]] <= hidden_num]
 
         # 候補となるメモ数が隠れ数より少ない場合は対象とならない
-        if len(can_hidden_memo_set) < hidden_num:
+        if len(can_hidden_list) < hidden_num:
             continue
 
-        # 候補となるメモから順番を問わない組み合わせを算出
-        # 例に当てはめると、、、
-        # can_hidden_memo_set
-        # (N,M,O,P,Q)
-        # 以下のようになる
-        # hidden_comb_list
-        # [(N,M,O), (N,M,P), (N,O,Q), (N,O,P), ...]
-        hidden_comb_list: List[Set[int]] = list(
-            itertools.combinations(can_hidden_memo_set, hidden_num))
-
-        # 組み合わせから枡を逆算して枡数がペア数と一致するもの
-        # ＝隠しペアを探し出す
+        # 候補となるメモの組み合わせのうち、位置マスクのORの枡数が
+        # 隠れ数と一致するもの＝隠れペアを探し出す
+        # (組み合わせを数字順に作りながら位置マスクのORを取り、
+        #  枡数が隠れ数を超えた時点で打ち切るため、最大でもC(9,隠れ数)回)
         # 例に当てはめると、、、
-        # memo_dict
-        # N:[@,#]
-        # M:[@,$]
-        # O:[$,#]
-        # P:[@,$,*,&]
-        # Q:[#,*,$]
-        # hidden_comb_list
-        # [(N,M,O), (N,M,P), (N,O,Q), (N,O,P), ...]
-        # memo_dictとhidden_comb_listを合体させて
-        # (N,M,O): (@,#,$) <- 隠れペア数と枡数が一致する=隠れペアの対象
-        # (N,M,P): (@,#,$,*,&)
-        # (N,O,Q): (@,#,$,*,&)
-        # 以下のようになる
-        # hidden_pair_memo
-        # [N,M,O]
-        # hidden_pair_squ
-        # [@,#,$]}
-        hidden_pair_memo: List[int] = None
-        hidden_pair_squ: List[Square] = None
-        for hidden_comb in hidden_comb_list:
-            memo_include_set: Set[Square] = set()
-            for memo in hidden_comb:
-                memo_include_set = memo_include_set.union(set(memo_dict[memo]))
-
-            if len(memo_include_set) != hidden_num:
+        # (N,M,O): [@,#,$] <- 隠れペア数と枡数が一致する=隠れペアの対象
+        # (N,M,Q): [@,#,$,*] <- 枡数が隠れ数を超えたため打ち切り
+        memo_arr = wk.flame.board.memo_arr
+        for hidden_item_list, hidden_pos_mask in iter_mask_subset(
+                can_hidden_list, hidden_num):
+            hidden_pair_memo: List[int] = [
+                memo for memo, _ in hidden_item_list]
+            hidden_pair_mask: int = cnv_memo_list_to_mask(hidden_pair_memo)
+            # (領域内の位置は枡番号の昇順のため、ソート済み)
+            hidden_pair_idx: List[int] = [
+                UNIT_LIST[unit_no][pos]
+                for pos in BIT_POS_LIST[hidden_pos_mask]]
+
+            # 隠れペアは見つかったが、ペア以外のメモがない
+            # ⇒次の組み合わせをチェック
+            if not any(memo_arr[idx] & ~hidden_pair_mask
+                       for idx in hidden_pair_idx):
                 continue
 
-            # 隠れペア数と枡数が一致する=隠れペアの対象
-            hidden_pair_memo: List[int] = list(hidden_comb)
-            hidden_pair_memo.sort()
-            hidden_pair_squ: List[Square] = list(memo_include_set)
-            hidden_pair_squ.sort()
-            break
+            for change_idx in hidden_pair_idx:
+                for loop_memo in MEMO_LIST[
+                        memo_arr[change_idx] & ~hidden_pair_mask]:
 
-        # 隠れペア未発見
-        # 隠れペア数を大きくして次のループへ
-        if hidden_pair_memo is None:
-            continue
+                    # メモを除外
+                    wk.remove_memo(change_idx, MEMO_BIT[loop_memo])
 
-        for change_squ in hidden_pair_squ:
-            for loop_memo in change_squ.memo_val_list[:]:
-                if loop_memo in hidden_pair_memo:
-                    continue
-
-                # メモを除外
-                change_squ.memo_val_list.remove(loop_memo)
-
-                # 解析方法生成
-                how_anlz: HowToAnalyze = HowToAnalyze(
-                    Method.HIDDEN_PAIR)
-                how_anlz.region = region
-                how_anlz.changed_squ = change_squ
-                how_anlz.remove_memo_list.append(loop_memo)
-                how_anlz.trigger_squ_list.extend(hidden_pair_squ)
-                how_anlz.msg = MsgFactory.how_to_hidden_pair(
-                    how_anlz, hidden_pair_memo)
-
-                how_anlz_list.append(how_anlz)
+                    # 解析方法生成
+                    how_anlz: HowToAnalyze = HowToAnalyze(
+                        Method.HIDDEN_PAIR)
+                    how_anlz.region = region
+                    how_anlz.changed_idx = change_idx
+                    how_anlz.remove_memo_list.append(loop_memo)
+                    how_anlz.trigger_idx_list.extend(hidden_pair_idx)
+                    how_anlz.msg = MsgFactory.how_to_hidden_pair(
+                        how_anlz, hidden_pair_memo)
+
+                    how_anlz_list.append(how_anlz)
+            break
@@ -0,0 +1,29 @@
+"""ジェリーフィッシュ
+"""
+from typing import List
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.HowToAnalyze import HowToAnalyze
+from sudokuapp.logic.method import methodFish
+
+
+def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
+    """ジェリーフィッシュ法
+
+    X-Wing法を4行(列)に拡張した解法
+
+    4つの行である数字が入りうる枡が合わせて4列にしかない場合、
+    4つの行のその数字はそれぞれ4列のいずれかに必ず入る。
+    このことから4列の4つの行以外の枡のメモからその数字を除外出来る。
+    ※行で説明をしたが、列でも同様の解法が適用出来る
+
+    Args:
+        wk (AnalyzeWk): ワーク
+        how_anlz_list (List[HowToAnalyze]): 解析方法
+
+    Returns:
+        bool: エラーの場合にFalse
+    """
+
+    return methodFish.analyze(wk, how_anlz_list, Method.JELLYFISH)
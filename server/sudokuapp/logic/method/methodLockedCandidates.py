@@ -1,14 +1,35 @@
 """ロックされた候補法
 """
-from typing import Dict, List
+import itertools
+from typing import List, Tuple
 
 from sudokuapp.const.Method import Method
 from sudokuapp.const.Region import Region
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
-from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import (AREA_UNIT_NO, CLM_UNIT_NO, ROW_UNIT_NO,
+                                      UNIT_INTERSECTION_LIST, UNIT_LIST)
+from sudokuapp.util.MemoMask import (ALL_MASK, BIT_CNT, BIT_POS_LIST,
+                                     LOWEST_MEMO, MEMO_BIT)
 from sudokuapp.util.MsgFactory import MsgFactory
 
+# 基準の領域の種類(0: エリア、1: 行(列)) -> 基準の領域内の位置マスク
+# -> 位置マスクが収まる交差の番号(UNIT_INTERSECTION_LIST[領域番号]の添字)
+# ロックされた候補法の性質上、対象となる枡は2個または3個のみ
+# (対象外の場合は-1)
+# [補足]
+# 交差の位置マスクは領域の種類毎に同一のため、エリア1、1行目の交差から作成する
+# また、2個以上の枡が収まる交差は1つのみ
+_INTER_NO_LIST: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        next((
+            inter_no for inter_no, inter
+            in enumerate(UNIT_INTERSECTION_LIST[unit_no])
+            if 2 <= BIT_CNT[pos_mask] <= 3 and not pos_mask & ~inter[kind]),
+            -1)
+        for pos_mask in range(ALL_MASK + 1))
+    for unit_no, kind in ((AREA_UNIT_NO[0], 2), (ROW_UNIT_NO[0], 3)))
+
 
 def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
     """ロックされた候補法
@@ -32,6 +53,22 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
     上記例だとエリア[1]の2に関しても1列目にしか存在しえないため、
     エリア[4]、エリア[7]の1列目のメモ2を除外出来る。
 
+    逆に、ある値がその行(列)内で同一エリアにしか存在しない場合、
+    そのエリアの別の行(列)には存在しえない
+    ⇒同一エリアの別の行(列)のメモを除外出来る
+    例>
+    1行目において1は(1:1),(1:2)にしか存在出来ない
+    +[1]------------------+[2]----------+[3]--------------+
+    | m=[1,2] m=[1,3] v=4 | v=5 v=6 v=7 | m=[2,3] v=8 v=9 |
+    | m=[1,2] ?       ?   | ?   ?   ?   | ?       ?   ?   |
+    +---------------------+-------------+-----------------+
+    例えばエリア[1]の(2:1)に1が入ってしまうと
+    1行目に1が入る枡がなくなってしまうため矛盾が生じてしまう。
+    ⇒エリア[1]の1行目以外の枡のメモから1を除外出来る
+
+    エリアと行(列)の交差(54個)は予め算出しておき、
+    交差とその残り(交差以外の枡)の位置マスクで数字毎に判定する
+
     Args:
         wk (AnalyzeWk): ワーク
         how_anlz_list (List[HowToAnalyze]): 解析方法
@@ -40,140 +77,110 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
         bool: エラーの場合にFalse
     """
 
-    for area in wk.flame.area_list:
-        memo_squ_dict: Dict[int, List[Square]] = dict()
-        # memo_squ_dict = dict()
-        # エリアからメモを抽出
-        for squ in area.squ_list:
-            for memo in squ.memo_val_list:
-                if memo not in memo_squ_dict:
-                    memo_squ_dict[memo] = list()
-                memo_squ_dict[memo].append(squ)
-
-        for memo, squ_list in memo_squ_dict.items():
-            # ロックされた候補法の性質上、対象となる枡は2個または3個のみ
-            if len(squ_list) == 2 or len(squ_list) == 3:
-                pass
-            else:
-                continue
-
-            # 対象となる領域ってある？
-            target_region: Region = _target_region(squ_list)
-            if target_region is None:
-                continue
-
-            # 変更対象枡を抽出
-            change_squ_list: List[Square] = _find_change_squ(
-                wk, memo, target_region, squ_list)
-
-            for change_squ in change_squ_list:
-
-                # メモ除外
-                change_squ.memo_val_list.remove(memo)
-
-                # 解析方法生成
-                how_anlz: HowToAnalyze = HowToAnalyze(
-                    Method.LOCKED_CANDIDATES)
-                how_anlz.region = target_region
-                how_anlz.changed_squ = change_squ
-                how_anlz.remove_memo_list.append(memo)
-                how_anlz.trigger_squ_list.extend(squ_list)
-                how_anlz.msg = MsgFactory.how_to_locked_candidates(how_anlz)
-
-                how_anlz_list.append(how_anlz)
+    # エリア -> 行(列)
+    for unit_no in AREA_UNIT_NO:
+        # 前回解析結果なし以降に変更がないエリアは対象外
+        # [補足]
+        # メモは減る一方のため、エリア外の枡が変更されても対象は増えない
+        if not wk.is_dirty_unit(Method.LOCKED_CANDIDATES, unit_no):
+            continue
+        _analyze_intersection(wk, how_anlz_list, unit_no, True)
 
         # メモしか変更していないため、ループを継続すると別エリアの処理でおかしく可能性がある
         if len(how_anlz_list) > 1:
             return True
 
-    return True
-
-
-def _target_region(
-    squ_list: List[Square]
-) -> Region:
-    """与えられた枡リストがロックされた候補法の対象となるか判定
-
-    Args:
-        squ_list (List[Square]): メモ(枡)リスト
-
-    Returns:
-        Region: 行または列(対象外の場合はNone)
-    """
-
-    for region in [Region.ROW, Region.CLM]:
-        if _is_target(region, squ_list):
-            # [補足]
-            # 行(列)で対象になったら列(行)では対象にならない
-            # ⇒returnしてOK
-            return region
-
-    return None
-
-
-def _is_target(
-    region: Region,
-    squ_list: List[Square]
-) -> bool:
-    """与えられた枡リストがロックされた候補法の対象となるか判定
-
-    Args:
-        region (Region): 領域(行または列)
-        squ_list (List[Square]): メモ(枡)リスト
-
-    Returns:
-        bool: 対象の場合にTrue
-    """
-
-    wk_pos: int = None
-    for squ in squ_list:
-        loop_pos: int
-        if region == Region.ROW:
-            loop_pos = squ.row
-        else:
-            loop_pos = squ.clm
-        if wk_pos is None:
-            wk_pos = loop_pos
+    # 行(列) -> エリア
+    for unit_no in itertools.chain(ROW_UNIT_NO, CLM_UNIT_NO):
+        # 前回解析結果なし以降に変更がない行(列)は対象外
+        # [補足]
+        # メモは減る一方のため、行(列)外の枡が変更されても対象は増えない
+        if not wk.is_dirty_unit(Method.LOCKED_CANDIDATES, unit_no):
+            continue
+        _analyze_intersection(wk, how_anlz_list, unit_no, False)
 
-        if wk_pos != loop_pos:
-            return False
+        # メモしか変更していないため、ループを継続すると別の行(列)の処理でおかしく可能性がある
+        if len(how_anlz_list) > 1:
+            return True
 
     return True
 
 
-def _find_change_squ(
+def _analyze_intersection(
     wk: AnalyzeWk,
-    memo: int,
-    target_region: Region,
-    squ_list: List[Square]
-) -> List[Square]:
-    """変更対象枡の検索
+    how_anlz_list: List[HowToAnalyze],
+    unit_no: int,
+    pointing: bool
+) -> None:
+    """交差の解析
+
+    基準の領域内で数字が交差にしか存在しない場合、
+    対象の領域の交差以外の枡のメモから数字を除外する
+    ・エリア -> 行(列)(pointing=True)
+      基準はエリア、対象は行(列)
+    ・行(列) -> エリア(pointing=False)
+      基準は行(列)、対象はエリア
 
     Args:
         wk (AnalyzeWk): ワーク
-        memo (int): メモ
-        target_region (Region): 領域
-        squ_list (List[Square]): 枡リスト
-
-    Returns:
-        List[Square]: 変更対象枡
-
+        how_anlz_list (List[HowToAnalyze]): 解析方法
+        unit_no (int): 基準の領域番号
+        pointing (bool): エリア -> 行(列)の場合にTrue
     """
-    change_squ_list: List[Square] = list()
-    check_squ_list: List[Square]
-    # 同一行(列)の枡を取得
-    if target_region == Region.ROW:
-        check_squ_list = wk.row_dict[squ_list[0].row]
-    else:
-        check_squ_list = wk.clm_dict[squ_list[0].clm]
-
-    for check_squ in check_squ_list:
-        # 別エリアの枡を対象に
-        if check_squ in squ_list:
-            continue
-        # メモに数字が含まれているか？
-        if memo not in check_squ.memo_val_list:
+    # メモ -> 基準の領域内の位置マスク
+    pos_list: List[int] = wk.unit_memo_pos_list[unit_no]
+    inter_no_list: Tuple[int, ...] = _INTER_NO_LIST[0 if pointing else 1]
+
+    # 交差にしか存在しないメモを出現順に処理
+    # (出現順は領域内の枡の順、同一枡内はメモの昇順)
+    # (添字0は未使用で位置マスク0のため、対象外となる)
+    memo_list: List[int] = [
+        memo for memo, pos_mask in enumerate(pos_list)
+        if inter_no_list[pos_mask] >= 0]
+    if len(memo_list) > 1:
+        memo_list.sort(key=lambda memo: (LOWEST_MEMO[pos_list[memo]], memo))
+    for memo in memo_list:
+        pos_mask: int = pos_list[memo]
+        area_no, line_no, area_mask, line_mask =\
+            UNIT_INTERSECTION_LIST[unit_no][inter_no_list[pos_mask]]
+
+        # 対象の領域番号、対象の領域の交差の位置マスク
+        target_no: int
+        target_mask: int
+        if pointing:
+            target_no, target_mask = line_no, line_mask
+        else:
+            target_no, target_mask = area_no, area_mask
+
+        # 対象の領域の交差以外で数字が存在する位置
+        # (存在しない場合は変更対象なし)
+        change_mask: int =\
+            wk.unit_memo_pos_list[target_no][memo] & ~target_mask
+        if change_mask == 0:
             continue
-        change_squ_list.append(check_squ)
 
-    return change_squ_list
+        region: Region = Region.ROW if line_no in ROW_UNIT_NO\
+            else Region.CLM
+        idx_list: List[int] = [
+            UNIT_LIST[unit_no][pos] for pos in BIT_POS_LIST[pos_mask]]
+        for pos in BIT_POS_LIST[change_mask]:
+            change_idx: int = UNIT_LIST[target_no][pos]
+
+            # メモ除外
+            wk.remove_memo(change_idx, MEMO_BIT[memo])
+
+            # 解析方法生成
+            how_anlz: HowToAnalyze = HowToAnalyze(
+                Method.LOCKED_CANDIDATES)
+            how_anlz.region = region
+            how_anlz.changed_idx = change_idx
+            how_anlz.remove_memo_list.append(memo)
+            how_anlz.trigger_idx_list.extend(idx_list)
+            if pointing:
+                how_anlz.msg = MsgFactory.how_to_locked_candidates(
+                    how_anlz)
+            else:
+                how_anlz.msg = MsgFactory.how_to_locked_candidates_claiming(
+                    how_anlz)
+
+            how_anlz_list.append(how_anlz)
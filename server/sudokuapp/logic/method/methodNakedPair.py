@@ -1,14 +1,15 @@
 """ネイキッドペア
 """
-from typing import List, Set
+from typing import List, Tuple
 
 from sudokuapp.const.Method import Method
 from sudokuapp.const.Region import Region
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
-from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import AREA_UNIT_NO, CLM_UNIT_NO, ROW_UNIT_NO
+from sudokuapp.util.MemoMask import (BIT_CNT, MEMO_BIT, MEMO_LIST,
+                                     iter_mask_subset)
 from sudokuapp.util.MsgFactory import MsgFactory
-from sudokuapp.util.SudokuUtil import SudokuUtil
 
 
 def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
@@ -56,8 +57,8 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
     """
 
     # エリアでネイキッドペア解析
-    for area in wk.flame.area_list:
-        _analyze_naked_pair(wk, how_anlz_list, Region.AREA, area.squ_list)
+    for unit_no in AREA_UNIT_NO:
+        _analyze_naked_pair(wk, how_anlz_list, Region.AREA, unit_no)
     # 同一領域の解析を実施した後に、他領域の解析を行うと値の確定を実施してないため
     # 矛盾が発生する可能性がある。
     # (逆に言うと自領域内であれば続けて解析して問題ない)
@@ -65,8 +66,8 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
         return True
 
     # 行でネイキッドペア解析
-    for squ_list in wk.row_dict.values():
-        _analyze_naked_pair(wk, how_anlz_list, Region.ROW, squ_list)
+    for unit_no in ROW_UNIT_NO:
+        _analyze_naked_pair(wk, how_anlz_list, Region.ROW, unit_no)
     # 同一領域の解析を実施した後に、他領域の解析を行うと値の確定を実施してないため
     # 矛盾が発生する可能性がある。
     # (逆に言うと自領域内であれば続けて解析して問題ない)
@@ -74,8 +75,8 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
         return True
 
     # 列でネイキッドペア解析
-    for squ_list in wk.clm_dict.values():
-        _analyze_naked_pair(wk, how_anlz_list, Region.CLM, squ_list)
+    for unit_no in CLM_UNIT_NO:
+        _analyze_naked_pair(wk, how_anlz_list, Region.CLM, unit_no)
 
     return True
 
@@ -84,7 +85,7 @@ def _analyze_naked_pair(
     wk: AnalyzeWk,
     how_anlz_list: List[HowToAnalyze],
     region: Region,
-    squ_list: List[Square]
+    unit_no: int
 ) -> None:
     """ネイキッドペア解析
 
@@ -92,11 +93,16 @@ def _analyze_naked_pair(
         wk (AnalyzeWk): ワーク
         how_anlz_list (List[HowToAnalyze]): 解析方法
         region (Region): 領域
+        unit_no (int): 領域番号
     """
+    # 前回解析結果なし以降に変更がない領域は対象外
+    if not wk.is_dirty_unit(Method.NAKED_PAIR, unit_no):
+        return
+    memo_arr = wk.flame.board.memo_arr
 
-    # 未確定枡を取得
-    unfixed_list: List[Square] = SudokuUtil.find_unfixed_squ_from_region(
-        squ_list)
+    # 未確定枡(枡番号)を取得
+    # (領域の枡番号順)
+    unfixed_list: List[int] = sorted(wk.unit_unfixed_list[unit_no])
 
     # 対象領域の全ての枡が確定している
     if len(unfixed_list) == 0:
@@ -107,6 +113,20 @@ def _analyze_naked_pair(
     find_pair_cnt: int = 8
     if Method.NAKED_PAIR in wk.limit_method_list:
         find_pair_cnt = 3
+
+    # 隠れペアを利用する場合、隠れペアで見つかるペア数は対象外とする
+    # k個のネイキッドペアの残りの枡は(未確定枡数-k)個の隠れペアになるため、
+    # 隠れペアで見つかる(隠れ数が最大隠れ数以下となる)ペア数のうち、
+    # 未確定枡数の半分を超える場合は隠れペアの方が簡単な説明になる
+    # (隠れペアを利用しない場合は全てのペア数を対象とする)
+    if Method.HIDDEN_PAIR in wk.use_method_list:
+        max_hidden_num: int = 7
+        if Method.HIDDEN_PAIR in wk.limit_method_list:
+            max_hidden_num = 3
+        find_pair_cnt = min(
+            find_pair_cnt,
+            max(len(unfixed_list) // 2,
+                len(unfixed_list) - max_hidden_num - 1))
     for naked_num in range(2, find_pair_cnt + 1):
 
         # 未確定枡数-1よりネイキッド数の方が大きくなったら処理終了
@@ -116,29 +136,22 @@ def _analyze_naked_pair(
         if len(unfixed_list) - 1 <= naked_num:
             return
 
-        # ペア可能リストを算出
-        can_pair_list = list()
-        for unfixed_squ in unfixed_list:
-            if len(unfixed_squ.memo_val_list) > naked_num:
-                continue
-
-            # naked_num=3の場合
-            # +[1]--------------------------------------+
-            # | 1:1          1:2        1:3             |
-            # | m=[N,M,O](@) m=[N,P](*) ?               |
-            # | 2:1          2:2        2:3             |
-            # | m=[M,O]($)   m=[M,Q](*) ?               |
-            # | 3:1          3:2        3:3             |
-            # | m=[N,M](#)   m=[O,R](*) m=[N,M,O,R,Q,S] |
-            # +[4]--------------------------------------+
-            # @枡、$枡、#枡、*枡3個を抽出
-            # 1:1 m=[N,M,O](@)
-            # 1:2 m=[N,P](*)
-            # 2:1 m=[M,O]($)
-            # 2:2 m=[M,Q](*)
-            # 3:1 m=[N,M](#)
-            # 3:2 m=[O,R](*)
-            can_pair_list.append(unfixed_squ)
+        # ペア可能リスト(枡番号、メモマスク)を算出
+        # (メモ数がネイキッド数以下の枡)
+        # naked_num=3の場合
+        # +[1]--------------------------------------+
+        # | 1:1          1:2        1:3             |
+        # | m=[N,M,O](@) m=[N,P](*) ?               |
+        # | 2:1          2:2        2:3             |
+        # | m=[M,O]($)   m=[M,Q](*) ?               |
+        # | 3:1          3:2        3:3             |
+        # | m=[N,M](#)   m=[O,R](*) m=[N,M,O,R,Q,S] |
+        # +[4]--------------------------------------+
+        # @枡、$枡、#枡、*枡3個を抽出
+        can_pair_list: List[Tuple[int, int]] = [
+            (unfixed_idx, memo_arr[unfixed_idx])
+            for unfixed_idx in unfixed_list
+            if BIT_CNT[memo_arr[unfixed_idx]] <= naked_num]
 
         # ペア可能リストがペア数より小さい場合は対象外
         # 次のペア数を調べる
@@ -146,70 +159,44 @@ def _analyze_naked_pair(
             continue
 
         # ペアを見つける
+        # ペア可能リストから枡番号順に組み合わせを作りながらメモマスクのORを取り、
+        # メモ数がネイキッド数を超えた時点で打ち切る
         # 例に当てはめると
         # 1:1 m=[N,M,O](@)
-        # 1:2 m=[N,P](*)
         # 2:1 m=[M,O]($)
-        # 2:2 m=[M,Q](*)
         # 3:1 m=[N,M](#)
-        # 3:2 m=[O,R](*)
-        # から
-        # 1:1 m=[N,M,O](@)
-        # 2:1 m=[M,O]($)
-        # 3:1 m=[N,M](#)
-        # を見つける
-        for pivot_squ in can_pair_list[:]:
-            pivot_pair: Set[int] = set(pivot_squ.memo_val_list)
-            for compare_squ in can_pair_list[:]:
-                if pivot_squ == compare_squ:
-                    continue
-                pivot_pair = pivot_pair.union(set(compare_squ.memo_val_list))
-                if len(pivot_pair) > naked_num:
-                    break
-            if len(pivot_pair) > naked_num:
-                can_pair_list.remove(pivot_squ)
-
-        # ネイキッド数≒枡数は対象外
-        if len(can_pair_list) != naked_num:
-            continue
-
-        # ペア発見!
-        pair_set: Set[int] = set()
-        for squ in can_pair_list:
-            pair_set = pair_set.union(squ.memo_val_list)
-        pair_list: List[int] = list(pair_set)
-        pair_list.sort()
-
-        # 変更枡抽出
-        change_squ_list: List[Square] = list()
-        for squ in unfixed_list:
-            if squ in can_pair_list:
+        # の組み合わせがメモ数3(N、M、O)となる
+        for pair_item_list, pair_mask in iter_mask_subset(
+                can_pair_list, naked_num):
+            pair_idx_list: List[int] = [idx for idx, _ in pair_item_list]
+
+            # 変更枡抽出
+            change_idx_list: List[int] = [
+                idx for idx in unfixed_list
+                if memo_arr[idx] & pair_mask and idx not in pair_idx_list]
+
+            # ペアは見つかったが、変更枡が存在しない
+            # ⇒次の組み合わせをチェック
+            if len(change_idx_list) == 0:
                 continue
-            for memo in squ.memo_val_list:
-                if memo in pair_list:
-                    change_squ_list.append(squ)
-                    break
-
-        # ペアは見つかったが、変更枡が存在しない
-        if len(change_squ_list) == 0:
-            continue
 
-        for change_squ in change_squ_list:
-            for loop_memo in pair_list:
-                if loop_memo not in change_squ.memo_val_list:
-                    continue
-
-                # メモを除外
-                change_squ.memo_val_list.remove(loop_memo)
-
-                # 解析方法生成
-                how_anlz: HowToAnalyze = HowToAnalyze(
-                    Method.NAKED_PAIR)
-                how_anlz.region = region
-                how_anlz.changed_squ = change_squ
-                how_anlz.remove_memo_list.append(loop_memo)
-                how_anlz.trigger_squ_list.extend(can_pair_list)
-                how_anlz.msg = MsgFactory.how_to_naked_pair(
-                    how_anlz, pair_list)
-
-                how_anlz_list.append(how_anlz)
+            # ペア発見!
+            pair_list: List[int] = list(MEMO_LIST[pair_mask])
+            for change_idx in change_idx_list:
+                for loop_memo in MEMO_LIST[memo_arr[change_idx] & pair_mask]:
+
+                    # メモを除外
+                    wk.remove_memo(change_idx, MEMO_BIT[loop_memo])
+
+                    # 解析方法生成
+                    how_anlz: HowToAnalyze = HowToAnalyze(
+                        Method.NAKED_PAIR)
+                    how_anlz.region = region
+                    how_anlz.changed_idx = change_idx
+                    how_anlz.remove_memo_list.append(loop_memo)
+                    how_anlz.trigger_idx_list.extend(pair_idx_list)
+                    how_anlz.msg = MsgFactory.how_to_naked_pair(
+                        how_anlz, pair_list)
+
+                    how_anlz_list.append(how_anlz)
+            break
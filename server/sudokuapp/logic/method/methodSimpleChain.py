@@ -1,19 +1,14 @@
 """シンプルチェーン
 """
-import copy
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
-from sudokuapp.const.LinkType import LinkType
 from sudokuapp.const.Method import Method
-from sudokuapp.const.Region import Region
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
-from sudokuapp.data.Chain import Chain
-from sudokuapp.data.ChainNetwork import ChainNetwork
-from sudokuapp.data.ChainNetworkRef import ChainNetworkRef
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
-from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import (AREA_ORDER_IDX, CLM_OF, ROW_OF,
+                                      UNIT_LIST, cnv_row_clm_to_idx)
+from sudokuapp.util.MemoMask import BIT_CNT, BIT_POS_LIST, MEMO_BIT
 from sudokuapp.util.MsgFactory import MsgFactory
-from sudokuapp.util.SudokuUtil import SudokuUtil
 
 
 def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
@@ -102,47 +97,42 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
         bool: エラーの場合にFalse
     """
 
+    memo_arr = wk.flame.board.memo_arr
     for loop_memo in range(1, 10):
-        # チェーンを作成
-        all_chain_list: List[List[Chain]] =\
-            _create_simple_chain(wk, loop_memo)
-        for chain_list in all_chain_list:
-            first_squ = chain_list[0].squ
-            last_squ = chain_list[len(chain_list) - 1].squ
-
-            # 交差枡取得
-            cross_squ_list: List[Square] = SudokuUtil.find_cross_squ(
-                wk, first_squ, last_squ)
-
-            # 交差枡が変更対象かどうか判定
-            change_squ_list: List[Square] = list()
-            for cross_squ in cross_squ_list:
-                # 未確定かつメモが存在する枡が対象となる
-                if cross_squ.get_fixed_val() is None and\
-                        loop_memo in cross_squ.memo_val_list:
-                    change_squ_list.append(cross_squ)
+        # 前回解析結果なし以降に変更がないメモは対象外
+        if not wk.is_dirty_memo(Method.SIMPLE_CHAIN, loop_memo):
+            continue
+        memo_bit: int = MEMO_BIT[loop_memo]
+
+        # チェーンを短い順に探し、交差枡にメモが存在するチェーンが見つかったら終了
+        for chain_idx_list in _iter_simple_chain(wk, loop_memo):
+            first_idx: int = chain_idx_list[0]
+            last_idx: int = chain_idx_list[-1]
+
+            # 交差枡のうち、メモが存在する枡が変更対象となる
+            # (確定枡のメモは空のため、確定判定は不要)
+            change_idx_list: List[int] = [
+                cross_idx for cross_idx in (
+                    cnv_row_clm_to_idx(ROW_OF[first_idx], CLM_OF[last_idx]),
+                    cnv_row_clm_to_idx(ROW_OF[last_idx], CLM_OF[first_idx]))
+                if memo_arr[cross_idx] & memo_bit]
 
             # 対象なし
             # ⇒次のチェーンをチェック
-            if len(change_squ_list) == 0:
+            if len(change_idx_list) == 0:
                 continue
 
-            # 対象あり
-            chain_squ_list: List[Square] = list()
-            for chain in chain_list:
-                chain_squ_list.append(chain.squ)
-
-            for change_squ in change_squ_list:
+            for change_idx in change_idx_list:
 
                 # メモを除外
-                change_squ.memo_val_list.remove(loop_memo)
+                wk.remove_memo(change_idx, memo_bit)
 
                 # 解析方法生成
                 how_anlz: HowToAnalyze = HowToAnalyze(Method.SIMPLE_CHAIN)
-                how_anlz.changed_squ = change_squ
+                how_anlz.changed_idx = change_idx
                 how_anlz.remove_memo_list.append(loop_memo)
-                how_anlz.trigger_squ_list.extend(chain_squ_list)
-                how_anlz.chain_squ_list.extend(chain_squ_list)
+                how_anlz.trigger_idx_list.extend(chain_idx_list)
+                how_anlz.chain_idx_list.extend(chain_idx_list)
                 how_anlz.msg = MsgFactory.how_to_simple_chain(how_anlz)
 
                 how_anlz_list.append(how_anlz)
@@ -152,530 +142,110 @@ def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
     return True
 
 
-def _create_simple_chain(
-    wk: AnalyzeWk,
-    loop_memo: int
-) -> List[List[Chain]]:
-    """シンプルチェーン作成
+def _iter_simple_chain(wk: AnalyzeWk, loop_memo: int) -> Iterator[List[int]]:
+    """シンプルチェーンを短い順に生成
 
-    シンプルチェーンの条件を満たすチェーンを作成
+    数字が入りうる枡をノード、同一領域の枡同士をリンクとしたグラフを
+    全ての開始枡(強リンクを持つ枡)から同時に幅優先で探索する
+    ・奇数番目のリンクは強リンク、偶数番目のリンクは強リンク、弱リンクを問わない
+    ・同じ開始枡から同じ枡に同じ偶奇で到達した場合は、後から到達した方を打ち切る
+      (より短いチェーンで到達済みのため)
+    ・チェーン内で同じ枡は通らない
+    枡数が偶数(強リンクで終わる)で、最初と最後の枡が同一行、同一列にない
+    チェーンを生成する
+    (呼び出し元で交差枡にメモが存在するチェーンが見つかった時点で探索を打ち切る)
 
     Args:
         wk (AnalyzeWk): ワーク
         loop_memo (int): 数字
 
     Returns:
-        List[List[Chain]]: 全てのチェーンリスト
+        Iterator[List[int]]: チェーン(枡番号リスト)
     """
+    link_dict: Optional[Dict[int, List[Tuple[int, bool]]]] =\
+        _create_link(wk, loop_memo)
 
-    # 数字を含む枡を検索
-    # +[1]-------------------------+[2]-------------------------+[3]-------------------------+
-    # | 1:1      1:2      1:3      | 1:4      1:5      1:6      | 1:7      1:8      1:9      |
-    # | ?        ?        ?        | ?        ?        ?        | ?        ?        hint=N   |
-    # | 2:1      2:2      2:3      | 2:4      2:5      2:6      | 2:7      2:8      2:9      |
-    # | ?        ?        ?        | ?        ?        hint=N   | ?        ?        ?        |
-    # | 3:1      3:2      3:3      | 3:4      3:5      3:6      | 3:7      3:8      3:9      |
-    # | hint=N   ?        ?        | ?        ?        ?        | ?        ?        ?        |
-    # +[4]-------------------------+[5]-------------------------+[6]-------------------------+
-    # | 4:1      4:2      4:3      | 4:4      4:5(#)   4:6      | 4:7      4:8      4:9      |
-    # | ?        ?        m=[N,?]  | ?        m=[N,?]  ?        | ?        ?        ?        |
-    # | 5:1      5:2      5:3      | 5:4      5:5      5:6      | 5:7      5:8      5:9      |
-    # | ?        ?        ?        | ?        ?        ?        | hint=N   ?        ?        |
-    # | 6:1      6:2(*)   6:3      | 6:4(@)   6:5      6:6      | 6:7      6:8      6:9      |
-    # | ?        m=[N,?]  m=[N,?]  | m=[N,?]  ?        ?        | ?        ?        ?        |
-    # +[7]-------------------------+[8]-------------------------+[9]-------------------------+
-    # | 7:1      7:2      7:3      | 7:4      7:5      7:6      | 7:7      7:8      7:9      |
-    # | ?        m=[N,?]  m=[N,?]  | ?        ?        ?        | ?        ?        ?        |
-    # | 8:1      8:2      8:3      | 8:4      8:5      8:6      | 8:7      8:8      8:9      |
-    # | ?        ?        ?        | m=[N,?]  m=[N,?]  ?        | ?        hint=N   ?        |
-    # | 9:1      9:2(+)   9:3      | 9:4      9:5(!)   9:6      | 9:7      9:8      9:9      |
-    # | ?        m=[N,?]  ?        | ?        m=[N,?]  ?        | ?        ?        ?        |
-    # +----------------------------+----------------------------+----------------------------+
-    # 例に当てはめると以下のようになる
-    # memo_include_list=[4:3, 6:2(*), 6:3, 4:5(#), 6:4(@), 7:2, 7:3, 9:2(+), 8:4, 8:5, 9:5(!)]
-    # area_dict[4]=[4:3, 6:2(*), 6:3]
-    # ...
-    # row_dict[4]=[4:3, 4:5(#)]
-    # ...
-    # clm_dict[2]=[6:2(*), 7:2, 9:2(+)]
-    # ...
-
-    memo_include_list: List[Square] = list()
-    area_dict: Dict[int, List[Square]] = dict()
-    row_dict: Dict[int, List[Square]] = dict()
-    clm_dict: Dict[int, List[Square]] = dict()
-
-    for squ in wk.all_squ_list:
-        if loop_memo not in squ.memo_val_list:
-            continue
-        memo_include_list.append(squ)
-        # エリア単位にまとめる
-        if squ.area_id not in area_dict:
-            area_dict[squ.area_id] = list()
-        area_dict[squ.area_id].append(squ)
-
-        # 行単位にまとめる
-        if squ.row not in row_dict:
-            row_dict[squ.row] = list()
-        row_dict[squ.row].append(squ)
-
-        # 列単位にまとめる
-        if squ.clm not in clm_dict:
-            clm_dict[squ.clm] = list()
-        clm_dict[squ.clm].append(squ)
-
-    chainnet_list: List[ChainNetwork] = list()
-    chainnet_dict: Dict[Square, ChainNetwork] = dict()
-
-    # チェーンネットワークを作成
-    # 例に当てはめると
-    # memo_include_list=[4:3, 6:2(*), 6:3, 4:5(#), 6:4(@), 7:2, 7:3, 9:2(+), 8:4, 8:5, 9:5(!)]
-    # area_dict[4]=[4:3, 6:2(*), 6:3]
-    # ...
-    # row_dict[4]=[4:3, 4:5(#)]
-    # ...
-    # clm_dict[2]=[6:2(*), 7:2, 9:2(+)]
-    # ...
-    # を元にチェーンネットワークを作成
-    # chainnet
-    #     squ=4:3
-    #     ref_chainnet_list=[=弱= 6:2(*), =弱= 6:3, =強= 4:5(#), =弱= 7:3]
-    # chainnet
-    #     squ=6:2(*)
-    #     ref_chainnet_list=[=弱= 4:3, =弱= 6:3, =弱= 6:4(@), =弱= 7:2, =弱= 9:2(+)]
-    # ...
-    # chainnet
-    #     squ=4:5(#)
-    #     ref_chainnet_list=[=強= 4:3, =強= 6:4(@), =弱= 8:5, =弱= 9:5(!)]
-    # ...
-    for squ in memo_include_list:
-
-        chainnet: ChainNetwork
-        if squ in chainnet_dict:
-            chainnet = chainnet_dict[squ]
-        else:
-            chainnet = ChainNetwork(squ)
-            chainnet_dict[squ] = chainnet
-        chainnet_list.append(chainnet)
-
-        # コードが重複するのでエリア、行、列で処理をまとめる
-        for region in [Region.AREA, Region.ROW, Region.CLM]:
-            region_squ_list: List[Square]
-            if region == Region.AREA:
-                region_squ_list = area_dict[squ.area_id]
-            elif region == Region.ROW:
-                region_squ_list = row_dict[squ.row]
-            else:
-                region_squ_list = clm_dict[squ.clm]
-
-            # リンク種類判定
-            # ある領域に2つしかなければ強リンク、3つ以上あれば弱リンク
-            # [補足]
-            # 1つの場合はそもそもここに来る前に消去法で値が確定するはずなのでelseで判定
-            link_type: LinkType
-            if len(region_squ_list) == 2:
-                link_type = LinkType.STRONG
-            else:
-                link_type = LinkType.WEEK
-
-            for other_squ in region_squ_list:
-                if other_squ == squ:
+    # 強リンクがない
+    if link_dict is None:
+        return
+
+    # 探索中のチェーン(枡番号タプル)
+    # 開始枡は強リンクを持つ枡(エリア順)
+    frontier_list: List[Tuple[int, ...]] = [
+        (idx,) for idx in AREA_ORDER_IDX
+        if any(strong for _, strong in link_dict.get(idx, ()))]
+    # 到達済み(開始枡、枡、枡数の偶奇)
+    visited_set: Set[Tuple[int, int, int]] = {
+        (chain[0], chain[0], 1) for chain in frontier_list}
+
+    while frontier_list:
+        next_frontier_list: List[Tuple[int, ...]] = list()
+        for chain in frontier_list:
+            # 奇数番目のリンクは強リンクのみ
+            strong_only: bool = len(chain) % 2 == 1
+            for next_idx, strong in link_dict[chain[-1]]:
+                if strong_only and not strong:
                     continue
-                other_chainnet: ChainNetwork
-                if other_squ in chainnet_dict:
-                    other_chainnet = chainnet_dict[other_squ]
-                else:
-                    other_chainnet = ChainNetwork(other_squ)
-                    chainnet_dict[other_squ] = other_chainnet
-                chainnet.add_ref_chainnet(link_type, other_chainnet)
-
-    # 開始枡をなめながらざっくりとチェーンを作成
-    # 例に当てはめると
-    # chainnet
-    #     squ=4:3
-    #     ref_chainnet_list=[=弱= 6:2(*), =弱= 6:3, =強= 4:5(#), =弱= 7:3]
-    # chainnet
-    #     squ=6:2(*)
-    #     ref_chainnet_list=[=弱= 4:3, =弱= 6:3, =弱= 6:4(@), =弱= 7:2, =弱= 9:2(+)]
-    # ...
-    # chainnet
-    #     squ=4:5(#)
-    #     ref_chainnet_list=[=強= 4:3, =強= 6:4(@), =弱= 8:5, =弱= 9:5(!)]
-    # ...
-    # を元にチェーンリストを作成
-    # all_chain_list=[
-    #     4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 8:5
-    #     4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:2
-    #     4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:3
-    #     ...
-    #     6:4(@) =強= 4:5(#) =弱= 4:3
-    #     6:4(@) =強= 4:5(#) =弱= 8:5 =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:2
-    #     6:4(@) =強= 4:5(#) =弱= 8:5 =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:3
-    #     6:4(@) =強= 4:5(#) =弱= 9:5(!) =強= 9:2(+) =弱= 7:2
-    #     6:4(@) =強= 4:5(#) =弱= 9:5(!) =強= 9:2(+) =弱= 7:3
-    #     6:4(@) =強= 8:4 =強= 8:5
-    #     6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:2
-    #     6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:3
-    #     ...
-    #     9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =強= 4:5(#) =強= 4:3 =弱= 6:2(*)
-    #     9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =強= 4:5(#) =強= 4:3 =弱= 6:3
-    #     9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =弱= 6:2(*)
-    #     9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =弱= 6:3
-    #     9:2(+) =強= 9:5(!) =弱= 8:5
-    #     9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 4:3 =弱= 6:2(*)
-    #     9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 4:3 =弱= 6:3
-    #     9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@) =弱= 6:2(*)
-    #     9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@) =弱= 6:3
-    #     9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 8:5
-    #     ...
-    # ]
-    all_chain_list: List[List[Chain]] = list()
-    for chainnet in chainnet_list:
-        # チェーンネットワークに強リンクがあることが条件
-        is_strong_link: bool = False
-        for ref_chainnet in chainnet.ref_chainnet_list:
-            if ref_chainnet.link_type != LinkType.STRONG:
-                continue
-            is_strong_link = True
-            break
+                if next_idx in chain:
+                    continue
+                parity: int = (len(chain) + 1) % 2
+                if (chain[0], next_idx, parity) in visited_set:
+                    continue
+                visited_set.add((chain[0], next_idx, parity))
 
-        # 強リンクなし
-        if not is_strong_link:
-            continue
+                next_chain: Tuple[int, ...] = chain + (next_idx,)
+                next_frontier_list.append(next_chain)
 
-        current_chain_list: List[Chain] = list()
-        all_chain_list.append(current_chain_list)
-        current_chain_list.append(Chain(None, chainnet.squ))
-        # チェーンを(ざっくりと)作成
-        _create_chain_rough(
-            chainnet_dict, all_chain_list, current_chain_list)
-
-    # _create_chainだけだと対象外となるチェーンも含まれる。
-    # ここから更に絞り込む
-    _filter_chain(all_chain_list)
-
-    return all_chain_list
-
-
-def _create_chain_rough(
-    chainnet_dict: Dict[Square, ChainNetwork],
-    all_chain_list: List[List[Chain]],
-    current_chain_list: List[Chain]
-) -> None:
-    """チェーン作成
-
-    再起呼出を繰り返しながらチェーンを作成
-
-    例に当てはめると
-    chainnet
-        squ=4:3
-        ref_chainnet_list=[=弱= 6:2(*), =弱= 6:3, =強= 4:5(#), =弱= 7:3]
-    chainnet
-        squ=6:2(*)
-        ref_chainnet_list=[=弱= 4:3, =弱= 6:3, =弱= 6:4(@), =弱= 7:2, =弱= 9:2(+)]
-    ...
-    chainnet
-        squ=4:5(#)
-        ref_chainnet_list=[=強= 4:3, =強= 6:4(@), =弱= 8:5, =弱= 9:5(!)]
-    ...
-    current_chain_list
-        4:3(呼び出し元から初期設定で何かしらのチェーンが設定される想定)
-
-    上記の状態ではじめに呼ばれたとして、まずは、、、
-    チェーンネットワークから4:3の次のチェーンネットワークを検索し以下のような状態にする
-    current_chain_list
-        4:3 =強= 4:5(#)
-    ※強弱強弱強...のルールにより…
-      1回目の呼出のため強リンクでつながっているチェーンネットワークをチェーンリストに追加する
-
-    更に再起呼出を行い、4:5(#)の次のチェーンネットワークを検索し以下のような状態にする
-    current_chain_list
-        4:3 =強= 4:5(#) =強= 4:3
-    branch_chain_list#1
-        4:3 =強= 4:5(#) =強= 6:4(@)
-    branch_chain_list#2
-        4:3 =強= 4:5(#) =弱= 8:5
-    branch_chain_list#3
-        4:3 =強= 4:5(#) =弱= 9:5(!)
-    ※強弱強弱強...のルールにより…
-      2回目の呼出のため弱リンク、強リンクを問わずに何かしらのつながりがあるチェーンネットワーク
-      をチェーンリストに追加する
-    ※次のチェーンネットワークが複数ある場合は枝分かれさせる
-
-    上記の手順をチェーンネットワークがなくなるか、チェーンリストにに含まれるチェーンネットワーク
-    が発見されるまで繰り返す。
+                # 枡数が偶数(強リンクで終わる)、4以上で、
+                # 交差枡算出のため最初と最後の枡が同一行、同一列にないチェーン
+                if len(next_chain) >= 4 and parity == 0 and\
+                        ROW_OF[chain[0]] != ROW_OF[next_idx] and\
+                        CLM_OF[chain[0]] != CLM_OF[next_idx]:
+                    yield list(next_chain)
+        frontier_list = next_frontier_list
 
-    Args:
-        chainnet_dict (Dict[Square, ChainNetwork]): チェーンネットワーク辞書
-        all_chain_list (List[List[Chain]]): 全てのチェーンリスト
-        current_chain_list (List[Chain]): カレントチェーンリスト
-    """
 
-    # 最後のつながりと枡を抽出
-    last_chain: Chain = current_chain_list[len(current_chain_list) - 1]
-    last_chainnet: ChainNetwork = chainnet_dict[last_chain.squ]
-
-    # 次のチェーンネットワークを検索
-    # 枡 =強= 枡 =弱= 枡 =強= 枡 =弱= 枡 =強= 枡 ...
-    # でつながる
-    # ※弱リンクは強リンクでも可能
-    # current_chain_listが奇数個の場合は強リンクを探し
-    # 偶数個の場合は弱リンク(または強リンク)を探す
-    chainnet_list: List[ChainNetworkRef]
-    if len(current_chain_list) % 2 == 1:
-        chainnet_list = list(filter(
-            lambda ref_chainnet: ref_chainnet.link_type == LinkType.STRONG,
-            last_chainnet.ref_chainnet_list
-        ))
-    else:
-        chainnet_list = last_chainnet.ref_chainnet_list
-
-    # 参照先なし
-    if len(chainnet_list) == 0:
-        return
-
-    # ブランチ作成用にカレントチェーンをコピー
-    current_chain_copy: List[Chain] =\
-        copy.copy(current_chain_list)
-    link_cnt: int = 0
-    for ref_chainnet in chainnet_list:
-        link_type: LinkType = ref_chainnet.link_type
-        chainnet: ChainNetwork = ref_chainnet.chainnet
-        # 無限にチェーンがつながってしまう可能性があるため、
-        # カレントチェーンに重複があった場合はスキップ
-        dup = False
-        for chain in current_chain_list:
-            if chain.squ == chainnet.squ:
-                dup = True
-                break
-        if dup:
-            continue
+def _create_link(
+    wk: AnalyzeWk,
+    loop_memo: int
+) -> Optional[Dict[int, List[Tuple[int, bool]]]]:
+    """リンクを作成
 
-        chain: Chain = Chain(link_type, chainnet.squ)
-        if link_cnt == 0:
-            current_chain_list.append(chain)
-            # 再起呼出
-            _create_chain_rough(
-                chainnet_dict, all_chain_list, current_chain_list)
-
-        else:
-            # ブランチチェーン作成
-            branch_chain_list: List[Chain] = copy.copy(current_chain_copy)
-            all_chain_list.append(branch_chain_list)
-            branch_chain_list.append(chain)
-            # 再起呼出
-            _create_chain_rough(
-                chainnet_dict, all_chain_list, branch_chain_list)
-        link_cnt += 1
-
-
-def _filter_chain(
-    all_chain_list: List[List[Chain]]
-) -> None:
-    """シンプルチェーンの成立条件に一致しないチェーンを除去
-
-    ・最初の枡は強リンクでつながっている必要がある
-      (_create_chainで対応しているため本処理では除去不要)
-    ・最後の枡は強リンクであつながっている必要がある
-    ・交差枡算出のため、枡数は最低でも3つ必要
-    ・枡数は偶数である必要がある
-    ・交差枡算出のため、最初と最後の枡が同一行または同一列にある場合は対象外
+    同一領域(エリア、行、列)で数字が入りうる枡同士をリンクとする
+    領域に数字が入りうる枡が2つしかない場合は強リンク、3つ以上ある場合は弱リンク
+    (2つの枡が複数の領域でリンクする場合は、いずれかが強リンクなら強リンク)
+    ※強リンク、弱リンクの解説はLinkType.pyのdocstringを参照
 
     Args:
-        all_chain_list (List[List[Chain]]): 全てのチェーンリスト
-    """
-
-    chain_dict_for_dup: Dict[str, List[Chain]] = dict()
-    for chain_list in all_chain_list[:]:
-
-        # シンプルチェーンの最後の枡は強リンクである必要がある
-        # ⇒弱リンクを除去していく
-        # 例に当てはめると
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 8:5
-        #                                      ^^^^^^^^^ <-除去
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:2
-        #                                                              ^^^^^^^^ <-除去
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:3
-        #                                                              ^^^^^^^^ <-除去
-        # ...
-        # 6:4(@) =強= 4:5(#) =弱= 4:3
-        #                    ^^^^^^^^ <-除去
-        # 6:4(@) =強= 4:5(#) =弱= 8:5 =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:2
-        #                                                              ^^^^^^^^ <-除去
-        # 6:4(@) =強= 4:5(#) =弱= 8:5 =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:3
-        #                                                              ^^^^^^^^ <-除去
-        # 6:4(@) =強= 4:5(#) =弱= 9:5(!) =強= 9:2(+) =弱= 7:2
-        #                                            ^^^^^^^^ <-除去
-        # 6:4(@) =強= 4:5(#) =弱= 9:5(!) =強= 9:2(+) =弱= 7:3
-        #                                            ^^^^^^^^ <-除去
-        # 6:4(@) =強= 8:4 =強= 8:5
-        # 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:2
-        #                                         ^^^^^^^^ <-除去
-        # 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+) =弱= 7:3
-        #                                         ^^^^^^^^ <-除去
-        # ...
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =強= 4:5(#) =強= 4:3 =弱= 6:2(*)
-        #                                                              ^^^^^^^^ <-除去
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =強= 4:5(#) =強= 4:3 =弱= 6:3
-        #                                                              ^^^^^^^^ <-除去
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =弱= 6:2(*)
-        #                                         ^^^^^^^^^^^ <-除去
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =弱= 6:3
-        #                                         ^^^^^^^^ <-除去
-        # 9:2(+) =強= 9:5(!) =弱= 8:5
-        #                    ^^^^^^^^ <-除去
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 4:3 =弱= 6:2(*)
-        #                                         ^^^^^^^^^^^ <-除去
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 4:3 =弱= 6:3
-        #                                         ^^^^^^^^ <-除去
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@) =弱= 6:2(*)
-        #                                            ^^^^^^^^^^^ <-除去
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@) =弱= 6:3
-        #                                            ^^^^^^^^ <-除去
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 8:5
-        #                                                     ^^^^^^^^ <-除去
-        # ...
-        for chain in reversed(chain_list):
-            if chain.link_type == LinkType.STRONG:
-                break
-            chain_list.remove(chain)
-
-        # ・交差枡算出のため、枡数は最低でも3つ必要
-        # ・枡数は偶数である必要がある
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # ...
-        # 6:4(@) =強= 4:5(#)
-        # ^^^^^^^^^^^^^^^^^^ <- 枡数が3以下のため除去
-        # 6:4(@) =強= 4:5(#) =弱= 8:5 =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # 6:4(@) =強= 4:5(#) =弱= 8:5 =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # 6:4(@) =強= 4:5(#) =弱= 9:5(!) =強= 9:2(+)
-        # 6:4(@) =強= 4:5(#) =弱= 9:5(!) =強= 9:2(+)
-        # 6:4(@) =強= 8:4 =強= 8:5
-        # ^^^^^^^^^^^^^^^^^^^^^^^^ <- 枡数が偶数個でないため除去
-        # 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # ...
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =強= 4:5(#) =強= 4:3
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =強= 4:5(#) =強= 4:3
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@)
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@)
-        # 9:2(+) =強= 9:5(!)
-        # ^^^^^^^^^^^^^^^^^^ <- 枡数が3以下のため除去
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 4:3
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 4:3
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@)
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@)
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@) =強= 8:4
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 枡数が偶数個でないため除去
-        if len(chain_list) % 2 != 0 or len(chain_list) < 3:
-            all_chain_list.remove(chain_list)
-            continue
-
-        # ・交差枡算出のため、最初と最後の枡が同一行または同一列にある場合は対象外
-        first_squ = chain_list[0].squ
-        last_squ = chain_list[len(chain_list) - 1].squ
-        if first_squ.row == last_squ.row or\
-                first_squ.clm == last_squ.clm:
-            all_chain_list.remove(chain_list)
-            continue
+        wk (AnalyzeWk): ワーク
+        loop_memo (int): 数字
 
-        # 弱リンクを除外したことによってチェーンが重複する可能性がある
-        # ⇒重複したチェーンを除外
-        # でも良いがそもそも、、
-        # 最初と最後の枡が同じであればどのようなチェーンを形成していようと交差枡は同じになる。
-        # ⇒
-        # 最初と最後の枡の組み合わせが同じであれば同一チェーンとみなして問題ない
-        # また、重複があったタイミングでチェーン数が短い方を残す
-        # (短い方が画面で見やすいため)
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4
-        # ⇒
-        #   chain_dict_for_dup[(4:3・8:4)] = 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # ⇒
-        #   chain_dict_for_dup[(4:3・8:4)] = 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4
-        #   chain_dict_for_dup[(4:3・9:2(+))] = 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 4:3・9:2(+)の組み合わせ
-        #                                                                 が存在するため除去
-        # ...
-        # 6:4(@) =強= 4:5(#) =弱= 8:5 =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # ⇒
-        #   chain_dict_for_dup[(4:3・8:4)] = 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4
-        #   chain_dict_for_dup[(4:3・9:2(+))] = 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        #   chain_dict_for_dup[(6:4・9:2(+))] = 6:4(@) =強= 4:5(#) =弱= 8:5 =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # 6:4(@) =強= 4:5(#) =弱= 8:5 =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 6:4(@)・9:2(+)の組み合わせ
-        #                                                                 が存在するため除去
-        # 6:4(@) =強= 4:5(#) =弱= 9:5(!) =強= 9:2(+)
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 6:4(@)・9:2(+)の組み合わせ
-        #                                               が存在するが、元のチェーンリストよりこちらの
-        #                                               方が短いためこちらのチェーンリストで上書き
-        # ⇒
-        #   chain_dict_for_dup[(4:3・8:4)] = 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4
-        #   chain_dict_for_dup[(4:3・9:2(+))] = 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        #   chain_dict_for_dup[(6:4・9:2(+))] = 6:4(@) =強= 4:5(#) =弱= 8:5 =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        #                           ↓
-        #                           6:4(@) =強= 4:5(#) =弱= 9:5(!) =強= 9:2(+)
-        # 6:4(@) =強= 4:5(#) =弱= 9:5(!) =強= 9:2(+)
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 6:4(@)・9:2(+)の組み合わせ
-        #                                               が存在するため除去
-        # 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 6:4(@)・9:2(+)の組み合わせ
-        #                                               が存在するため除去
-        # 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 6:4(@)・9:2(+)の組み合わせ
-        #                                               が存在するため除去
-        # ...
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =強= 4:5(#) =強= 4:3
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 4:3・9:2(+)の組み合わせ
-        #                                                                 が存在するため除去
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@) =強= 4:5(#) =強= 4:3
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 4:3・9:2(+)の組み合わせ
-        #                                                                 が存在するため除去
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@)
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 6:4(@)・9:2(+)の組み合わせ
-        #                                            が存在するため除去
-        # 9:2(+) =強= 9:5(!) =弱= 8:4 =強= 6:4(@)
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 6:4(@)・9:2(+)の組み合わせ
-        #                                            が存在するため除去
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 4:3
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 4:3・9:2(+)の組み合わせ
-        #                                            が存在するため除去
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 4:3
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 4:3・9:2(+)の組み合わせ
-        #                                            が存在するため除去
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@)
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 6:4(@)・9:2(+)の組み合わせ
-        #                                              が存在するため除去
-        # 9:2(+) =強= 9:5(!) =弱= 4:5(#) =強= 6:4(@)
-        # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^ <- 6:4(@)・9:2(+)の組み合わせ
-        #                                              が存在するため除去
-
-        chain_dict_for_dup_key: str = ""
-        # 重複チェック用チェーン辞書のキー作成
-        # [補足]
-        # チェーンの最初と最後の枡の組み合わせが同じであれば同一チェーンとみなすため、
-        # ソートを行ってからキーを作成する
-        for squ in sorted([first_squ, last_squ]):
-            chain_dict_for_dup_key += str(squ)
-
-        # 重複なし
-        if chain_dict_for_dup_key not in chain_dict_for_dup:
-            chain_dict_for_dup[chain_dict_for_dup_key] = chain_list
+    Returns:
+        Optional[Dict[int, List[Tuple[int, bool]]]]:
+            枡番号 -> リンク先(枡番号、強リンクかどうか)リスト(リンク先の枡番号順)
+            (強リンクがない場合はNone)
+    """
+    link_strong_dict: Dict[int, Dict[int, bool]] = dict()
+    has_strong: bool = False
+    for unit_no, unit in enumerate(UNIT_LIST):
+        pos_mask: int = wk.unit_memo_pos_list[unit_no][loop_memo]
+        # 数字が入りうる枡が1つ以下の領域にはリンクがない
+        if BIT_CNT[pos_mask] < 2:
             continue
-
-        # 重複した場合はチェーン数が短い方を優先
-        if len(chain_list) < len(chain_dict_for_dup[chain_dict_for_dup_key]):
-            all_chain_list.remove(chain_dict_for_dup[chain_dict_for_dup_key])
-            chain_dict_for_dup[chain_dict_for_dup_key] = chain_list
-        else:
-            all_chain_list.remove(chain_list)
-
-        # 例に当てはめるとall_chain_listは最終的に以下のようになる
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4
-        # 4:3 =強= 4:5(#) =強= 6:4(@) =強= 8:4 =弱= 9:5(!) =強= 9:2(+)
-        # ...
-        # 6:4(@) =強= 4:5(#) =弱= 9:5(!) =強= 9:2(+)
-        # ...
+        idx_list: List[int] = [unit[pos] for pos in BIT_POS_LIST[pos_mask]]
+        strong: bool = len(idx_list) == 2
+        has_strong = has_strong or strong
+        for idx in idx_list:
+            other_dict: Dict[int, bool] = link_strong_dict.setdefault(
+                idx, dict())
+            for other_idx in idx_list:
+                if other_idx != idx:
+                    other_dict[other_idx] =\
+                        other_dict.get(other_idx, False) or strong
+
+    if not has_strong:
+        return None
+
+    return {
+        idx: sorted(other_dict.items())
+        for idx, other_dict in link_strong_dict.items()}
@@ -0,0 +1,225 @@
+"""シンプルカラーリング
+"""
+from typing import Dict, Iterator, List, Tuple
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.HowToAnalyze import HowToAnalyze
+from sudokuapp.util.CellIndex import (AREA_ORDER_IDX, CELL_UNIT_LIST,
+                                      PEER_MASK_LIST, SQU_CNT, UNIT_LIST)
+from sudokuapp.util.MemoMask import BIT_CNT, BIT_POS_LIST, MEMO_BIT
+from sudokuapp.util.MsgFactory import MsgFactory
+
+
+def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
+    """シンプルカラーリング法
+
+    1つの数字に注目して、強リンクで繋がる枡を交互に2色で塗り分けると
+    どちらか一方の色の枡全てにその数字が入る。
+    ※強リンクの解説はLinkType.pyのdocstringを参照
+    このことから以下のようにメモを除外出来る
+    ・カラートラップ
+      両方の色の枡と同じ領域にある(塗られていない)枡からその数字を除外出来る
+    ・カラーラップ
+      同じ色の枡が同じ領域に2つある場合、その色には数字が入らないため、
+      その色の枡全てからその数字を除外出来る
+
+    例>
+    ※ある数字【N】のみに注目して抜粋
+    1行目: 1:2(@)、1:7(#)にしかNが入らない
+    7列目: 1:7(#)、5:7($)にしかNが入らない
+    5行目: 5:2(!)、5:7($)にしかNが入らない
+    @枡 =強= #枡 =強= $枡 =強= !枡 のように繋がるため、
+    @枡、$枡(色A)と#枡、!枡(色B)に塗り分けられる。
+    ・カラートラップ
+      3:2は@枡(色A)と!枡(色B)の両方と同じ列にあるため、Nを除外出来る
+    ・カラーラップ
+      (@枡と$枡が同じ行にある場合のように)
+      同じ色の枡が同じ領域にある場合は、その色の枡全てからNを除外出来る
+
+    強リンクのグラフは数字毎に1回だけ作成し、
+    連結成分毎に幅優先で塗り分けるため、強リンクの数に比例した時間で解析する
+
+    Args:
+        wk (AnalyzeWk): ワーク
+        how_anlz_list (List[HowToAnalyze]): 解析方法
+
+    Returns:
+        bool: エラーの場合にFalse
+    """
+
+    for loop_memo in range(1, 10):
+        # 前回解析結果なし以降に変更がないメモは対象外
+        if not wk.is_dirty_memo(Method.SIMPLE_COLORING, loop_memo):
+            continue
+
+        for color_list in _iter_color(wk, loop_memo):
+            # 解析結果がある数字が見つかったら処理終了
+            if _analyze_color_wrap(wk, how_anlz_list, loop_memo, color_list):
+                return True
+            if _analyze_color_trap(wk, how_anlz_list, loop_memo, color_list):
+                return True
+
+    return True
+
+
+def _iter_color(
+    wk: AnalyzeWk,
+    loop_memo: int
+) -> Iterator[Tuple[List[int], List[int]]]:
+    """強リンクで繋がる枡の塗り分けを生成
+
+    強リンクで繋がる枡(連結成分)毎に、開始枡から幅優先で交互に2色で塗り分ける
+    (開始枡はエリア順)
+
+    Args:
+        wk (AnalyzeWk): ワーク
+        loop_memo (int): 数字
+
+    Returns:
+        Iterator[Tuple[List[int], List[int]]]: 色毎の枡番号リスト(枡番号順)
+    """
+    # 強リンク(枡番号 -> リンク先の枡番号リスト)
+    link_dict: Dict[int, List[int]] = dict()
+    for unit_no, unit in enumerate(UNIT_LIST):
+        pos_mask: int = wk.unit_memo_pos_list[unit_no][loop_memo]
+        if BIT_CNT[pos_mask] != 2:
+            continue
+        idx1, idx2 = [unit[pos] for pos in BIT_POS_LIST[pos_mask]]
+        link_dict.setdefault(idx1, list()).append(idx2)
+        link_dict.setdefault(idx2, list()).append(idx1)
+
+    # 枡番号 -> 色(0 or 1)
+    color_dict: Dict[int, int] = dict()
+    for start_idx in AREA_ORDER_IDX:
+        if start_idx not in link_dict or start_idx in color_dict:
+            continue
+
+        color_dict[start_idx] = 0
+        color_list: Tuple[List[int], List[int]] = ([start_idx], list())
+        queue: List[int] = [start_idx]
+        for idx in queue:
+            next_color: int = 1 - color_dict[idx]
+            for next_idx in link_dict[idx]:
+                if next_idx in color_dict:
+                    continue
+                color_dict[next_idx] = next_color
+                color_list[next_color].append(next_idx)
+                queue.append(next_idx)
+
+        color_list[0].sort()
+        color_list[1].sort()
+        yield color_list
+
+
+def _analyze_color_wrap(
+    wk: AnalyzeWk,
+    how_anlz_list: List[HowToAnalyze],
+    loop_memo: int,
+    color_list: Tuple[List[int], List[int]]
+) -> bool:
+    """カラーラップ
+
+    同じ色の枡が同じ領域に2つある場合、その色の枡全てから数字を除外
+
+    Args:
+        wk (AnalyzeWk): ワーク
+        how_anlz_list (List[HowToAnalyze]): 解析方法
+        loop_memo (int): 数字
+        color_list (Tuple[List[int], List[int]]): 色毎の枡番号リスト
+
+    Returns:
+        bool: 解析結果がある場合にTrue
+    """
+    for color in (0, 1):
+        wrap_idx_list: List[int] = color_list[color]
+        other_idx_list: List[int] = color_list[1 - color]
+
+        # 同じ色の枡が同じ領域にあるかどうか
+        used_unit_set = set()
+        wrap: bool = False
+        for idx in wrap_idx_list:
+            for unit_no in CELL_UNIT_LIST[idx]:
+                if unit_no in used_unit_set:
+                    wrap = True
+                used_unit_set.add(unit_no)
+        if not wrap:
+            continue
+
+        for change_idx in wrap_idx_list:
+
+            # メモを除外
+            wk.remove_memo(change_idx, MEMO_BIT[loop_memo])
+
+            # 解析方法生成
+            how_anlz: HowToAnalyze = HowToAnalyze(Method.SIMPLE_COLORING)
+            how_anlz.changed_idx = change_idx
+            how_anlz.remove_memo_list.append(loop_memo)
+            how_anlz.trigger_idx_list.extend(wrap_idx_list)
+            how_anlz.trigger_idx_list.extend(other_idx_list)
+            how_anlz.msg = MsgFactory.how_to_simple_coloring_wrap(
+                how_anlz, wrap_idx_list, other_idx_list)
+
+            how_anlz_list.append(how_anlz)
+
+        return True
+
+    return False
+
+
+def _analyze_color_trap(
+    wk: AnalyzeWk,
+    how_anlz_list: List[HowToAnalyze],
+    loop_memo: int,
+    color_list: Tuple[List[int], List[int]]
+) -> bool:
+    """カラートラップ
+
+    両方の色の枡と同じ領域にある枡から数字を除外
+
+    Args:
+        wk (AnalyzeWk): ワーク
+        how_anlz_list (List[HowToAnalyze]): 解析方法
+        loop_memo (int): 数字
+        color_list (Tuple[List[int], List[int]]): 色毎の枡番号リスト
+
+    Returns:
+        bool: 解析結果がある場合にTrue
+    """
+    # 色毎の影響枡マスク(枡番号のビット)
+    peer_mask_list: List[int] = [0, 0]
+    for color in (0, 1):
+        for idx in color_list[color]:
+            peer_mask_list[color] |= PEER_MASK_LIST[idx]
+
+    # 両方の色の影響枡のうち、メモが存在する枡が変更対象となる
+    # (カラーラップがない場合、塗られた枡は同じ色の枡の影響枡にならないため、
+    #  対象外となる)
+    trap_mask: int = peer_mask_list[0] & peer_mask_list[1]
+    if trap_mask == 0:
+        return False
+    memo_arr = wk.flame.board.memo_arr
+    memo_bit: int = MEMO_BIT[loop_memo]
+    change_idx_list: List[int] = [
+        idx for idx in range(SQU_CNT)
+        if trap_mask >> idx & 1 and memo_arr[idx] & memo_bit]
+    if len(change_idx_list) == 0:
+        return False
+
+    for change_idx in change_idx_list:
+
+        # メモを除外
+        wk.remove_memo(change_idx, memo_bit)
+
+        # 解析方法生成
+        how_anlz: HowToAnalyze = HowToAnalyze(Method.SIMPLE_COLORING)
+        how_anlz.changed_idx = change_idx
+        how_anlz.remove_memo_list.append(loop_memo)
+        how_anlz.trigger_idx_list.extend(color_list[0])
+        how_anlz.trigger_idx_list.extend(color_list[1])
+        how_anlz.msg = MsgFactory.how_to_simple_coloring_trap(
+            how_anlz, color_list[0], color_list[1])
+
+        how_anlz_list.append(how_anlz)
+
+    return True
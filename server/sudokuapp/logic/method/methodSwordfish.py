@@ -0,0 +1,35 @@
+"""ソードフィッシュ
+"""
+from typing import List
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.HowToAnalyze import HowToAnalyze
+from sudokuapp.logic.method import methodFish
+
+
+def analyze(wk: AnalyzeWk, how_anlz_list: List[HowToAnalyze]) -> bool:
+    """ソードフィッシュ法
+
+    X-Wing法を3行(列)に拡張した解法
+
+    例>
+    ※ある数字【N】のみに注目して抜粋
+    1行目: 1:2、1:5       にNが入りうる
+    4行目: 4:2、4:5、4:8  にNが入りうる
+    7行目: 7:5、7:8       にNが入りうる
+    3つの行でNが入りうる枡が2列目、5列目、8列目にしかないため、
+    3つの行のNはそれぞれ2列目、5列目、8列目のいずれかに必ず入る。
+    このことから2列目、5列目、8列目の1行目、4行目、7行目以外の枡の
+    メモからNを除外出来る。
+    ※行で説明をしたが、列でも同様の解法が適用出来る
+
+    Args:
+        wk (AnalyzeWk): ワーク
+        how_anlz_list (List[HowToAnalyze]): 解析方法
+
+    Returns:
+        bool: エラーの場合にFalse
+    """
+
+    return methodFish.analyze(wk, how_anlz_list, Method.SWORDFISH)
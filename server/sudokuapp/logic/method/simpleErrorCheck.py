@@ -2,19 +2,22 @@
 """
 
 
-from typing import List, Set
+from typing import Dict, List, Tuple
 
 from sudokuapp.const.Method import Method
 from sudokuapp.const.Region import Region
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.Board import Board
 from sudokuapp.data.HowToAnalyze import HowToAnalyze
 from sudokuapp.data.Msg import Msg
 from sudokuapp.data.Square import Square
+from sudokuapp.util import ExactCover
+from sudokuapp.util.CellIndex import (AREA_ORDER_IDX, AREA_UNIT_LIST, CLM_OF,
+                                      CLM_UNIT_LIST, ROW_OF, ROW_UNIT_LIST,
+                                      SQU_CNT, UNIT_LIST)
+from sudokuapp.util.MemoMask import ALL_MASK, MEMO_BIT, MEMO_LIST
 from sudokuapp.util.MsgFactory import MsgFactory
 
-# 全ての数字SET
-_ALL_NUM_SET: Set[int] = set([1, 2, 3, 4, 5, 6, 7, 8, 9])
-
 
 def errorCheck(wk: AnalyzeWk, first_check: bool = False) -> List[HowToAnalyze]:
     """エラーチェック
@@ -32,9 +35,7 @@ def errorCheck(wk: AnalyzeWk, first_check: bool = False) -> List[HowToAnalyze]:
     #######################
     if first_check:
         MIN_HINT: int = 10
-        hint_cnt: int = len(list(filter(
-            lambda squ: squ.hint_val is not None,
-            wk.all_squ_list)))
+        hint_cnt: int = SQU_CNT - wk.flame.board.hint_arr.count(0)
         if hint_cnt < MIN_HINT:
             msg: Msg = MsgFactory.not_enough_hints(MIN_HINT)
             wk.msg_list.append(msg)
@@ -42,16 +43,29 @@ def errorCheck(wk: AnalyzeWk, first_check: bool = False) -> List[HowToAnalyze]:
             how_to.msg = msg
             how_to_list.append(how_to)
 
+    # 解析中のチェックはエラーがない場合がほとんどのため、
+    # 領域単位の簡易チェックでエラーがなければ終了
+    if not first_check and not _exist_error_unit(wk):
+        return how_to_list
+
     #######################
     # 重複チェック
     #######################
+    # 確定値 -> 確定値に一致する枡リスト(エリア順)
+    board: Board = wk.flame.board
+    eq_squ_dict: Dict[int, List[Square]] = dict()
+    for idx in AREA_ORDER_IDX:
+        fixed_val: int = board.get_fixed_val(idx)
+        if not fixed_val:
+            continue
+        if fixed_val not in eq_squ_dict:
+            eq_squ_dict[fixed_val] = list()
+        eq_squ_dict[fixed_val].append(wk.get_squ_by_idx(idx))
+
     # 数字単位(1～9)でチェック
     for wk_num in range(1, 10):
         # 数字に一致する枡を取得
-        eq_squ_list: List[Square] = list(filter(
-            lambda squ: squ.get_fixed_val() == wk_num,
-            wk.all_squ_list
-        ))
+        eq_squ_list: List[Square] = eq_squ_dict.get(wk_num, [])
 
         for pivot_squ in eq_squ_list:
             for compare_squ in eq_squ_list:
@@ -77,63 +91,106 @@ def errorCheck(wk: AnalyzeWk, first_check: bool = False) -> List[HowToAnalyze]:
                     # 解析方法にエラーを追加
                     how_to = HowToAnalyze(Method.ERROR_CHECK)
                     how_to.msg = msg
-                    how_to.changed_squ = pivot_squ
-                    how_to.trigger_squ_list.append(compare_squ)
+                    how_to.changed_idx = pivot_squ.idx
+                    how_to.trigger_idx_list.append(compare_squ.idx)
                     how_to_list.append(how_to)
 
+    #######################
+    # 複数解チェック
+    #######################
+    # 複数解の問題は各解法で解析しても必ず解析結果なしとなるため、
+    # 解析前に解の数(2つまで)を数えてエラーとする
+    # (解なしの場合は解析中のエラーチェックでエラー箇所を特定する)
+    if first_check and len(how_to_list) == 0:
+        val_list: List[int] = [
+            board.get_fixed_val(idx) for idx in range(SQU_CNT)]
+        if ExactCover.count_solution(val_list, limit=2) > 1:
+            msg: Msg = MsgFactory.multiple_solutions()
+            wk.msg_list.append(msg)
+            how_to = HowToAnalyze(Method.ERROR_CHECK)
+            how_to.msg = msg
+            how_to_list.append(how_to)
+
     #######################
     # 数字存在チェック
     #######################
     if not first_check:
-        for area in wk.flame.area_list:
-            _exist_num_check(how_to_list, area.squ_list, Region.AREA)
-        for squ_list in wk.row_dict.values():
-            _exist_num_check(how_to_list, area.squ_list, Region.ROW)
-        for squ_list in wk.clm_dict.values():
-            _exist_num_check(how_to_list, area.squ_list, Region.CLM)
+        for unit in AREA_UNIT_LIST:
+            _exist_num_check(wk, how_to_list, unit, Region.AREA)
+        for unit in ROW_UNIT_LIST:
+            _exist_num_check(wk, how_to_list, unit, Region.ROW)
+        for unit in CLM_UNIT_LIST:
+            _exist_num_check(wk, how_to_list, unit, Region.CLM)
 
     return how_to_list
 
 
+def _exist_error_unit(wk: AnalyzeWk) -> bool:
+    """重複、数字不足のある領域が存在するか(簡易チェック)
+
+    Args:
+        wk (AnalyzeWk): 数独WK
+
+    Returns:
+        bool: 存在する場合にTrue
+    """
+    board: Board = wk.flame.board
+    for unit in UNIT_LIST:
+        fixed_mask: int = 0
+        num_mask: int = 0
+        for idx in unit:
+            fixed_val: int = board.get_fixed_val(idx)
+            if fixed_val:
+                # 重複
+                if fixed_mask & MEMO_BIT[fixed_val]:
+                    return True
+                fixed_mask |= MEMO_BIT[fixed_val]
+            else:
+                num_mask |= board.memo_arr[idx]
+        # 数字不足
+        if (fixed_mask | num_mask) != ALL_MASK:
+            return True
+    return False
+
+
 def _exist_num_check(
+    wk: AnalyzeWk,
     how_to_list: List[HowToAnalyze],
-    squ_list: List[Square],
+    unit: Tuple[int, ...],
     region: Region
 ) -> None:
     """数字存在チェック
 
     Args:
+        wk (AnalyzeWk): 数独WK
         how_to_list (List[HowToAnalyze]): 解析方法リスト(エラー)
-        squ_list (List[Square]): ある領域の枡リスト
+        unit (Tuple[int, ...]): ある領域の枡番号タプル
         region (Region): 領域
     """
-    num_set: Set[int] = set()
-    for squ in squ_list:
-        if squ.hint_val is not None:
-            num_set.add(squ.hint_val)
-        elif squ.val is not None:
-            num_set.add(squ.val)
-        elif squ.memo_val_list:
-            num_set = num_set.union(set(squ.memo_val_list))
-
-    not_exist_num_set: Set[int] = _ALL_NUM_SET.difference(num_set)
-    if len(not_exist_num_set) == 0:
-        return
+    board: Board = wk.flame.board
+    num_mask: int = 0
+    for idx in unit:
+        fixed_val: int = board.get_fixed_val(idx)
+        if fixed_val:
+            num_mask |= MEMO_BIT[fixed_val]
+        else:
+            num_mask |= board.memo_arr[idx]
 
-    not_exist_num_list = list(not_exist_num_set)
-    not_exist_num_list.sort()
+    not_exist_num_mask: int = ALL_MASK & ~num_mask
+    if not_exist_num_mask == 0:
+        return
 
-    for not_exist_num in not_exist_num_list:
+    for not_exist_num in MEMO_LIST[not_exist_num_mask]:
         how_to = HowToAnalyze(Method.ERROR_CHECK)
         if region == Region.AREA:
             how_to.msg = MsgFactory.not_exist_num_area(
-                not_exist_num, squ_list[0])
+                not_exist_num, wk.get_squ_by_idx(unit[0]))
 
         elif region == Region.ROW:
             how_to.msg = MsgFactory.not_exist_num_row(
-                not_exist_num, squ_list[0].row)
+                not_exist_num, ROW_OF[unit[0]])
         else:
             how_to.msg = MsgFactory.not_exist_num_clm(
-                not_exist_num, squ_list[0].clm)
+                not_exist_num, CLM_OF[unit[0]])
 
         how_to_list.append(how_to)
@@ -0,0 +1,191 @@
+"""問題生成
+
+ランダムな解答盤面からヒントを除外して唯一解の問題を生成し、
+難易度判定(difficultyGrader)で目標の解法が必要な問題になるまで生成を繰り返す
+"""
+import itertools
+import multiprocessing
+import random
+from typing import Iterator, List
+
+import django
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.GradeResult import GradeResult
+from sudokuapp.logic import difficultyGrader
+from sudokuapp.util import ExactCover
+from sudokuapp.util.CellIndex import AREA_UNIT_LIST, SQU_CNT
+
+# 問題1問あたりの最大試行回数(デフォルト)
+MAX_ATTEMPT: int = 1000
+
+
+def create_full_grid(rng: random.Random) -> List[int]:
+    """ランダムな解答盤面を生成
+
+    互いに影響しない対角のエリア(1、5、9)をランダムに埋め、
+    残りの枡を総当たりで解く
+
+    Args:
+        rng (random.Random): 乱数生成器
+
+    Returns:
+        List[int]: 枡番号 -> 値
+    """
+    val_list: List[int] = [0] * SQU_CNT
+    for area_id in (1, 5, 9):
+        memo_list: List[int] = list(range(1, 10))
+        rng.shuffle(memo_list)
+        for idx, memo in zip(AREA_UNIT_LIST[area_id - 1], memo_list):
+            val_list[idx] = memo
+    return ExactCover.solve(val_list)[0]
+
+
+def remove_hint(val_list: List[int], rng: random.Random) -> List[int]:
+    """唯一解を保ったままヒントを除外
+
+    ランダムな順に枡の値を除外し、解が複数になる場合は元に戻す
+
+    Args:
+        val_list (List[int]): 枡番号 -> 値(解答盤面)
+        rng (random.Random): 乱数生成器
+
+    Returns:
+        List[int]: 枡番号 -> 値(空き枡は0)
+    """
+    puzzle: List[int] = list(val_list)
+    idx_list: List[int] = list(range(SQU_CNT))
+    rng.shuffle(idx_list)
+    for idx in idx_list:
+        val: int = puzzle[idx]
+        puzzle[idx] = 0
+        if ExactCover.count_solution(puzzle, limit=2) != 1:
+            puzzle[idx] = val
+    return puzzle
+
+
+def generate_candidate(rng: random.Random) -> str:
+    """唯一解の問題(難易度は問わない)を生成
+
+    Args:
+        rng (random.Random): 乱数生成器
+
+    Returns:
+        str: 問題文字列(81文字、空き枡は0)
+    """
+    puzzle: List[int] = remove_hint(create_full_grid(rng), rng)
+    return "".join(str(val) for val in puzzle)
+
+
+def try_generate(method: Method, rng: random.Random) -> GradeResult:
+    """問題を1問生成し、目標の解法が必要な問題かどうか判定
+
+    目標の解法を利用していて、かつそれより難しいレベルの解法を
+    利用していない場合に対象とする
+    (同じレベルの解法が複数あるため、レベルの一致だけでは判定しない)
+
+    Args:
+        method (Method): 目標の解法
+        rng (random.Random): 乱数生成器
+
+    Returns:
+        GradeResult: 難易度判定結果(目標の解法が必要な問題でない場合はNone)
+            (同じレベルの解法も利用している場合、最も難しい解法は目標の解法とする)
+    """
+    grade: GradeResult = difficultyGrader.grade_text(generate_candidate(rng))
+    if not grade.solved or method not in grade.method_cnt_dict:
+        return None
+    if grade.level != difficultyGrader.METHOD_LEVEL_DICT[method]:
+        return None
+    grade.hardest_method = method
+    return grade
+
+
+def generate(
+    method: Method,
+    count: int = 1,
+    workers: int = 1,
+    seed: int = None,
+    max_attempt: int = MAX_ATTEMPT
+) -> Iterator[GradeResult]:
+    """目標の難易度の問題を生成
+
+    目標の解法を利用し、かつ利用した最も難しい解法のレベルが
+    目標の解法のレベルと一致するまで問題の生成と難易度判定を繰り返す
+    ワーカープロセス数が2以上の場合はプロセスプールで並列に試行し、
+    各ワーカープロセスは乱数シード(seed + ワーカー番号)の乱数生成器を利用する
+
+    Args:
+        method (Method): 目標の解法
+        count (int): 生成する問題数
+        workers (int): ワーカープロセス数(1の場合はプロセスプールを使わない)
+        seed (int): 乱数シード(省略時はランダム)
+        max_attempt (int): 問題1問あたりの最大試行回数
+
+    Returns:
+        Iterator[GradeResult]: 生成した問題の難易度判定結果
+            (最大試行回数までに見つからなかった分は出力しない)
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(1 << 32)
+    attempt_cnt: int = count * max_attempt
+
+    if workers <= 1:
+        rng: random.Random = random.Random(seed)
+        for _ in range(attempt_cnt):
+            grade: GradeResult = try_generate(method, rng)
+            if grade is None:
+                continue
+            yield grade
+            count -= 1
+            if count == 0:
+                return
+        return
+
+    # ワーカー毎の乱数シード
+    seed_queue = multiprocessing.Queue()
+    for worker_no in range(workers):
+        seed_queue.put(seed + worker_no)
+
+    # 必要な問題数が揃った時点でプールを終了し、残りの試行は破棄する
+    with multiprocessing.Pool(
+            workers, initializer=_init_worker,
+            initargs=(seed_queue,)) as pool:
+        for grade in pool.imap_unordered(
+                _try_generate_worker, itertools.repeat(method, attempt_cnt)):
+            if grade is None:
+                continue
+            yield grade
+            count -= 1
+            if count == 0:
+                return
+
+
+# ワーカープロセスの乱数生成器
+_worker_rng: random.Random = None
+
+
+def _init_worker(seed_queue) -> None:
+    """ワーカープロセス初期化
+
+    ワーカー毎の乱数シードで乱数生成器を初期化する
+    spawnで起動した場合(Windowsなど)はDjangoが未初期化のため初期化する
+
+    Args:
+        seed_queue (multiprocessing.Queue): 乱数シードのキュー
+    """
+    global _worker_rng
+    django.setup()
+    _worker_rng = random.Random(seed_queue.get())
+
+
+def _try_generate_worker(method: Method) -> GradeResult:
+    """問題を1問生成し、目標の解法が必要な問題かどうか判定(ワーカープロセス用)
+
+    Args:
+        method (Method): 目標の解法
+
+    Returns:
+        GradeResult: 難易度判定結果(目標の解法が必要な問題でない場合はNone)
+    """
+    return try_generate(method, _worker_rng)
@@ -0,0 +1,314 @@
+import collections
+import json
+import multiprocessing
+import os
+import sys
+from typing import Any, Deque, Dict, Iterator, List, TextIO
+
+import django
+from django.core.management.base import BaseCommand
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.BatchResult import BatchResult
+from sudokuapp.logic import (analyzeMain, batchSolver, difficultyGrader,
+                             jsonConverter)
+
+# 指定可能な利用メソッド
+METHOD_CHOICE_LIST: List[Method] =\
+    difficultyGrader.GRADE_METHOD_LIST + [Method.EXACT_COVER]
+
+
+class Command(BaseCommand):
+    """一括解析コマンド
+    """
+
+    # ヘルプ
+    help =\
+        "問題ファイル(1行81文字、空き枡は0または.)の各問題を解析し、" +\
+        "1問1行のJSONで解析が終わった順(入力順)に出力"
+
+    def add_arguments(self, parser):
+        """引数定義
+
+        Args:
+            parser (ArgumentParser): パーサ
+        """
+        parser.add_argument(
+            "file",
+            help="問題ファイル(-の場合は標準入力)")
+        parser.add_argument(
+            "--method", action="append",
+            choices=[method.name for method in METHOD_CHOICE_LIST],
+            help="利用メソッド(複数指定可、省略時は総当たり法以外の全て)")
+        parser.add_argument(
+            "--adaptive-order", action="store_true",
+            help="前提条件を満たさない解法を省略する")
+        parser.add_argument(
+            "--batch-singles", action="store_true",
+            help="チャンク単位で消去法のみの一括解析を先に行い、"
+            "解けなかった問題のみ1問ずつ解析する"
+            "(methodsは1問ずつの解析で利用した解法のみ)")
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count(),
+            help="ワーカープロセス数(1の場合はプロセスプールを使わない)")
+        parser.add_argument(
+            "--chunksize", type=int, default=64,
+            help="ワーカープロセスに1回で渡す問題数")
+        parser.add_argument(
+            "--output",
+            help="出力ファイル(省略時は標準出力)")
+
+    def handle(self, *args, **options):
+        """コマンド実行時のエントリーポイント
+        """
+        method_list: List[Method] = difficultyGrader.GRADE_METHOD_LIST
+        if options["method"]:
+            method_list = [Method[name] for name in options["method"]]
+
+        in_file: TextIO = sys.stdin
+        if options["file"] != "-":
+            in_file = open(options["file"], mode="r", encoding="utf-8")
+        out_file: TextIO = self.stdout
+        if options["output"]:
+            out_file = open(options["output"], mode="w", encoding="utf-8")
+
+        try:
+            main(in_file, out_file, method_list, options["adaptive_order"],
+                 options["batch_singles"], options["workers"],
+                 options["chunksize"])
+        finally:
+            if in_file is not sys.stdin:
+                in_file.close()
+            if out_file is not self.stdout:
+                out_file.close()
+
+
+def main(
+    in_file: TextIO,
+    out_file: TextIO,
+    method_list: List[Method],
+    adaptive_order: bool,
+    batch_singles: bool,
+    workers: int,
+    chunksize: int
+) -> None:
+    """一括解析メイン処理
+
+    ワーカープロセスに渡す問題はチャンク単位で(ワーカープロセス数 * 2)個までとし、
+    先頭のチャンクの解析が終わり次第出力して次のチャンクを渡す
+    (入力ファイルの行数によらずメモリ使用量を一定に保つ)
+
+    Args:
+        in_file (TextIO): 問題ファイル
+        out_file (TextIO): 出力ファイル
+        method_list (List[Method]): 利用メソッド
+        adaptive_order (bool): 前提条件を満たさない解法を省略するかどうか
+        batch_singles (bool): 消去法のみの一括解析を先に行うかどうか
+        workers (int): ワーカープロセス数
+        chunksize (int): ワーカープロセスに1回で渡す問題数
+    """
+
+    def write(analyze_dict: Dict[str, Any]) -> None:
+        """解析結果を1行のJSONで出力
+
+        Args:
+            analyze_dict (Dict[str, Any]): 解析結果
+        """
+        out_file.write(json.dumps(analyze_dict, ensure_ascii=False) + "\n")
+
+    if workers <= 1:
+        for chunk in _read_chunk(in_file, chunksize):
+            for analyze_dict in analyze_chunk(
+                    chunk, method_list, adaptive_order, batch_singles):
+                write(analyze_dict)
+        return
+
+    with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        # 解析中のチャンク(入力順)
+        pending_deque: Deque = collections.deque()
+        for chunk in _read_chunk(in_file, chunksize):
+            if len(pending_deque) >= workers * 2:
+                for analyze_dict in pending_deque.popleft().get():
+                    write(analyze_dict)
+            pending_deque.append(
+                pool.apply_async(
+                    analyze_chunk,
+                    (chunk, method_list, adaptive_order, batch_singles)))
+        while pending_deque:
+            for analyze_dict in pending_deque.popleft().get():
+                write(analyze_dict)
+
+
+def analyze_text(
+    text: str,
+    method_list: List[Method],
+    adaptive_order: bool = False
+) -> Dict[str, Any]:
+    """問題文字列を解析
+
+    Args:
+        text (str): 問題文字列(81文字、空き枡は0または.)
+        method_list (List[Method]): 利用メソッド
+        adaptive_order (bool): 前提条件を満たさない解法を省略するかどうか
+
+    Returns:
+        Dict[str, Any]: 解析結果
+            puzzle (str): 問題文字列
+            result (bool): 解析結果(エラーの場合にFalse)
+            unfixedCnt (int): 未確定枡数
+            methods (List[str]): 利用した解法(初めて利用した順)
+            error (str): 問題文字列が不正な場合のエラー内容
+    """
+    analyze_dict: Dict[str, Any] = dict()
+    analyze_dict["puzzle"] = text
+    try:
+        val_list: List[int] = jsonConverter.cnv_text_to_val_list(text)
+    except ValueError as e:
+        analyze_dict["result"] = False
+        analyze_dict["error"] = str(e)
+        return analyze_dict
+
+    wk: AnalyzeWk = jsonConverter.cnv_val_list_to_analyze_wk(
+        val_list, method_list)
+    wk.adaptive_order = adaptive_order
+    result: bool = analyzeMain.analyze(wk)
+
+    # 解析履歴から利用した解法を集計
+    # (解析履歴1件が1回の解法の適用)
+    used_method_dict: Dict[str, None] = dict()
+    for history in wk.histroy_list:
+        if not history.how_anlz_list:
+            continue
+        method: Method = history.how_anlz_list[0].method
+        if method == Method.START or method == Method.ERROR_CHECK:
+            continue
+        used_method_dict[method.name] = None
+
+    analyze_dict["result"] = result
+    analyze_dict["unfixedCnt"] = wk.unfixed_cnt
+    analyze_dict["methods"] = list(used_method_dict)
+    return analyze_dict
+
+
+def analyze_chunk(
+    text_list: List[str],
+    method_list: List[Method],
+    adaptive_order: bool,
+    batch_singles: bool = False
+) -> List[Dict[str, Any]]:
+    """問題文字列をまとめて解析(ワーカープロセス用)
+
+    Args:
+        text_list (List[str]): 問題文字列リスト
+        method_list (List[Method]): 利用メソッド
+        adaptive_order (bool): 前提条件を満たさない解法を省略するかどうか
+        batch_singles (bool): 消去法のみの一括解析を先に行うかどうか
+
+    Returns:
+        List[Dict[str, Any]]: 解析結果リスト
+    """
+    if batch_singles:
+        return analyze_chunk_batch(text_list, method_list, adaptive_order)
+    return [
+        analyze_text(text, method_list, adaptive_order)
+        for text in text_list]
+
+
+def analyze_chunk_batch(
+    text_list: List[str],
+    method_list: List[Method],
+    adaptive_order: bool
+) -> List[Dict[str, Any]]:
+    """問題文字列をまとめて一括解析(batchSolver)
+
+    消去法のみでチャンク内の問題をまとめて解析し、
+    解けなかった問題のみ1問ずつ解析(analyzeMain)する
+
+    Args:
+        text_list (List[str]): 問題文字列リスト
+        method_list (List[Method]): 利用メソッド
+        adaptive_order (bool): 前提条件を満たさない解法を省略するかどうか
+
+    Returns:
+        List[Dict[str, Any]]: 解析結果リスト
+            puzzle (str): 問題文字列
+            result (bool): 解析結果(エラーの場合にFalse)
+            unfixedCnt (int): 未確定枡数
+            methods (List[str]): 1問ずつの解析で利用した解法(初めて利用した順)
+            fallback (bool): 1問ずつの解析で解析したかどうか
+            error (str): 問題文字列が不正な場合のエラー内容
+    """
+    analyze_dict_list: List[Dict[str, Any]] = list()
+    # 問題文字列が正しい問題の(解析結果リストの位置、値リスト)
+    val_list_list: List[List[int]] = list()
+    pos_list: List[int] = list()
+    for text in text_list:
+        analyze_dict: Dict[str, Any] = dict()
+        analyze_dict["puzzle"] = text
+        analyze_dict_list.append(analyze_dict)
+        try:
+            val_list_list.append(jsonConverter.cnv_text_to_val_list(text))
+        except ValueError as e:
+            analyze_dict["result"] = False
+            analyze_dict["error"] = str(e)
+            continue
+        pos_list.append(len(analyze_dict_list) - 1)
+
+    batch_result_list: List[BatchResult] = batchSolver.analyze_batch(
+        val_list_list, method_list, adaptive_order=adaptive_order)
+    for pos, batch_result in zip(pos_list, batch_result_list):
+        analyze_dict = analyze_dict_list[pos]
+        analyze_dict["result"] = not batch_result.error
+        analyze_dict["unfixedCnt"] = batch_result.val_list.count(0)
+        analyze_dict["methods"] = [
+            method.name for method in batch_result.method_list]
+        analyze_dict["fallback"] = batch_result.fallback
+
+    return analyze_dict_list
+
+
+def _read_puzzle(in_file: TextIO) -> Iterator[str]:
+    """問題ファイルから問題文字列を読み込む
+
+    空行、#から始まる行は読み飛ばす
+
+    Args:
+        in_file (TextIO): 問題ファイル
+
+    Returns:
+        Iterator[str]: 問題文字列
+    """
+    for line in in_file:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        yield line
+
+
+def _read_chunk(in_file: TextIO, chunksize: int) -> Iterator[List[str]]:
+    """問題ファイルから問題文字列をチャンク単位で読み込む
+
+    Args:
+        in_file (TextIO): 問題ファイル
+        chunksize (int): チャンクの問題数
+
+    Returns:
+        Iterator[List[str]]: 問題文字列リスト
+    """
+    chunk: List[str] = list()
+    for puzzle in _read_puzzle(in_file):
+        chunk.append(puzzle)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = list()
+    if chunk:
+        yield chunk
+
+
+def _init_worker() -> None:
+    """ワーカープロセス初期化
+
+    spawnで起動した場合(Windowsなど)はDjangoが未初期化のため初期化する
+    """
+    django.setup()
@@ -0,0 +1,348 @@
+import json
+import math
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandError
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.HowToAnalyze import HowToAnalyze
+from sudokuapp.logic import analyzeMain, difficultyGrader, jsonConverter
+from sudokuapp.logic.method import (methodElimionationOneMemo,
+                                    methodElimionationOnlyMemo,
+                                    methodElimionationRemoveMemo,
+                                    methodExactCover, methodHiddenPair,
+                                    methodJellyfish, methodLockedCandidates,
+                                    methodNakedPair, methodSimpleChain,
+                                    methodSimpleColoring, methodSwordfish,
+                                    methodXWing, methodXYChain)
+
+# 計測用の問題(名前、問題文字列)
+# (難易度の低い順)
+BENCH_PUZZLE_LIST: List[Tuple[str, str]] = [
+    # 消去法のみ
+    ("easy",
+     "003020600900305001001806400008102900700000008006708200002609500800203009005010300"),  # noqa: E501
+    # 消去法only memoまで
+    ("medium",
+     "000000907000420180000705026100904000050000040000507009920108000034059000507000000"),  # noqa: E501
+    # X-Wingまで
+    ("x_wing",
+     "100000569492056108056109240009640801064010000218035604040500016905061402621000005"),  # noqa: E501
+    # XYチェーンまで
+    ("xy_chain",
+     "000000000000942080160000029000000008906000001400250000004000000020008090050000700"),  # noqa: E501
+    # ヒント17個
+    ("hint17",
+     "000000010400000000020000000000050407008000300001090000300400200050100000000806000"),  # noqa: E501
+    # 人間が解ける解法では解けない
+    ("extreme",
+     "800000000003600000070090200050007000000045700000100030001000068008500010090000400"),  # noqa: E501
+]
+
+# 計測する解法(解法、解析関数)
+BENCH_METHOD_LIST: List[
+    Tuple[Method, Callable[[AnalyzeWk, List[HowToAnalyze]], bool]]
+] = [
+    (Method.ELIMIONATION, methodElimionationRemoveMemo.analyze),
+    (Method.ELIMIONATION_ONE_MEMO, methodElimionationOneMemo.analyze),
+    (Method.ELIMIONATION_ONLY_MEMO, methodElimionationOnlyMemo.analyze),
+    (Method.LOCKED_CANDIDATES, methodLockedCandidates.analyze),
+    (Method.NAKED_PAIR, methodNakedPair.analyze),
+    (Method.HIDDEN_PAIR, methodHiddenPair.analyze),
+    (Method.X_WING, methodXWing.analyze),
+    (Method.SWORDFISH, methodSwordfish.analyze),
+    (Method.JELLYFISH, methodJellyfish.analyze),
+    (Method.SIMPLE_COLORING, methodSimpleColoring.analyze),
+    (Method.XY_CHAIN, methodXYChain.analyze),
+    (Method.SIMPLE_CHAIN, methodSimpleChain.analyze),
+    (Method.EXACT_COVER, methodExactCover.analyze),
+]
+
+# 劣化とみなす処理時間(最小値)の最小の差
+# (処理時間が短い計測対象の誤差を劣化とみなさないため)
+REGRESSION_MIN_DIFF_MS: float = 0.5
+
+# 劣化とみなした計測対象の再計測回数
+# (一時的な負荷による誤差を劣化とみなさないため、
+#  再計測しても劣化している場合のみ劣化とする)
+REGRESSION_RETRY: int = 2
+
+# 消去法(解析前の盤面で計測する解法)
+ELIMIONATION_METHOD_LIST: List[Method] = [
+    Method.ELIMIONATION,
+    Method.ELIMIONATION_ONE_MEMO,
+    Method.ELIMIONATION_ONLY_MEMO,
+]
+
+
+class Command(BaseCommand):
+    """ベンチマークコマンド
+    """
+
+    # ヘルプ
+    help =\
+        "解析処理(解析、枠のクローン、JSONレスポンス生成、各解法)の" +\
+        "処理時間とメモリ使用量を計測"
+
+    def add_arguments(self, parser):
+        """引数定義
+
+        Args:
+            parser (ArgumentParser): パーサ
+        """
+        parser.add_argument(
+            "--repeat", type=int, default=20,
+            help="計測回数")
+        parser.add_argument(
+            "--output", default="bench.json",
+            help="計測結果の出力ファイル(JSON)")
+        parser.add_argument(
+            "--compare",
+            help="比較する過去の計測結果ファイル(JSON)")
+        parser.add_argument(
+            "--threshold", type=float, default=1.5,
+            help="比較時に劣化とみなす処理時間(最小値、中央値)の比率")
+
+    def handle(self, *args, **options):
+        """コマンド実行時のエントリーポイント
+        """
+        bench_list: List[
+            Tuple[str, Callable[[], Any], Callable[[Any], Any]]
+        ] = create_bench_list()
+        bench_dict: Dict[str, Dict[str, float]] = dict()
+        for name, setup, func in bench_list:
+            bench_dict[name] = measure(setup, func, options["repeat"])
+            self.stdout.write(
+                "{:<40} min {:>9.3f} ms  median {:>9.3f} ms  "
+                "p95 {:>9.3f} ms  "
+                "alloc {:>7} blocks {:>9.1f} KB  peak {:>9.1f} KB".format(
+                    name, bench_dict[name]["minMs"],
+                    bench_dict[name]["medianMs"],
+                    bench_dict[name]["p95Ms"],
+                    bench_dict[name]["allocBlocks"],
+                    bench_dict[name]["allocKb"],
+                    bench_dict[name]["peakKb"]))
+
+        regression_list: List[str] = list()
+        if options["compare"]:
+            with open(options["compare"], mode="r", encoding="utf-8") as f:
+                base_dict: Dict[str, Dict[str, float]] = json.load(f)["bench"]
+            regression_list = compare(
+                base_dict, bench_dict, options["threshold"])
+
+            # 劣化とみなした計測対象を再計測し、速い方の計測結果で比較し直す
+            for _ in range(REGRESSION_RETRY):
+                if not regression_list:
+                    break
+                for name, setup, func in bench_list:
+                    if name not in regression_list:
+                        continue
+                    retry_dict: Dict[str, float] = measure(
+                        setup, func, options["repeat"])
+                    for key in ("minMs", "medianMs"):
+                        bench_dict[name][key] = min(
+                            bench_dict[name][key], retry_dict[key])
+                regression_list = compare(
+                    base_dict,
+                    {name: bench_dict[name] for name in regression_list},
+                    options["threshold"])
+
+        with open(options["output"], mode="w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "repeat": options["repeat"],
+                "bench": bench_dict,
+            }, f, ensure_ascii=False, indent=2)
+
+        if not options["compare"]:
+            return
+
+        for name in sorted(set(base_dict) & set(bench_dict)):
+            ratio: float = _get_compare_ms(bench_dict[name]) /\
+                _get_compare_ms(base_dict[name])
+            self.stdout.write("{:<40} {:>6.2f}x{}".format(
+                name, ratio,
+                " (regression)" if name in regression_list else ""))
+        if regression_list:
+            raise CommandError(
+                "処理時間が劣化しました: {}".format(
+                    ", ".join(regression_list)))
+
+
+def create_bench_list() -> List[
+    Tuple[str, Callable[[], Any], Callable[[Any], Any]]
+]:
+    """計測対象を生成
+
+    計測対象毎に(名前、準備処理、計測処理)を生成する
+    準備処理の戻り値を計測処理の引数とし、準備処理は計測に含めない
+
+    Returns:
+        List[Tuple[str, Callable[[], Any], Callable[[Any], Any]]]: 計測対象
+    """
+    bench_list: List[
+        Tuple[str, Callable[[], Any], Callable[[Any], Any]]
+    ] = list()
+    for puzzle_name, puzzle in BENCH_PUZZLE_LIST:
+
+        def create_wk(puzzle: str = puzzle) -> AnalyzeWk:
+            return jsonConverter.cnv_val_list_to_analyze_wk(
+                jsonConverter.cnv_text_to_val_list(puzzle),
+                difficultyGrader.GRADE_METHOD_LIST)
+
+        def create_analyzed(
+            create_wk: Callable[[], AnalyzeWk] = create_wk
+        ) -> Tuple[bool, AnalyzeWk]:
+            wk: AnalyzeWk = create_wk()
+            return analyzeMain.analyze(wk), wk
+
+        bench_list.append((
+            "analyze/" + puzzle_name, create_wk, analyzeMain.analyze))
+        bench_list.append((
+            "flame_clone/" + puzzle_name,
+            lambda create_analyzed=create_analyzed: create_analyzed()[1],
+            lambda wk: wk.flame.clone()))
+        bench_list.append((
+            "json_response/" + puzzle_name, create_analyzed,
+            lambda analyzed: jsonConverter.creata_json_response(*analyzed)))
+
+        for method, analyze_func in BENCH_METHOD_LIST:
+            bench_list.append((
+                "method/{}/{}".format(method.name, puzzle_name),
+                lambda puzzle=puzzle, method=method: create_method_wk(
+                    puzzle, method),
+                lambda wk, analyze_func=analyze_func: analyze_func(
+                    wk, list())))
+
+    return bench_list
+
+
+def create_method_wk(puzzle: str, method: Method) -> AnalyzeWk:
+    """解法の計測用のワークを生成
+
+    消去法は解析前の盤面、それ以外の解法は消去法のみで解析が止まった盤面で計測する
+
+    Args:
+        puzzle (str): 問題文字列
+        method (Method): 解法
+
+    Returns:
+        AnalyzeWk: ワーク
+    """
+    val_list: List[int] = jsonConverter.cnv_text_to_val_list(puzzle)
+    limit_method_list: List[Method] = list()
+    if method == Method.NAKED_PAIR or method == Method.HIDDEN_PAIR:
+        limit_method_list.append(method)
+    wk: AnalyzeWk = jsonConverter.cnv_val_list_to_analyze_wk(
+        val_list, [method], limit_method_list)
+    if method in ELIMIONATION_METHOD_LIST:
+        analyzeMain.initBeforeAnalyze(wk)
+    else:
+        # 利用メソッドを消去法のみにして解析し、計測する解法を戻す
+        wk.use_method_list = list()
+        analyzeMain.analyze(wk)
+        wk.use_method_list = [method]
+    return wk
+
+
+def measure(
+    setup: Callable[[], Any],
+    func: Callable[[Any], Any],
+    repeat: int
+) -> Dict[str, float]:
+    """処理時間とメモリ使用量を計測
+
+    処理時間は計測回数分の最小値、中央値、95パーセンタイル
+    (比較には他の処理の影響を受けにくい最小値を使う)
+    メモリ使用量はtracemallocで計測した1回分の
+    処理後に残っているメモリブロック数とサイズ、ピークサイズ
+
+    Args:
+        setup (Callable[[], Any]): 準備処理
+        func (Callable[[Any], Any]): 計測処理
+        repeat (int): 計測回数
+
+    Returns:
+        Dict[str, float]: 計測結果
+    """
+    # ウォームアップ
+    func(setup())
+
+    time_list: List[float] = list()
+    for _ in range(repeat):
+        arg: Any = setup()
+        start: float = time.perf_counter()
+        func(arg)
+        time_list.append((time.perf_counter() - start) * 1000)
+    time_list.sort()
+
+    arg: Any = setup()
+    tracemalloc.start()
+    try:
+        result: Any = func(arg)
+        alloc_size, peak_size = tracemalloc.get_traced_memory()
+        alloc_blocks: int = sum(
+            stat.count for stat in
+            tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        tracemalloc.stop()
+    del result
+
+    return {
+        "minMs": time_list[0],
+        "medianMs": statistics.median(time_list),
+        "p95Ms": time_list[math.ceil(len(time_list) * 0.95) - 1],
+        "allocBlocks": alloc_blocks,
+        "allocKb": alloc_size / 1024,
+        "peakKb": peak_size / 1024,
+    }
+
+
+def compare(
+    base_dict: Dict[str, Dict[str, float]],
+    bench_dict: Dict[str, Dict[str, float]],
+    threshold: float
+) -> List[str]:
+    """過去の計測結果と比較
+
+    処理時間の最小値と中央値が両方とも過去の計測結果の比率を超え、
+    かつ最小値の差がREGRESSION_MIN_DIFF_MSを超える場合に劣化とみなす
+    (最小値、中央値の一方のみの外れ値を劣化とみなさない)
+
+    Args:
+        base_dict (Dict[str, Dict[str, float]]): 過去の計測結果
+        bench_dict (Dict[str, Dict[str, float]]): 今回の計測結果
+        threshold (float): 劣化とみなす処理時間の比率
+
+    Returns:
+        List[str]: 処理時間が劣化した計測対象の名前
+    """
+    regression_list: List[str] = list()
+    for name in sorted(set(base_dict) & set(bench_dict)):
+        base_ms: float = _get_compare_ms(base_dict[name])
+        bench_ms: float = _get_compare_ms(bench_dict[name])
+        if bench_ms > base_ms * threshold\
+                and bench_ms - base_ms > REGRESSION_MIN_DIFF_MS\
+                and bench_dict[name]["medianMs"]\
+                > base_dict[name]["medianMs"] * threshold:
+            regression_list.append(name)
+    return regression_list
+
+
+def _get_compare_ms(result_dict: Dict[str, float]) -> float:
+    """比較に使う処理時間を取得
+
+    最小値がない過去の計測結果は中央値で比較する
+
+    Args:
+        result_dict (Dict[str, float]): 計測結果
+
+    Returns:
+        float: 処理時間(ms)
+    """
+    return result_dict.get("minMs", result_dict["medianMs"])
@@ -0,0 +1,79 @@
+import json
+import os
+from typing import TextIO
+
+from django.core.management.base import BaseCommand, CommandError
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.GradeResult import GradeResult
+from sudokuapp.logic import difficultyGrader, puzzleGenerator
+
+
+class Command(BaseCommand):
+    """問題生成コマンド
+    """
+
+    # ヘルプ
+    help =\
+        "目標の解法のレベルの問題を生成し、1問1行のJSONで出力"
+
+    def add_arguments(self, parser):
+        """引数定義
+
+        Args:
+            parser (ArgumentParser): パーサ
+        """
+        parser.add_argument(
+            "--method", default=Method.X_WING.name,
+            choices=[
+                method.name for method in difficultyGrader.METHOD_LEVEL_DICT],
+            help="目標の解法")
+        parser.add_argument(
+            "--count", type=int, default=1,
+            help="生成する問題数")
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count(),
+            help="ワーカープロセス数(1の場合はプロセスプールを使わない)")
+        parser.add_argument(
+            "--seed", type=int,
+            help="乱数シード(省略時はランダム)")
+        parser.add_argument(
+            "--max-attempt", type=int, default=puzzleGenerator.MAX_ATTEMPT,
+            help="問題1問あたりの最大試行回数")
+        parser.add_argument(
+            "--output",
+            help="出力ファイル(省略時は標準出力)")
+
+    def handle(self, *args, **options):
+        """コマンド実行時のエントリーポイント
+        """
+        out_file: TextIO = self.stdout
+        if options["output"]:
+            out_file = open(options["output"], mode="w", encoding="utf-8")
+
+        gen_cnt: int = 0
+        try:
+            for grade in puzzleGenerator.generate(
+                    Method[options["method"]], options["count"],
+                    options["workers"], options["seed"],
+                    options["max_attempt"]):
+                write(out_file, grade)
+                gen_cnt += 1
+        finally:
+            if out_file is not self.stdout:
+                out_file.close()
+
+        if gen_cnt < options["count"]:
+            raise CommandError(
+                "最大試行回数までに生成出来た問題数: {}/{}".format(
+                    gen_cnt, options["count"]))
+
+
+def write(out_file: TextIO, grade: GradeResult) -> None:
+    """難易度判定結果を1行のJSONで出力
+
+    Args:
+        out_file (TextIO): 出力ファイル
+        grade (GradeResult): 難易度判定結果
+    """
+    out_file.write(json.dumps(grade.cnv_to_json(), ensure_ascii=False) + "\n")
@@ -0,0 +1,200 @@
+import collections
+import json
+import multiprocessing
+import os
+import sys
+from typing import Deque, Dict, Iterator, List, TextIO
+
+import django
+from django.core.management.base import BaseCommand
+
+from sudokuapp.data.GradeResult import GradeResult
+from sudokuapp.logic import difficultyGrader
+
+
+class Command(BaseCommand):
+    """難易度判定コマンド
+    """
+
+    # ヘルプ
+    help =\
+        "問題ファイル(1行81文字、空き枡は0または.)の各問題の難易度を判定し、" +\
+        "1問1行のJSONで出力"
+
+    def add_arguments(self, parser):
+        """引数定義
+
+        Args:
+            parser (ArgumentParser): パーサ
+        """
+        parser.add_argument(
+            "file",
+            help="問題ファイル(-の場合は標準入力)")
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count(),
+            help="ワーカープロセス数(1の場合はプロセスプールを使わない)")
+        parser.add_argument(
+            "--chunksize", type=int, default=64,
+            help="ワーカープロセスに1回で渡す問題数")
+        parser.add_argument(
+            "--output",
+            help="出力ファイル(省略時は標準出力)")
+
+    def handle(self, *args, **options):
+        """コマンド実行時のエントリーポイント
+        """
+        in_file: TextIO = sys.stdin
+        if options["file"] != "-":
+            in_file = open(options["file"], mode="r", encoding="utf-8")
+        out_file: TextIO = self.stdout
+        if options["output"]:
+            out_file = open(options["output"], mode="w", encoding="utf-8")
+
+        try:
+            level_cnt_dict: Dict[int, int] = main(
+                in_file, out_file, options["workers"], options["chunksize"])
+        finally:
+            if in_file is not sys.stdin:
+                in_file.close()
+            if out_file is not self.stdout:
+                out_file.close()
+
+        # 難易度レベル毎の問題数
+        # (問題文字列が不正な問題はレベルNone)
+        for level, cnt in sorted(
+                level_cnt_dict.items(),
+                key=lambda item: (item[0] is None, item[0])):
+            if level is None:
+                self.stderr.write("error: {}".format(cnt))
+                continue
+            self.stderr.write("level {}: {}".format(level, cnt))
+
+
+def main(
+    in_file: TextIO,
+    out_file: TextIO,
+    workers: int,
+    chunksize: int
+) -> Dict[int, int]:
+    """難易度判定メイン処理
+
+    ワーカープロセスに渡す問題はチャンク単位で(ワーカープロセス数 * 2)個までとし、
+    先頭のチャンクの判定が終わり次第出力して次のチャンクを渡す
+    (入力ファイルの行数によらずメモリ使用量を一定に保つ)
+
+    Args:
+        in_file (TextIO): 問題ファイル
+        out_file (TextIO): 出力ファイル
+        workers (int): ワーカープロセス数
+        chunksize (int): ワーカープロセスに1回で渡す問題数
+
+    Returns:
+        Dict[int, int]: 難易度レベル -> 問題数
+            (問題文字列が不正な問題はレベルNone)
+    """
+    level_cnt_dict: Dict[int, int] = dict()
+
+    def write(grade: GradeResult) -> None:
+        """難易度判定結果を1行のJSONで出力
+
+        Args:
+            grade (GradeResult): 難易度判定結果
+        """
+        out_file.write(
+            json.dumps(grade.cnv_to_json(), ensure_ascii=False) + "\n")
+        level: int = None if grade.error is not None else grade.level
+        level_cnt_dict[level] = level_cnt_dict.get(level, 0) + 1
+
+    if workers <= 1:
+        for puzzle in _read_puzzle(in_file):
+            write(grade_text(puzzle))
+        return level_cnt_dict
+
+    with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        # 判定中のチャンク(入力順)
+        pending_deque: Deque = collections.deque()
+        for chunk in _read_chunk(in_file, chunksize):
+            if len(pending_deque) >= workers * 2:
+                for grade in pending_deque.popleft().get():
+                    write(grade)
+            pending_deque.append(pool.apply_async(grade_chunk, (chunk,)))
+        while pending_deque:
+            for grade in pending_deque.popleft().get():
+                write(grade)
+
+    return level_cnt_dict
+
+
+def grade_text(text: str) -> GradeResult:
+    """問題文字列の難易度判定
+
+    問題文字列が不正な場合も処理を止めず、エラー内容を設定した判定結果を返す
+
+    Args:
+        text (str): 問題文字列(81文字、空き枡は0または.)
+
+    Returns:
+        GradeResult: 難易度判定結果
+    """
+    try:
+        return difficultyGrader.grade_text(text)
+    except ValueError as e:
+        return GradeResult(text, error=str(e))
+
+
+def grade_chunk(text_list: List[str]) -> List[GradeResult]:
+    """問題文字列をまとめて難易度判定(ワーカープロセス用)
+
+    Args:
+        text_list (List[str]): 問題文字列リスト
+
+    Returns:
+        List[GradeResult]: 難易度判定結果リスト
+    """
+    return [grade_text(text) for text in text_list]
+
+
+def _read_puzzle(in_file: TextIO) -> Iterator[str]:
+    """問題ファイルから問題文字列を読み込む
+
+    空行、#から始まる行は読み飛ばす
+
+    Args:
+        in_file (TextIO): 問題ファイル
+
+    Returns:
+        Iterator[str]: 問題文字列
+    """
+    for line in in_file:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        yield line
+
+
+def _read_chunk(in_file: TextIO, chunksize: int) -> Iterator[List[str]]:
+    """問題ファイルから問題文字列をチャンク単位で読み込む
+
+    Args:
+        in_file (TextIO): 問題ファイル
+        chunksize (int): チャンクの問題数
+
+    Returns:
+        Iterator[List[str]]: 問題文字列リスト
+    """
+    chunk: List[str] = list()
+    for puzzle in _read_puzzle(in_file):
+        chunk.append(puzzle)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = list()
+    if chunk:
+        yield chunk
+
+
+def _init_worker() -> None:
+    """ワーカープロセス初期化
+
+    spawnで起動した場合(Windowsなど)はDjangoが未初期化のため初期化する
+    """
+    django.setup()
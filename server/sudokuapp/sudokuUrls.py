@@ -6,4 +6,5 @@ urlpatterns = [
     path("", sudokuViews.index, name="index"),
     path("history", sudokuViews.index, name="index"),
     path("api/analyze", sudokuViews.analyze, name="analyze"),
+    path("api/generate", sudokuViews.generate, name="generate"),
 ]
@@ -1,12 +1,28 @@
 import json
-from typing import Any, Dict
+import logging
+import threading
+from typing import Any, Dict, List
 
 from django.http import HttpRequest, JsonResponse
 from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt
 
+from sudokuapp.const.Method import Method
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
-from sudokuapp.logic import analyzeMain, jsonConverter
+from sudokuapp.data.GradeResult import GradeResult
+from sudokuapp.logic import (analyzeMain, difficultyGrader, jsonConverter,
+                             puzzleGenerator)
+
+logger = logging.getLogger(__name__)
+
+# 問題生成APIの問題1問あたりの最大試行回数
+# (リクエストの応答時間を抑えるため、コマンドより少なくする)
+GENERATE_MAX_ATTEMPT: int = 30
+
+# 問題生成APIの同時実行数の上限
+# (問題生成はCPUを占有するため、上限を超えたリクエストは待たせずに503を返す)
+GENERATE_CONCURRENCY: int = 1
+_generate_semaphore = threading.BoundedSemaphore(GENERATE_CONCURRENCY)
 
 
 def index(req: HttpRequest) -> Any:
@@ -39,5 +55,63 @@ def analyze(req: HttpRequest) -> JsonResponse:
     # 数独解析
     result: bool = analyzeMain.analyze(wk)
 
+    # 解法毎の解析統計をログ出力
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("analyze result=%s unfixed=%d %s", result, wk.unfixed_cnt,
+                    " ".join(
+                        "{}(call={} hit={} how={} {:.3f}ms)".format(
+                            stat.method.name, stat.call_cnt, stat.hit_cnt,
+                            stat.how_anlz_cnt, stat.time_sec * 1000)
+                        for stat in wk.method_stat_dict.values()))
+
+    # JSONレスポンス返却
+    # (リクエストのstatsがTrueの場合は解法毎の解析統計も返却)
+    return jsonConverter.creata_json_response(
+        result, wk, json_dict.get("stats", False))
+
+
+@csrf_exempt
+def generate(req: HttpRequest) -> JsonResponse:
+    """問題生成API
+
+    リクエスト(JSON)
+        method (str): 目標の解法(省略時はX_WING)
+        seed (int): 乱数シード(省略時はランダム)
+
+    リクエストを処理するプロセス内で1問ずつ試行する(ワーカープロセスは使わない)
+    生成出来た場合、レスポンスのhardestMethodが問題に必要な最も難しい解法
+
+    Args:
+        req (HttpRequest): リクエスト
+
+    Returns:
+        JsonResponse: JSON
+    """
+
+    # パラメータ取得
+    json_dict: Dict[str, any] = dict()
+    if req.body:
+        json_dict = json.loads(req.body.decode("utf-8"))
+    method_name: str = json_dict.get("method", Method.X_WING.name)
+    if method_name not in Method.__members__ or \
+            Method[method_name] not in difficultyGrader.METHOD_LEVEL_DICT:
+        return JsonResponse({"result": False}, status=400)
+    seed: int = json_dict.get("seed")
+    if seed is not None and (
+            not isinstance(seed, int) or isinstance(seed, bool)):
+        return JsonResponse({"result": False}, status=400)
+
+    # 問題生成
+    if not _generate_semaphore.acquire(blocking=False):
+        return JsonResponse({"result": False}, status=503)
+    try:
+        grade_list: List[GradeResult] = list(puzzleGenerator.generate(
+            Method[method_name], workers=1, seed=seed,
+            max_attempt=GENERATE_MAX_ATTEMPT))
+    finally:
+        _generate_semaphore.release()
+
     # JSONレスポンス返却
-    return jsonConverter.creata_json_response(result, wk)
+    if len(grade_list) == 0:
+        return JsonResponse({"result": False})
+    return JsonResponse(grade_list[0].cnv_to_json())
@@ -1,3 +1,281 @@
-from django.test import TestCase
+from typing import List
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from sudokuapp.const.Method import Method
+from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.data.Board import Board
+from sudokuapp.data.History import KEYFRAME_INTERVAL
+from sudokuapp.logic import (analyzeMain, batchSolver, difficultyGrader,
+                             jsonConverter)
+from sudokuapp.logic.method import methodHiddenPair, methodNakedPair
+from sudokuapp.util import ExactCover
+from sudokuapp.util.CellIndex import ROW_UNIT_LIST, SQU_CNT
+from sudokuapp.util.MemoMask import (ALL_MASK, MEMO_BIT, MEMO_LIST,
+                                     cnv_memo_list_to_mask)
+
+# 唯一解の問題
+UNIQUE_PUZZLE: str = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"  # noqa: E501
+
+# UNIQUE_PUZZLEの解
+UNIQUE_SOLUTION: str = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"  # noqa: E501
+
+# 解が複数ある問題
+MULTI_PUZZLE: str = "000000000000003085001020000000507000004000100090000000500000073002010000000040000"  # noqa: E501
+
+# 解がない問題(同じ領域に確定値の重複はないが、1:1に入る数字がない)
+NO_SOLUTION_PUZZLE: str = "012345678900000000000000000000000000000000000000000000000000000000000000000000000"  # noqa: E501
+
+# 難しい解法が必要な問題
+# (ロックされた候補法、ネイキッドペア、隠れペア、X-Wing、Swordfish、
+#  シンプルカラーリング、XYチェーン、シンプルチェーンのいずれかを利用する)
+HARD_PUZZLE_LIST: List[str] = [
+    "600008000000000500009102080002800670040601900150000000000740005000000800090006030",  # noqa: E501
+    "600050300070006004280709106950000001000240900020005003007000000000003800000680000",  # noqa: E501
+    "005480600000000050020005700000037001010006070060020000000700204800000000304060000",  # noqa: E501
+    "001000830006004050578000006000900002000005600080000073700060000050040000090302080",  # noqa: E501
+    "000000000610090050900003080040670009000000070007000810070840100800039004000001000",  # noqa: E501
+    "000400208003100000405008109000090407102004005000507000001000060040000000300070050",  # noqa: E501
+]
+
+
+def _create_wk(text: str) -> AnalyzeWk:
+    """問題文字列から解析WKを作成
+
+    Args:
+        text (str): 問題文字列
+
+    Returns:
+        AnalyzeWk: 解析WK
+    """
+    return jsonConverter.cnv_val_list_to_analyze_wk(
+        jsonConverter.cnv_text_to_val_list(text),
+        difficultyGrader.GRADE_METHOD_LIST)
+
+
+class ExactCoverTest(SimpleTestCase):
+    """完全被覆のテスト
+    """
+
+    def test_unique(self):
+        solution_list = ExactCover.solve(
+            jsonConverter.cnv_text_to_val_list(UNIQUE_PUZZLE), limit=2)
+        self.assertEqual(len(solution_list), 1)
+        self.assertEqual(
+            "".join(str(val) for val in solution_list[0]), UNIQUE_SOLUTION)
+
+    def test_no_solution(self):
+        self.assertEqual(ExactCover.count_solution(
+            jsonConverter.cnv_text_to_val_list(NO_SOLUTION_PUZZLE)), 0)
+
+    def test_duplicate(self):
+        val_list = jsonConverter.cnv_text_to_val_list(UNIQUE_PUZZLE)
+        val_list[0] = 3
+        self.assertEqual(ExactCover.count_solution(val_list), 0)
+
+    def test_multiple(self):
+        val_list = jsonConverter.cnv_text_to_val_list(MULTI_PUZZLE)
+        self.assertEqual(ExactCover.count_solution(val_list, limit=2), 2)
+        self.assertEqual(ExactCover.count_solution(val_list, limit=5), 5)
+
+    def test_input_is_unchanged(self):
+        val_list = jsonConverter.cnv_text_to_val_list(UNIQUE_PUZZLE)
+        ExactCover.solve(val_list)
+        self.assertEqual(
+            "".join(str(val) for val in val_list), UNIQUE_PUZZLE)
+
+
+class AnalyzeMainTest(SimpleTestCase):
+    """解析のテスト
+    """
+
+    def test_multiple_solution_is_error(self):
+        wk: AnalyzeWk = _create_wk(MULTI_PUZZLE)
+        self.assertFalse(analyzeMain.analyze(wk))
+        self.assertEqual(
+            wk.histroy_list[-1].how_anlz_list[0].method, Method.ERROR_CHECK)
+
+    def test_unique_is_solved(self):
+        wk: AnalyzeWk = _create_wk(UNIQUE_PUZZLE)
+        self.assertTrue(analyzeMain.analyze(wk))
+        self.assertEqual(wk.unfixed_cnt, 0)
+        self.assertEqual("".join(
+            str(wk.flame.board.get_fixed_val(idx))
+            for idx in range(SQU_CNT)), UNIQUE_SOLUTION)
+
+    def test_elimination_keeps_solution(self):
+        # 全ての解法の解析結果で、解の数字が確定値またはメモに残っていること
+        used_method_set = set()
+        for puzzle in HARD_PUZZLE_LIST:
+            with self.subTest(puzzle=puzzle):
+                solution: List[int] = ExactCover.solve(
+                    jsonConverter.cnv_text_to_val_list(puzzle))[0]
+                wk: AnalyzeWk = _create_wk(puzzle)
+                self.assertTrue(analyzeMain.analyze(wk))
+                self.assertEqual(wk.unfixed_cnt, 0)
+                used_method_set.update(
+                    history.how_anlz_list[0].method
+                    for history in wk.histroy_list if history.how_anlz_list)
+                board: Board = wk.flame.board
+                for idx in range(SQU_CNT):
+                    fixed_val: int = board.get_fixed_val(idx)
+                    if fixed_val:
+                        self.assertEqual(fixed_val, solution[idx])
+                    else:
+                        self.assertTrue(
+                            board.memo_arr[idx] & MEMO_BIT[solution[idx]])
+
+        # 難易度判定で利用する解法(Jellyfish以外)を全て利用していること
+        self.assertEqual(
+            set(difficultyGrader.GRADE_METHOD_LIST) - used_method_set,
+            {Method.JELLYFISH})
+
+    def test_adaptive_order_keeps_history(self):
+        # 前提条件を満たさない解法を省略しても、解析方法の説明は変わらないこと
+        for puzzle in HARD_PUZZLE_LIST:
+            with self.subTest(puzzle=puzzle):
+                wk: AnalyzeWk = _create_wk(puzzle)
+                analyzeMain.analyze(wk)
+                adaptive_wk: AnalyzeWk = _create_wk(puzzle)
+                adaptive_wk.adaptive_order = True
+                analyzeMain.analyze(adaptive_wk)
+                self.assertEqual(
+                    [[how_anlz.msg for how_anlz in history.how_anlz_list]
+                     for history in adaptive_wk.histroy_list],
+                    [[how_anlz.msg for how_anlz in history.how_anlz_list]
+                     for history in wk.histroy_list])
+                self.assertLessEqual(
+                    sum(stat.call_cnt
+                        for stat in adaptive_wk.method_stat_dict.values()),
+                    sum(stat.call_cnt
+                        for stat in wk.method_stat_dict.values()))
+
+
+class NakedPairTest(SimpleTestCase):
+    """ネイキッドペアのテスト
+    """
+
+    def _create_subset_wk(self, use_method_list: List[Method]) -> AnalyzeWk:
+        """1行目の枡1～5のメモが[1,2,3,4,5]の(5個のネイキッドペアがある)ワークを作成
+
+        5個のネイキッドペアの残りの枡(枡6～9)は4個の隠れペア[6,7,8,9]になる
+
+        Args:
+            use_method_list (List[Method]): 利用メソッド
+
+        Returns:
+            AnalyzeWk: ワーク
+        """
+        wk: AnalyzeWk = jsonConverter.cnv_val_list_to_analyze_wk(
+            [0] * SQU_CNT, use_method_list)
+        analyzeMain.initBeforeAnalyze(wk)
+        for idx in ROW_UNIT_LIST[0][:5]:
+            wk.remove_memo(
+                idx, ALL_MASK & ~cnv_memo_list_to_mask([1, 2, 3, 4, 5]))
+        return wk
+
+    def _get_row_memo_list(self, wk: AnalyzeWk) -> List[List[int]]:
+        """1行目の枡毎のメモを取得
+
+        Args:
+            wk (AnalyzeWk): ワーク
+
+        Returns:
+            List[List[int]]: 枡毎のメモ
+        """
+        return [
+            list(MEMO_LIST[wk.flame.board.memo_arr[idx]])
+            for idx in ROW_UNIT_LIST[0]]
+
+    def test_large_subset_without_hidden_pair(self):
+        # 隠れペアを利用しない場合は未確定枡数の半分を超えるペアも対象とする
+        wk: AnalyzeWk = self._create_subset_wk([Method.NAKED_PAIR])
+        methodNakedPair.analyze(wk, list())
+        self.assertEqual(
+            self._get_row_memo_list(wk),
+            [[1, 2, 3, 4, 5]] * 5 + [[6, 7, 8, 9]] * 4)
+
+    def test_large_subset_with_hidden_pair(self):
+        # 隠れペアを利用する場合は隠れペアで除外する
+        wk: AnalyzeWk = self._create_subset_wk(
+            [Method.NAKED_PAIR, Method.HIDDEN_PAIR])
+        methodNakedPair.analyze(wk, list())
+        self.assertEqual(
+            self._get_row_memo_list(wk),
+            [[1, 2, 3, 4, 5]] * 5 + [list(range(1, 10))] * 4)
+
+        methodHiddenPair.analyze(wk, list())
+        self.assertEqual(
+            self._get_row_memo_list(wk),
+            [[1, 2, 3, 4, 5]] * 5 + [[6, 7, 8, 9]] * 4)
+
+
+class BatchSolverTest(SimpleTestCase):
+    """一括解析のテスト
+    """
+
+    def test_singles(self):
+        result_list = batchSolver.analyze_batch([
+            jsonConverter.cnv_text_to_val_list(UNIQUE_PUZZLE),
+            jsonConverter.cnv_text_to_val_list(HARD_PUZZLE_LIST[0]),
+            jsonConverter.cnv_text_to_val_list(NO_SOLUTION_PUZZLE),
+        ], difficultyGrader.GRADE_METHOD_LIST)
+
+        # 消去法のみで解ける
+        self.assertTrue(result_list[0].solved)
+        self.assertFalse(result_list[0].fallback)
+        self.assertEqual(
+            "".join(str(val) for val in result_list[0].val_list),
+            UNIQUE_SOLUTION)
+
+        # 1問ずつの解析で解く
+        self.assertTrue(result_list[1].fallback)
+        self.assertTrue(result_list[1].solved)
+        self.assertIn(Method.XY_CHAIN, result_list[1].method_list)
+        self.assertEqual(result_list[1].val_list, ExactCover.solve(
+            jsonConverter.cnv_text_to_val_list(HARD_PUZZLE_LIST[0]))[0])
+
+        # 矛盾あり
+        self.assertTrue(result_list[2].error)
+        self.assertFalse(result_list[2].solved)
+
+
+class HistoryTest(SimpleTestCase):
+    """解析履歴のテスト
+    """
+
+    def test_round_trip(self):
+        # 解析履歴追加時の盤面と、解析履歴から復元した盤面が一致すること
+        board_list: List[Board] = list()
+        append_history = AnalyzeWk._append_history
+
+        def record(wk: AnalyzeWk, how_anlz_list) -> None:
+            board_list.append(wk.flame.board.clone())
+            append_history(wk, how_anlz_list)
+
+        with mock.patch.object(AnalyzeWk, "_append_history", record):
+            wk: AnalyzeWk = _create_wk(HARD_PUZZLE_LIST[0])
+            analyzeMain.analyze(wk)
+
+        # キーフレームをまたぐこと
+        self.assertGreater(len(wk.histroy_list), KEYFRAME_INTERVAL * 2)
+        self.assertEqual(len(wk.histroy_list), len(board_list))
+
+        for step, board in enumerate(board_list):
+            with self.subTest(step=step):
+                self.assertEqual(
+                    (step % KEYFRAME_INTERVAL == 0),
+                    wk.histroy_list[step].keyframe is not None)
+                self.assertEqual(wk.get_history_flame(step).board, board)
+
+        for step, (_, flame) in enumerate(wk.iter_history_flame()):
+            with self.subTest(step=step):
+                self.assertEqual(flame.board, board_list[step])
+
+    def test_error_history(self):
+        wk: AnalyzeWk = _create_wk(MULTI_PUZZLE)
+        analyzeMain.analyze(wk)
+        step: int = len(wk.histroy_list) - 1
+        self.assertEqual(
+            wk.get_history_flame(step).board, wk.flame.board)
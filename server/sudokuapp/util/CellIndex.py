@@ -0,0 +1,135 @@
+"""枡番号
+
+盤面の81枡を行優先の枡番号(0～80)で表現するためのテーブル群
+枡番号 = (行 - 1) * 9 + (列 - 1)
+
+また、27個の領域(エリア、行、列)を領域番号(0～26)で表現する
+ 0～ 8: エリア1～9
+ 9～17: 行1～9
+18～26: 列1～9
+
+テーブルはimport時に一度だけ生成して全リクエストで共有する
+"""
+from typing import FrozenSet, Tuple
+
+# 枡数
+SQU_CNT: int = 81
+
+# 枡番号 -> 行(1start)
+ROW_OF: Tuple[int, ...] = tuple(idx // 9 + 1 for idx in range(SQU_CNT))
+
+# 枡番号 -> 列(1start)
+CLM_OF: Tuple[int, ...] = tuple(idx % 9 + 1 for idx in range(SQU_CNT))
+
+# 枡番号 -> エリアID(1start)
+AREA_OF: Tuple[int, ...] = tuple(
+    (idx // 27) * 3 + (idx % 9) // 3 + 1 for idx in range(SQU_CNT))
+
+# 枡番号 -> 枡ID(エリア内の位置、1start)
+SQU_OF: Tuple[int, ...] = tuple(
+    ((idx // 9) % 3) * 3 + (idx % 3) + 1 for idx in range(SQU_CNT))
+
+# エリアID、枡ID -> 枡番号
+# AREA_SQU_IDX[エリアID][枡ID]
+# (添字0は未使用)
+AREA_SQU_IDX: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        ((area_id - 1) // 3 * 3 + (squ_id - 1) // 3) * 9 + (area_id - 1) % 3 * 3 + (squ_id - 1) % 3
+        if area_id > 0 and squ_id > 0 else -1
+        for squ_id in range(10))
+    for area_id in range(10))
+
+# エリア順の枡番号
+# (エリア1の枡1～9、エリア2の枡1～9、...)
+AREA_ORDER_IDX: Tuple[int, ...] = tuple(
+    AREA_SQU_IDX[area_id][squ_id]
+    for area_id in range(1, 10) for squ_id in range(1, 10))
+
+# 領域番号 -> 枡番号タプル(昇順)
+UNIT_LIST: Tuple[Tuple[int, ...], ...] =\
+    tuple(tuple(sorted(AREA_SQU_IDX[area_id][1:])) for area_id in range(1, 10)) +\
+    tuple(tuple(range((row - 1) * 9, row * 9)) for row in range(1, 10)) +\
+    tuple(tuple(range(clm - 1, SQU_CNT, 9)) for clm in range(1, 10))
+
+# エリア、行、列の領域番号
+AREA_UNIT_NO: range = range(0, 9)
+ROW_UNIT_NO: range = range(9, 18)
+CLM_UNIT_NO: range = range(18, 27)
+
+# エリアの枡番号タプルリスト(添字はエリアID - 1)
+AREA_UNIT_LIST: Tuple[Tuple[int, ...], ...] = UNIT_LIST[0:9]
+
+# 行の枡番号タプルリスト(添字は行 - 1)
+ROW_UNIT_LIST: Tuple[Tuple[int, ...], ...] = UNIT_LIST[9:18]
+
+# 列の枡番号タプルリスト(添字は列 - 1)
+CLM_UNIT_LIST: Tuple[Tuple[int, ...], ...] = UNIT_LIST[18:27]
+
+# 枡番号 -> 所属する領域番号(エリア、行、列)
+CELL_UNIT_LIST: Tuple[Tuple[int, int, int], ...] = tuple(
+    (AREA_OF[idx] - 1, ROW_OF[idx] - 1 + 9, CLM_OF[idx] - 1 + 18)
+    for idx in range(SQU_CNT))
+
+# 枡番号 -> 所属する領域内の位置(0start、エリア、行、列)
+# (UNIT_LIST[領域番号][位置] == 枡番号)
+CELL_UNIT_POS_LIST: Tuple[Tuple[int, int, int], ...] = tuple(
+    (SQU_OF[idx] - 1, CLM_OF[idx] - 1, ROW_OF[idx] - 1)
+    for idx in range(SQU_CNT))
+
+# 枡番号 -> 影響枡(同一エリア、行、列の自枡以外の20枡)の枡番号タプル(昇順)
+PEER_LIST: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(sorted(
+        set().union(*(UNIT_LIST[unit_no] for unit_no in CELL_UNIT_LIST[idx])) - {idx}))
+    for idx in range(SQU_CNT))
+
+# 枡番号 -> 影響枡マスク(影響枡の枡番号のビットを立てたもの)
+PEER_MASK_LIST: Tuple[int, ...] = tuple(
+    sum(1 << peer_idx for peer_idx in peer_list) for peer_list in PEER_LIST)
+
+# 枡番号 -> 影響枡SET
+_PEER_SET_LIST: Tuple[FrozenSet[int], ...] = tuple(
+    frozenset(peer_list) for peer_list in PEER_LIST)
+
+# 2枡の共通影響枡(両方の枡の影響枡となる枡)の枡番号タプル(昇順)
+# COMMON_PEER_LIST[枡番号1][枡番号2]
+COMMON_PEER_LIST: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(sorted(_PEER_SET_LIST[idx1] & _PEER_SET_LIST[idx2]))
+        for idx2 in range(SQU_CNT))
+    for idx1 in range(SQU_CNT))
+
+# エリアと行(列)の交差(3枡)の54個のタプル
+# (エリアの領域番号、行(列)の領域番号、
+#  エリア内の交差の位置マスク、行(列)内の交差の位置マスク)
+# (エリア順、同一エリア内は行、列の順)
+# ※kind: 1=行、2=列(CELL_UNIT_LIST、CELL_UNIT_POS_LISTの添字)
+INTERSECTION_LIST: Tuple[Tuple[int, int, int, int], ...] = tuple(
+    (area_no, line_no,
+     sum(1 << CELL_UNIT_POS_LIST[idx][0]
+         for idx in UNIT_LIST[area_no] if idx in UNIT_LIST[line_no]),
+     sum(1 << CELL_UNIT_POS_LIST[idx][kind]
+         for idx in UNIT_LIST[area_no] if idx in UNIT_LIST[line_no]))
+    for area_no in AREA_UNIT_NO
+    for kind in (1, 2)
+    for line_no in sorted(
+        {CELL_UNIT_LIST[idx][kind] for idx in UNIT_LIST[area_no]}))
+
+# 領域番号 -> 領域を含む交差のタプル
+# (エリアは6個(行、列の順)、行(列)は3個)
+UNIT_INTERSECTION_LIST: Tuple[Tuple[Tuple[int, int, int, int], ...], ...] =\
+    tuple(
+        tuple(inter for inter in INTERSECTION_LIST if unit_no in inter[:2])
+        for unit_no in range(len(UNIT_LIST)))
+
+
+def cnv_row_clm_to_idx(row: int, clm: int) -> int:
+    """行と列を枡番号に変換
+
+    Args:
+        row (int): 行(1start)
+        clm (int): 列(1start)
+
+    Returns:
+        int: 枡番号
+    """
+    return (row - 1) * 9 + (clm - 1)
@@ -0,0 +1,183 @@
+"""完全被覆(Exact Cover)
+
+数独を完全被覆問題(枡、行×数字、列×数字、エリア×数字の324制約を
+ちょうど1回ずつ満たす)として総当たりで解くための関数群
+
+Dancing Linksの列選択(候補が最も少ない制約から選ぶ)を
+領域毎の確定値マスク(ビットボード)で行う。
+・候補がない枡、領域内で入りうる枡がない数字があれば矛盾
+・候補が1つの枡、領域内で入りうる枡が1つの数字があれば確定
+・それ以外は候補が最も少ない枡で分岐する
+"""
+from typing import List, Sequence
+
+from sudokuapp.util.CellIndex import CELL_UNIT_LIST, SQU_CNT, UNIT_LIST
+from sudokuapp.util.MemoMask import (ALL_MASK, BIT_CNT, LOWEST_MEMO,
+                                     MEMO_BIT, MEMO_LIST)
+
+
+def solve(
+    val_list: Sequence[int],
+    limit: int = 1
+) -> List[List[int]]:
+    """解を算出
+
+    Args:
+        val_list (Sequence[int]): 枡番号 -> 確定値(未確定は0)
+        limit (int): 算出する解の上限数
+
+    Returns:
+        List[List[int]]: 解(枡番号 -> 値)リスト
+            (矛盾がある場合は空のリスト)
+    """
+    wk_val_list: List[int] = list(val_list)
+
+    # 領域番号 -> 確定値マスク
+    unit_fixed_list: List[int] = [0] * len(UNIT_LIST)
+    for idx in range(SQU_CNT):
+        val: int = wk_val_list[idx]
+        if not val:
+            continue
+        bit: int = MEMO_BIT[val]
+        for unit_no in CELL_UNIT_LIST[idx]:
+            # 領域内で確定値が重複している
+            if unit_fixed_list[unit_no] & bit:
+                return list()
+            unit_fixed_list[unit_no] |= bit
+
+    unfixed_set = {idx for idx in range(SQU_CNT) if not wk_val_list[idx]}
+    solution_list: List[List[int]] = list()
+    _search(wk_val_list, unit_fixed_list, unfixed_set, solution_list, limit)
+    return solution_list
+
+
+def count_solution(val_list: Sequence[int], limit: int = 2) -> int:
+    """解の数を算出
+
+    Args:
+        val_list (Sequence[int]): 枡番号 -> 確定値(未確定は0)
+        limit (int): 数える解の上限数(上限に達したら探索を打ち切る)
+
+    Returns:
+        int: 解の数(上限数まで)
+    """
+    return len(solve(val_list, limit))
+
+
+def _search(
+    val_list: List[int],
+    unit_fixed_list: List[int],
+    unfixed_set: set,
+    solution_list: List[List[int]],
+    limit: int
+) -> bool:
+    """解の探索(再帰)
+
+    Args:
+        val_list (List[int]): 枡番号 -> 確定値(未確定は0)
+        unit_fixed_list (List[int]): 領域番号 -> 確定値マスク
+        unfixed_set (set): 未確定枡(枡番号)SET
+        solution_list (List[List[int]]): 解リスト
+        limit (int): 算出する解の上限数
+
+    Returns:
+        bool: 上限数に達した場合にTrue
+    """
+    if not unfixed_set:
+        solution_list.append(list(val_list))
+        return len(solution_list) >= limit
+
+    # 候補が最も少ない枡を探す
+    # 枡番号 -> 候補マスク
+    cand_dict = dict()
+    best_idx: int = -1
+    best_cnt: int = 10
+    for idx in unfixed_set:
+        area, row, clm = CELL_UNIT_LIST[idx]
+        cand: int = ALL_MASK & ~(unit_fixed_list[area] | unit_fixed_list[row] | unit_fixed_list[clm])
+        cand_cnt: int = BIT_CNT[cand]
+        # 候補がない枡がある
+        if cand_cnt == 0:
+            return False
+        cand_dict[idx] = cand
+        if cand_cnt < best_cnt:
+            best_idx = idx
+            best_cnt = cand_cnt
+
+    # 候補が1つの枡があればそのまま確定する
+    if best_cnt > 1:
+        # 領域内で入りうる枡が1つの数字を探す
+        for unit_no, unit in enumerate(UNIT_LIST):
+            unfixed_mask: int = ALL_MASK & ~unit_fixed_list[unit_no]
+            if unfixed_mask == 0:
+                continue
+            # 1枡以上に入りうる数字、2枡以上に入りうる数字
+            once_mask: int = 0
+            twice_mask: int = 0
+            for idx in unit:
+                cand: int = cand_dict.get(idx, 0)
+                twice_mask |= once_mask & cand
+                once_mask |= cand
+            # 数字が入りうる枡がない
+            if once_mask & unfixed_mask != unfixed_mask:
+                return False
+            only_mask: int = once_mask & ~twice_mask
+            if only_mask == 0:
+                continue
+            # 数字が入りうる1枡で確定する
+            memo: int = LOWEST_MEMO[only_mask]
+            for idx in unit:
+                if cand_dict.get(idx, 0) & MEMO_BIT[memo]:
+                    return _assign(
+                        val_list, unit_fixed_list, unfixed_set,
+                        solution_list, limit, idx, memo)
+
+    # 枡の候補で分岐
+    for memo in MEMO_LIST[cand_dict[best_idx]]:
+        if _assign(
+                val_list, unit_fixed_list, unfixed_set,
+                solution_list, limit, best_idx, memo):
+            return True
+    return False
+
+
+def _assign(
+    val_list: List[int],
+    unit_fixed_list: List[int],
+    unfixed_set: set,
+    solution_list: List[List[int]],
+    limit: int,
+    idx: int,
+    memo: int
+) -> bool:
+    """値を仮に確定して探索し、元に戻す
+
+    Args:
+        val_list (List[int]): 枡番号 -> 確定値(未確定は0)
+        unit_fixed_list (List[int]): 領域番号 -> 確定値マスク
+        unfixed_set (set): 未確定枡(枡番号)SET
+        solution_list (List[List[int]]): 解リスト
+        limit (int): 算出する解の上限数
+        idx (int): 枡番号
+        memo (int): 値
+
+    Returns:
+        bool: 上限数に達した場合にTrue
+    """
+    bit: int = MEMO_BIT[memo]
+    area, row, clm = CELL_UNIT_LIST[idx]
+    val_list[idx] = memo
+    unit_fixed_list[area] |= bit
+    unit_fixed_list[row] |= bit
+    unit_fixed_list[clm] |= bit
+    unfixed_set.discard(idx)
+
+    result: bool = _search(
+        val_list, unit_fixed_list, unfixed_set, solution_list, limit)
+
+    val_list[idx] = 0
+    unit_fixed_list[area] &= ~bit
+    unit_fixed_list[row] &= ~bit
+    unit_fixed_list[clm] &= ~bit
+    unfixed_set.add(idx)
+    return result
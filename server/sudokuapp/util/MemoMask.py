@@ -0,0 +1,106 @@
+"""メモマスク
+
+メモ(1～9)を9bitの整数で表現するためのテーブル・関数群
+
+数字Nは(1 << (N - 1))のビットで表現する
+例>
+メモ=[1, 3, 9]
+⇒
+0b100000101
+
+和集合、積集合、個数の算出を整数演算のみで行うため、
+ビット数、最下位ビットなどのテーブルはimport時に一度だけ生成して共有する
+"""
+from typing import Any, Iterator, List, Tuple
+
+# 全てのメモ(1～9)のマスク
+ALL_MASK: int = 0x1FF
+
+# 数字 -> ビット
+# (添字0は未使用)
+MEMO_BIT: Tuple[int, ...] = tuple(
+    [0] + [1 << (memo - 1) for memo in range(1, 10)])
+
+# マスク -> ビット数(メモ数)
+BIT_CNT: Tuple[int, ...] = tuple(
+    bin(mask).count("1") for mask in range(ALL_MASK + 1))
+
+# マスク -> 最下位ビットの数字(最小のメモ)
+# (マスク0の場合は0)
+LOWEST_MEMO: Tuple[int, ...] = tuple(
+    (mask & -mask).bit_length() for mask in range(ALL_MASK + 1))
+
+# マスク -> メモリスト(昇順)
+MEMO_LIST: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(memo for memo in range(1, 10) if mask & MEMO_BIT[memo])
+    for mask in range(ALL_MASK + 1))
+
+# マスク -> ビット位置リスト(0start、昇順)
+# (領域内の位置マスクなど、数字以外のマスク用)
+BIT_POS_LIST: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(memo - 1 for memo in memo_list) for memo_list in MEMO_LIST)
+
+
+def cnv_memo_list_to_mask(memo_list: List[int]) -> int:
+    """メモリストをマスクに変換
+
+    Args:
+        memo_list (List[int]): メモリスト
+
+    Returns:
+        int: マスク
+    """
+    mask: int = 0
+    for memo in memo_list:
+        mask |= MEMO_BIT[memo]
+    return mask
+
+
+def cnv_mask_to_memo_list(mask: int) -> List[int]:
+    """マスクをメモリストに変換
+
+    Args:
+        mask (int): マスク
+
+    Returns:
+        List[int]: メモリスト(昇順)
+    """
+    return list(MEMO_LIST[mask])
+
+
+def iter_mask_subset(
+    item_list: List[Tuple[Any, int]],
+    size: int
+) -> Iterator[Tuple[List[Tuple[Any, int]], int]]:
+    """マスクのORのビット数が要素数と一致する組み合わせを生成
+
+    ネイキッドペア(枡のメモマスク)、隠れペア(数字の位置マスク)、
+    フィッシュ(行(列)の位置マスク)の組み合わせの探索で共通して利用する
+    組み合わせを要素の順に作りながらマスクのORを取り、
+    ビット数が要素数を超えた時点で打ち切る
+
+    Args:
+        item_list (List[Tuple[Any, int]]): 要素(キー、マスク)リスト
+        size (int): 組み合わせの要素数
+
+    Returns:
+        Iterator[Tuple[List[Tuple[Any, int]], int]]:
+            組み合わせ(キー、マスク)リストとマスクのOR
+    """
+    chosen_list: List[Tuple[Any, int]] = list()
+
+    def search(start: int, union_mask: int) -> Iterator:
+        if len(chosen_list) == size:
+            if BIT_CNT[union_mask] == size:
+                yield list(chosen_list), union_mask
+            return
+        # 残りの要素数が足りない組み合わせは作らない
+        for no in range(start, len(item_list) - (size - len(chosen_list)) + 1):
+            next_mask: int = union_mask | item_list[no][1]
+            if BIT_CNT[next_mask] > size:
+                continue
+            chosen_list.append(item_list[no])
+            yield from search(no + 1, next_mask)
+            chosen_list.pop()
+
+    yield from search(0, 0)
@@ -10,6 +10,7 @@ from sudokuapp.const.MsgType import MsgType
 from sudokuapp.const.Region import Region
 from sudokuapp.data.Msg import Msg
 from sudokuapp.data.Square import Square
+from sudokuapp.util.CellIndex import CLM_OF, ROW_OF
 from sudokuapp.util.SudokuUtil import SudokuUtil
 
 
@@ -249,6 +250,18 @@ class MsgFactory():
             )
         )
 
+    @classmethod
+    def multiple_solutions(cls) -> Msg:
+        """複数解メッセージ生成
+
+        Returns:
+            Msg: メッセージ
+        """
+        return Msg(
+            MsgType.ERROR,
+            cls._get_msg(MsgCode.MULTIPLE_SOLUTIONS)
+        )
+
     @classmethod
     def fixed_num(
             cls,
@@ -329,11 +342,11 @@ class MsgFactory():
         return Msg(
             MsgType.INFO,
             cls._get_msg(MsgCode.HOW_TO_ELIMIONATION).format(
-                changedSqu=SudokuUtil.cnv_squ_to_text(
-                    how_anlz.changed_squ),
+                changedSqu=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.changed_idx),
                 region=SudokuUtil.cnv_region_to_text(how_anlz.region),
-                triggerSqu=SudokuUtil.cnv_squ_to_text(
-                    how_anlz.trigger_squ_list[0]),
+                triggerSqu=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.trigger_idx_list[0]),
                 removeMemo=how_anlz.remove_memo_list[0]
             )
         )
@@ -354,8 +367,8 @@ class MsgFactory():
         return Msg(
             MsgType.SUCCESS,
             cls._get_msg(MsgCode.HOW_TO_ELIMIONATION_ONE_MEMO).format(
-                changedSqu=SudokuUtil.cnv_squ_to_text(
-                    how_anlz.changed_squ),
+                changedSqu=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.changed_idx),
                 commitVal=how_anlz.commit_val
             )
         )
@@ -376,8 +389,8 @@ class MsgFactory():
         return Msg(
             MsgType.SUCCESS,
             cls._get_msg(MsgCode.HOW_TO_ELIMIONATION_ONLY_MEMO).format(
-                changedSqu=SudokuUtil.cnv_squ_to_text(
-                    how_anlz.changed_squ),
+                changedSqu=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.changed_idx),
                 region=SudokuUtil.cnv_region_to_text(how_anlz.region),
                 commitVal=how_anlz.commit_val
             )
@@ -399,13 +412,42 @@ class MsgFactory():
         return Msg(
             MsgType.INFO,
             cls._get_msg(MsgCode.HOW_TO_LOCKED_CANDIDATES).format(
-                changedSqu=SudokuUtil.cnv_squ_to_text(
-                    how_anlz.changed_squ),
-                triggerSqu=SudokuUtil.cnv_squ_to_text(
-                    how_anlz.trigger_squ_list[0]),
+                changedSqu=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.changed_idx),
+                triggerSqu=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.trigger_idx_list[0]),
+                removeMemo=how_anlz.remove_memo_list[0],
+                regionPos=ROW_OF[how_anlz.trigger_idx_list[0]]
+                if how_anlz.region == Region.ROW
+                else CLM_OF[how_anlz.trigger_idx_list[0]],
+                region=SudokuUtil.cnv_region_to_text(how_anlz.region)
+            )
+        )
+
+    @classmethod
+    def how_to_locked_candidates_claiming(
+        cls,
+        how_anlz: HowToAnalyze
+    ) -> Msg:
+        """ロックされた候補法(行(列) -> エリア)メッセージ生成
+
+        Args:
+            how_anlz (HowToAnalyze): 解析方法
+
+        Returns:
+            Msg: メッセージ
+        """
+        return Msg(
+            MsgType.INFO,
+            cls._get_msg(MsgCode.HOW_TO_LOCKED_CANDIDATES_CLAIMING).format(
+                changedSqu=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.changed_idx),
+                triggerSqu=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.trigger_idx_list[0]),
                 removeMemo=how_anlz.remove_memo_list[0],
-                regionPos=how_anlz.trigger_squ_list[0].row if how_anlz.region == Region.ROW
-                else how_anlz.trigger_squ_list[0].clm,
+                regionPos=ROW_OF[how_anlz.trigger_idx_list[0]]
+                if how_anlz.region == Region.ROW
+                else CLM_OF[how_anlz.trigger_idx_list[0]],
                 region=SudokuUtil.cnv_region_to_text(how_anlz.region)
             )
         )
@@ -429,10 +471,10 @@ class MsgFactory():
         return Msg(
             MsgType.INFO,
             cls._get_msg(MsgCode.HOW_TO_NAKED_PAIR).format(
-                changedSqu=SudokuUtil.cnv_squ_to_text(how_anlz.changed_squ),
+                changedSqu=SudokuUtil.cnv_idx_to_text(how_anlz.changed_idx),
                 region=SudokuUtil.cnv_region_to_text(how_anlz.region),
-                triggerSquList=SudokuUtil.cnv_squ_list_to_text(
-                    how_anlz.trigger_squ_list),
+                triggerSquList=SudokuUtil.cnv_idx_list_to_text(
+                    how_anlz.trigger_idx_list),
                 pairList=SudokuUtil.cnv_memo_list_to_text(pair_list),
                 removeMemo=how_anlz.remove_memo_list[0]
             )
@@ -456,10 +498,10 @@ class MsgFactory():
         return Msg(
             MsgType.INFO,
             cls._get_msg(MsgCode.HOW_TO_HIDDEN_PAIR).format(
-                changedSqu=SudokuUtil.cnv_squ_to_text(how_anlz.changed_squ),
+                changedSqu=SudokuUtil.cnv_idx_to_text(how_anlz.changed_idx),
                 region=SudokuUtil.cnv_region_to_text(how_anlz.region),
-                triggerSquList=SudokuUtil.cnv_squ_list_to_text(
-                    how_anlz.trigger_squ_list),
+                triggerSquList=SudokuUtil.cnv_idx_list_to_text(
+                    how_anlz.trigger_idx_list),
                 pairList=SudokuUtil.cnv_memo_list_to_text(pair_list),
                 removeMemo=how_anlz.remove_memo_list[0]
             )
@@ -483,11 +525,11 @@ class MsgFactory():
 
         # regionPos1、regionPos2を算出
         pos_set: Set[int] = set()
-        for squ in how_anlz.trigger_squ_list:
+        for idx in how_anlz.trigger_idx_list:
             if how_anlz.region == Region.ROW:
-                pos_set.add(squ.row)
+                pos_set.add(ROW_OF[idx])
             else:
-                pos_set.add(squ.clm)
+                pos_set.add(CLM_OF[idx])
 
         pos_list: List[int] = list(pos_set)
         pos_list.sort()
@@ -495,19 +537,118 @@ class MsgFactory():
         return Msg(
             MsgType.INFO,
             cls._get_msg(MsgCode.HOW_TO_X_WING).format(
-                changedSqu=SudokuUtil.cnv_squ_to_text(how_anlz.changed_squ),
+                changedSqu=SudokuUtil.cnv_idx_to_text(how_anlz.changed_idx),
                 removeMemo=how_anlz.remove_memo_list[0],
                 regionPos1=pos_list[0],
                 regionPos2=pos_list[1],
                 region=SudokuUtil.cnv_region_to_text(how_anlz.region),
-                triggerSqu1=SudokuUtil.cnv_squ_to_text(
-                    how_anlz.trigger_squ_list[0]),
-                triggerSqu2=SudokuUtil.cnv_squ_to_text(
-                    how_anlz.trigger_squ_list[1]),
-                triggerSqu3=SudokuUtil.cnv_squ_to_text(
-                    how_anlz.trigger_squ_list[2]),
-                triggerSqu4=SudokuUtil.cnv_squ_to_text(
-                    how_anlz.trigger_squ_list[3])
+                triggerSqu1=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.trigger_idx_list[0]),
+                triggerSqu2=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.trigger_idx_list[1]),
+                triggerSqu3=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.trigger_idx_list[2]),
+                triggerSqu4=SudokuUtil.cnv_idx_to_text(
+                    how_anlz.trigger_idx_list[3])
+            )
+        )
+
+    @classmethod
+    def how_to_fish(
+        cls,
+        how_anlz: HowToAnalyze
+    ) -> Msg:
+        """フィッシュ(ソードフィッシュ法、ジェリーフィッシュ法)メッセージ生成
+
+        Args:
+            how_anlz (HowToAnalyze): 解析方法
+
+        Returns:
+            Msg: メッセージ
+        """
+
+        # 基準の行(列)を算出
+        pos_set: Set[int] = set()
+        for idx in how_anlz.trigger_idx_list:
+            if how_anlz.region == Region.ROW:
+                pos_set.add(ROW_OF[idx])
+            else:
+                pos_set.add(CLM_OF[idx])
+
+        msg_code: MsgCode = MsgCode.HOW_TO_SWORDFISH
+        if how_anlz.method == Method.JELLYFISH:
+            msg_code = MsgCode.HOW_TO_JELLYFISH
+
+        return Msg(
+            MsgType.INFO,
+            cls._get_msg(msg_code).format(
+                changedSqu=SudokuUtil.cnv_idx_to_text(how_anlz.changed_idx),
+                removeMemo=how_anlz.remove_memo_list[0],
+                regionPosList="、".join(
+                    str(pos) for pos in sorted(pos_set)),
+                region=SudokuUtil.cnv_region_to_text(how_anlz.region),
+                triggerSquList=SudokuUtil.cnv_idx_list_to_text(
+                    how_anlz.trigger_idx_list)
+            )
+        )
+
+    @classmethod
+    def how_to_simple_coloring_trap(
+        cls,
+        how_anlz: HowToAnalyze,
+        color_idx_list1: List[int],
+        color_idx_list2: List[int]
+    ) -> Msg:
+        """シンプルカラーリング法(カラートラップ)メッセージ生成
+
+        Args:
+            how_anlz (HowToAnalyze): 解析方法
+            color_idx_list1 (List[int]): 色1の枡番号リスト
+            color_idx_list2 (List[int]): 色2の枡番号リスト
+
+        Returns:
+            Msg: メッセージ
+        """
+
+        return Msg(
+            MsgType.INFO,
+            cls._get_msg(MsgCode.HOW_TO_SIMPLE_COLORING_TRAP).format(
+                changedSqu=SudokuUtil.cnv_idx_to_text(how_anlz.changed_idx),
+                removeMemo=how_anlz.remove_memo_list[0],
+                colorSquList1=SudokuUtil.cnv_idx_list_to_text(
+                    color_idx_list1),
+                colorSquList2=SudokuUtil.cnv_idx_list_to_text(
+                    color_idx_list2)
+            )
+        )
+
+    @classmethod
+    def how_to_simple_coloring_wrap(
+        cls,
+        how_anlz: HowToAnalyze,
+        wrap_idx_list: List[int],
+        other_idx_list: List[int]
+    ) -> Msg:
+        """シンプルカラーリング法(カラーラップ)メッセージ生成
+
+        Args:
+            how_anlz (HowToAnalyze): 解析方法
+            wrap_idx_list (List[int]): 同じ領域に2つある色の枡番号リスト
+            other_idx_list (List[int]): もう一方の色の枡番号リスト
+
+        Returns:
+            Msg: メッセージ
+        """
+
+        return Msg(
+            MsgType.INFO,
+            cls._get_msg(MsgCode.HOW_TO_SIMPLE_COLORING_WRAP).format(
+                changedSqu=SudokuUtil.cnv_idx_to_text(how_anlz.changed_idx),
+                removeMemo=how_anlz.remove_memo_list[0],
+                colorSquList1=SudokuUtil.cnv_idx_list_to_text(
+                    wrap_idx_list),
+                colorSquList2=SudokuUtil.cnv_idx_list_to_text(
+                    other_idx_list)
             )
         )
 
@@ -528,9 +669,9 @@ class MsgFactory():
         return Msg(
             MsgType.INFO,
             cls._get_msg(MsgCode.HOW_TO_XY_CHAIN).format(
-                changedSqu=SudokuUtil.cnv_squ_to_text(how_anlz.changed_squ),
-                chainSquList=SudokuUtil.cnv_squ_list_to_text(
-                    how_anlz.chain_squ_list),
+                changedSqu=SudokuUtil.cnv_idx_to_text(how_anlz.changed_idx),
+                chainSquList=SudokuUtil.cnv_idx_list_to_text(
+                    how_anlz.chain_idx_list),
                 removeMemo=how_anlz.remove_memo_list[0]
             )
         )
@@ -552,9 +693,31 @@ class MsgFactory():
         return Msg(
             MsgType.INFO,
             cls._get_msg(MsgCode.HOW_TO_SIMPLE_CHAIN).format(
-                changedSqu=SudokuUtil.cnv_squ_to_text(how_anlz.changed_squ),
-                chainSquList=SudokuUtil.cnv_squ_list_to_text(
-                    how_anlz.chain_squ_list),
+                changedSqu=SudokuUtil.cnv_idx_to_text(how_anlz.changed_idx),
+                chainSquList=SudokuUtil.cnv_idx_list_to_text(
+                    how_anlz.chain_idx_list),
                 removeMemo=how_anlz.remove_memo_list[0]
             )
         )
+
+    @classmethod
+    def how_to_exact_cover(
+        cls,
+        how_anlz: HowToAnalyze
+    ) -> Msg:
+        """総当たり法メッセージ生成
+
+        Args:
+            how_anlz (HowToAnalyze): 解析方法
+
+        Returns:
+            Msg: メッセージ
+        """
+
+        return Msg(
+            MsgType.SUCCESS,
+            cls._get_msg(MsgCode.HOW_TO_EXACT_COVER).format(
+                changedSqu=SudokuUtil.cnv_idx_to_text(how_anlz.changed_idx),
+                commitVal=how_anlz.commit_val
+            )
+        )
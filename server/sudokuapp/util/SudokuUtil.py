@@ -2,9 +2,9 @@ from typing import List
 
 from sudokuapp.const.Method import Method
 from sudokuapp.const.Region import Region
-from sudokuapp.data.Flame import Flame
 from sudokuapp.data.Square import Square
 from sudokuapp.data.AnalyzeWk import AnalyzeWk
+from sudokuapp.util.CellIndex import CLM_OF, ROW_OF
 
 
 class SudokuUtil(object):
@@ -21,7 +21,31 @@ class SudokuUtil(object):
         Returns:
             str: メッセージ用枡文字列
         """
-        return "行{row}列{clm}".format(row=squ.row, clm=squ.clm)
+        return cls.cnv_idx_to_text(squ.idx)
+
+    @classmethod
+    def cnv_idx_to_text(cls, idx: int) -> str:
+        """枡番号をメッセージ用枡文字列に変換
+
+        Args:
+            idx (int): 枡番号
+
+        Returns:
+            str: メッセージ用枡文字列
+        """
+        return "行{row}列{clm}".format(row=ROW_OF[idx], clm=CLM_OF[idx])
+
+    @classmethod
+    def cnv_idx_list_to_text(cls, idx_list: List[int]) -> str:
+        """枡番号リストをメッセージ用枡文字列に変換
+
+        Args:
+            idx_list (List[int]): 枡番号リスト
+
+        Returns:
+            str: メッセージ用枡リスト文字列
+        """
+        return "、".join(cls.cnv_idx_to_text(idx) for idx in idx_list)
 
     @classmethod
     def cnv_squ_list_to_text(cls, squ_list: List[Square]) -> str:
@@ -84,103 +108,31 @@ class SudokuUtil(object):
         elif method == Method.X_WING:
             return "X-Wing法"
 
+        elif method == Method.SWORDFISH:
+            return "ソードフィッシュ法"
+
+        elif method == Method.JELLYFISH:
+            return "ジェリーフィッシュ法"
+
         elif method == Method.NAKED_PAIR:
             return "ネイキッドペア法"
 
         elif method == Method.HIDDEN_PAIR:
             return "隠れペア法"
 
+        elif method == Method.SIMPLE_COLORING:
+            return "シンプルカラーリング法"
+
         elif method == Method.XY_CHAIN:
             return "XYチェーン法"
 
         elif method == Method.SIMPLE_CHAIN:
             return "シンプルチェーン法"
 
-        raise ValueError("not support method {}".format(method))
-
-    @classmethod
-    def find_fixed_squ_from_flame(cls, flame: Flame) -> List[Square]:
-        """枠から確定枡を検索
-
-        Args:
-            flame (Flame): 枠
+        elif method == Method.EXACT_COVER:
+            return "総当たり法"
 
-        Returns:
-            List[Square]: 確定枡
-        """
-        fixed_list: List[Square] = list()
-        for area in flame.area_list:
-            fixed_list.extend(
-                cls.find_fixed_squ_from_region(area.squ_list))
-
-        return fixed_list
-
-    @classmethod
-    def find_fixed_squ_from_region(
-            cls, squ_list: List[Square]) -> List[Square]:
-        """ある領域の枡から確定枡を検索
-
-        Args:
-            squ_list (List[Square]): ある領域の枡
-
-        Returns:
-            List[Square]: 確定枡
-        """
-        return list(filter(
-            lambda squ: squ.get_fixed_val() is not None,
-            squ_list))
-
-    @classmethod
-    def find_unfixed_squ_from_flame(cls, flame: Flame) -> List[Square]:
-        """枠から未確定枡を検索
-
-        Args:
-            flame (Flame): 枠
-
-        Returns:
-            List[Square]: 未確定枡
-        """
-        commit_list: List[Square] = list()
-        for area in flame.area_list:
-            commit_list.extend(
-                cls.find_unfixed_squ_from_region(area.squ_list))
-
-        return commit_list
-
-    @classmethod
-    def find_unfixed_squ_from_region(
-        cls,
-        squ_list: List[Square]
-    ) -> List[Square]:
-        """ある領域の枡から未確定枡を検索
-
-        Args:
-            squ_list (List[Square]): ある領域の枡
-
-        Returns:
-            List[Square]: 未確定枡
-        """
-        return list(filter(
-            lambda squ: squ.get_fixed_val() is None,
-            squ_list))
-
-    @classmethod
-    def find_squ_include_memo_from_region(
-        cls,
-        squ_list: List[Square],
-        memo: int
-    ) -> List[Square]:
-        """ある領域の枡から指定されたメモを含む枡を検索
-
-        Args:
-            squ_list (List[Square]): ある領域の枡
-
-        Returns:
-            List[Square]: メモを含む枡
-        """
-        return list(filter(
-            lambda squ: squ.get_fixed_val() is None and memo in squ.memo_val_list,
-            squ_list))
+        raise ValueError("not support method {}".format(method))
 
     @classmethod
     def find_cross_squ(